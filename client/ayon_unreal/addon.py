@@ -23,7 +23,7 @@ class UnrealAddon(AYONAddon, IHostAddon):
         # Imports are in this method for Python 2 compatibility of an addon
         from pathlib import Path
 
-        from .lib import get_compatible_integration
+        from .lib import get_integration_plugin_path
 
         from ayon_core.tools.utils import show_message_dialog
 
@@ -42,15 +42,9 @@ class UnrealAddon(AYONAddon, IHostAddon):
             raise ValueError(msg)
 
         ue_version = app.name.replace("-", ".")
-        unreal_plugin_path = os.path.join(
-            UNREAL_ADDON_ROOT, "integration", f"UE_{ue_version}", "Ayon"
-        )
-        if not Path(unreal_plugin_path).exists():
-            if compatible_versions := get_compatible_integration(
-                ue_version, Path(UNREAL_ADDON_ROOT) / "integration"
-            ):
-                unreal_plugin_path = compatible_versions[-1] / "Ayon"
-                unreal_plugin_path = unreal_plugin_path.as_posix()
+        unreal_plugin_path = get_integration_plugin_path(
+            ue_version, Path(UNREAL_ADDON_ROOT) / "integration"
+        ).as_posix()
 
         if not env.get("AYON_UNREAL_PLUGIN"):
             env["AYON_UNREAL_PLUGIN"] = unreal_plugin_path
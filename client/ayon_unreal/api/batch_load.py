@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""Headless batch load of representations into Unreal project.
+
+Runner loads published representations with the same loader plugins as
+the Loader tool, without any user interaction, e.g. to ingest hundreds of
+assets into a project on the farm. It is executed by the editor::
+
+    UnrealEditor-Cmd <project>.uproject -unattended -nosplash
+        -ExecutePythonScript="<addon>/api/batch_load.py <input> <report>"
+
+Paths to input and report files can also be passed with
+`AYON_UNREAL_BATCH_LOAD_INPUT` and `AYON_UNREAL_BATCH_LOAD_REPORT`
+environment variables, AYON context environment must be set in both cases.
+
+Input is a JSON list of representation ids. Items can also be objects
+with `representation_id` and optional `loader` name and loader `options`.
+The editor exits with code 1 when any representation failed to load.
+"""
+import collections
+import json
+import os
+import sys
+import time
+import traceback
+
+import unreal
+
+from ayon_core.pipeline import (
+    get_current_project_name,
+    install_host,
+    registered_host,
+)
+from ayon_core.pipeline.load import (
+    discover_loader_plugins,
+    get_loader_identifier,
+    get_representation_contexts,
+    load_with_repre_context,
+    loaders_from_repre_context,
+)
+from ayon_unreal.api.pipeline import UnrealHost
+
+
+# Representations loaded before garbage is collected
+BATCH_SIZE = 20
+
+
+def _read_input(input_path):
+    """Read batch load requests from input file.
+
+    Returns:
+        list[dict]: Requests with `representation_id`, `loader` and
+            `options`.
+
+    """
+    with open(input_path, "r") as f:
+        items = json.load(f)
+
+    requests = []
+    for item in items:
+        if isinstance(item, str):
+            item = {"representation_id": item}
+        requests.append({
+            "representation_id": item["representation_id"],
+            "loader": item.get("loader"),
+            "options": item.get("options") or {},
+        })
+    return requests
+
+
+def _get_loader(loaders_by_name, repre_context, loader_name=None):
+    """Get loader for representation.
+
+    Explicitly requested loader is used if it is compatible, otherwise the
+    compatible loader with the lowest order is used, as in Loader tool.
+
+    Returns:
+        Union[type, None]: Loader plugin or None if none is compatible.
+
+    """
+    loaders = loaders_from_repre_context(
+        list(loaders_by_name.values()), repre_context)
+    if loader_name:
+        loaders = [
+            loader for loader in loaders
+            if get_loader_identifier(loader) == loader_name
+        ]
+    if not loaders:
+        return None
+    return sorted(
+        loaders,
+        key=lambda loader: (loader.order, get_loader_identifier(loader))
+    )[0]
+
+
+def _load_batch(loader, requests, repre_contexts, report):
+    for request in requests:
+        repre_id = request["representation_id"]
+        start = time.time()
+        try:
+            result = load_with_repre_context(
+                loader,
+                repre_contexts[repre_id],
+                options=request["options"]
+            )
+        except Exception as e:
+            unreal.log_error(
+                f"Failed to load {repre_id} with "
+                f"{get_loader_identifier(loader)}: {e}")
+            report["failed"].append({
+                "representation_id": repre_id,
+                "loader": get_loader_identifier(loader),
+                "error": str(e),
+                "traceback": traceback.format_exc(),
+            })
+            continue
+
+        if not isinstance(result, (list, tuple)):
+            result = [result] if result else []
+        report["loaded"].append({
+            "representation_id": repre_id,
+            "loader": get_loader_identifier(loader),
+            "assets": [str(asset) for asset in result],
+            "duration": time.time() - start,
+        })
+
+
+def batch_load(requests, batch_size=BATCH_SIZE):
+    """Load representations with loader plugins and save once.
+
+    Requests are grouped by loader, so every loader is used for all its
+    representations in a row, and loaded in batches with garbage
+    collected in between. Dirty packages are saved once at the end.
+
+    Args:
+        requests (list[dict]): Requests with `representation_id`, `loader`
+            and `options`, see `_read_input`.
+        batch_size (int, optional): Representations loaded before garbage
+            is collected.
+
+    Returns:
+        dict: Report with `loaded` and `failed` representations.
+
+    """
+    started = time.time()
+    project_name = get_current_project_name()
+    report = {
+        "project_name": project_name,
+        "started": started,
+        "loaded": [],
+        "failed": [],
+        "saved": False,
+    }
+
+    repre_ids = {request["representation_id"] for request in requests}
+    repre_contexts = get_representation_contexts(project_name, repre_ids)
+    loaders_by_name = {
+        get_loader_identifier(loader): loader
+        for loader in discover_loader_plugins(project_name)
+    }
+
+    requests_by_loader = collections.defaultdict(list)
+    for request in requests:
+        repre_id = request["representation_id"]
+        repre_context = repre_contexts.get(repre_id)
+        if not repre_context:
+            report["failed"].append({
+                "representation_id": repre_id,
+                "error": "Representation not found",
+            })
+            continue
+
+        loader = _get_loader(
+            loaders_by_name, repre_context, request["loader"])
+        if loader is None:
+            report["failed"].append({
+                "representation_id": repre_id,
+                "error": "No compatible loader found",
+            })
+            continue
+        requests_by_loader[loader].append(request)
+
+    with unreal.ScopedSlowTask(len(requests), "Loading representations") \
+            as slow_task:
+        for loader, loader_requests in requests_by_loader.items():
+            for idx in range(0, len(loader_requests), batch_size):
+                batch = loader_requests[idx:idx + batch_size]
+                slow_task.enter_progress_frame(
+                    len(batch),
+                    f"Loading {len(batch)} representations with "
+                    f"{get_loader_identifier(loader)}")
+                _load_batch(loader, batch, repre_contexts, report)
+                unreal.SystemLibrary.collect_garbage()
+
+    report["saved"] = unreal.EditorLoadingAndSavingUtils.save_dirty_packages(
+        save_map_packages=True, save_content_packages=True)
+    report["duration"] = time.time() - started
+    return report
+
+
+def main(argv=None):
+    """Run batch load with paths from arguments or environment."""
+    argv = sys.argv[1:] if argv is None else argv
+    input_path = (
+        argv[0] if argv else os.getenv("AYON_UNREAL_BATCH_LOAD_INPUT"))
+    report_path = (
+        argv[1] if len(argv) > 1
+        else os.getenv("AYON_UNREAL_BATCH_LOAD_REPORT")
+    )
+    if not input_path:
+        raise ValueError("Path to batch load input is not set!")
+    if not report_path:
+        report_path = f"{os.path.splitext(input_path)[0]}_report.json"
+
+    if registered_host() is None:
+        install_host(UnrealHost())
+
+    report = batch_load(_read_input(input_path))
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=4)
+
+    unreal.log(
+        f"Batch load finished in {report['duration']:.1f}s, "
+        f"loaded {len(report['loaded'])}, failed {len(report['failed'])}. "
+        f"Report: {report_path}")
+    return report
+
+
+if __name__ == "__main__":
+    exit_code = 1
+    try:
+        exit_code = 1 if main()["failed"] else 0
+    except Exception:
+        unreal.log_error(traceback.format_exc())
+
+    if exit_code:
+        # Quitting the editor always exits with 0, the process is ended
+        # directly so failure is visible to the caller. Loaded packages
+        # and the report are already saved.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+    unreal.SystemLibrary.quit_editor()
@@ -16,6 +16,7 @@ from ayon_core.tools.utils import SimpleFoldersWidget
 
 from ayon_unreal.api.pipeline import (
     generate_sequence,
+    get_asset_class_name,
     set_sequence_hierarchy,
 )
 
@@ -218,9 +219,10 @@ def find_level_sequence(asset_content):
     has_level_sequence = []
     ar = unreal.AssetRegistryHelpers.get_asset_registry()
     for asset in asset_content:
-        content = ar.get_asset_by_object_path(asset).get_asset()
-        if content.get_class().get_name() == "LevelSequence":
-            has_level_sequence.append(content)
+        asset_data = ar.get_asset_by_object_path(asset)
+        # Only level sequences are loaded
+        if get_asset_class_name(asset_data) == "LevelSequence":
+            has_level_sequence.append(asset_data.get_asset())
     return has_level_sequence
 
 
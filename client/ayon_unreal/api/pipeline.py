@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 import json
+import hashlib
 import clique
 import logging
 from typing import List, Any
@@ -183,7 +184,13 @@ def ls():
         yield cast_map_to_str_dict(data)
 
 
-def ls_inst():
+def get_publish_instances_asset_data():
+    """Get asset data of all publish instances without loading them.
+
+    Returns:
+        list[unreal.AssetData]: Asset data of `AyonPublishInstance` assets.
+
+    """
     ar = unreal.AssetRegistryHelpers.get_asset_registry()
     # UE 5.1 changed how class name is specified
     class_name = [
@@ -193,7 +200,11 @@ def ls_inst():
             UNREAL_VERSION.major == 5
             and UNREAL_VERSION.minor > 0
     ) else "AyonPublishInstance"  # noqa
-    instances = ar.get_assets_by_class(class_name, True)
+    return ar.get_assets_by_class(class_name, True)
+
+
+def ls_inst():
+    instances = get_publish_instances_asset_data()
 
     # get_asset_by_class returns AssetData. To get all metadata we need to
     # load asset. get_tag_values() work only on metadata registered in
@@ -788,6 +799,175 @@ def delete_asset_if_unused(container, asset_content):
     unreal.EditorAssetLibrary.delete_directory(container["namespace"])
 
 
+def _get_hard_dependency_options():
+    return unreal.AssetRegistryDependencyOptions(
+        include_soft_package_references=False,
+        include_hard_package_references=True,
+        include_searchable_names=False,
+        include_soft_management_references=False,
+        include_hard_management_references=False
+    )
+
+
+def get_asset_class_name(asset_data):
+    """Get class name of asset from its asset data without loading it.
+
+    Args:
+        asset_data (unreal.AssetData): Asset data from asset registry.
+
+    Returns:
+        str: Class name, e.g. "StaticMesh" or "LevelSequence".
+
+    """
+    # UE 5 replaced asset class name with class path
+    if UNREAL_VERSION.major == 5:
+        return str(asset_data.asset_class_path.asset_name)
+    return str(asset_data.asset_class)
+
+
+def get_package_file_path(package_name):
+    """Get path of package file in project content without loading it.
+
+    Args:
+        package_name (str): Package name starting with `/Game/`.
+
+    Returns:
+        Optional[str]: Path to `.uasset` or `.umap` file or None if the
+            package is not in project content or not saved.
+
+    """
+    package_name = str(package_name)
+    if not package_name.startswith("/Game/"):
+        return None
+    content_dir = unreal.Paths.convert_relative_path_to_full(
+        unreal.Paths.project_content_dir())
+    relative_path = package_name[len("/Game/"):]
+    for ext in (".uasset", ".umap"):
+        path = os.path.join(content_dir, relative_path + ext)
+        if os.path.isfile(path):
+            return os.path.normpath(path)
+    return None
+
+
+def get_asset_data_snapshot(object_paths, snapshot=None):
+    """Get asset registry data of assets without loading them.
+
+    Args:
+        object_paths (Iterable[str]): Object paths of assets.
+        snapshot (Optional[dict[str, dict]]): Already collected data,
+            registry is queried only for assets missing in it.
+
+    Returns:
+        dict[str, dict]: Data by object path with keys `asset_name`,
+            `asset_class`, `package_name`, `package_path`, `dependencies`
+            (hard `/Game` dependencies) and `system_path`.
+
+    """
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    options = _get_hard_dependency_options()
+
+    snapshot = snapshot or {}
+    result = {}
+    for object_path in object_paths:
+        if object_path in result:
+            continue
+        if object_path in snapshot:
+            result[object_path] = snapshot[object_path]
+            continue
+        asset_data = ar.get_asset_by_object_path(object_path)
+        if not asset_data.is_valid():
+            continue
+        package_name = str(asset_data.package_name)
+        dependencies = ar.get_dependencies(package_name, options) or []
+        result[object_path] = {
+            "asset_name": str(asset_data.asset_name),
+            "asset_class": get_asset_class_name(asset_data),
+            "package_name": package_name,
+            "package_path": str(asset_data.package_path),
+            "dependencies": [
+                str(dep) for dep in dependencies
+                if str(dep).startswith("/Game/")
+            ],
+            "system_path": get_package_file_path(package_name),
+        }
+    return result
+
+
+def get_members_hash(members):
+    """Get hash of member paths independent of their order.
+
+    Args:
+        members (Iterable[str]): Object paths of members.
+
+    Returns:
+        str: Hex digest of sorted member paths.
+
+    """
+    return hashlib.sha1(
+        "\n".join(sorted(set(members))).encode("utf-8")).hexdigest()
+
+
+def get_assets_by_object_paths(object_paths):
+    """Get asset data of objects with single asset registry query.
+
+    Only packages of the objects are queried, not whole folders.
+
+    Args:
+        object_paths (Iterable[str]): Object paths of assets.
+
+    Returns:
+        dict[str, unreal.AssetData]: Asset data by object path. Paths not
+            found in asset registry are not included.
+
+    """
+    object_paths = set(object_paths)
+    if not object_paths:
+        return {}
+    package_names = {
+        object_path.split(".", 1)[0] for object_path in object_paths
+    }
+
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    assets = ar.get_assets(
+        unreal.ARFilter(package_names=sorted(package_names)))
+    result = {}
+    for asset_data in assets:
+        object_path = f"{asset_data.package_name}.{asset_data.asset_name}"
+        if object_path in object_paths:
+            result[object_path] = asset_data
+    return result
+
+
+def get_dependency_closure(package_names, root="/Game/"):
+    """Get transitive hard dependencies of packages.
+
+    Args:
+        package_names (Iterable[str]): Package names to start from.
+        root (str): Only dependencies with this prefix are followed.
+
+    Returns:
+        list[str]: Sorted package names of given packages and all their
+            dependencies under the root.
+
+    """
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    options = _get_hard_dependency_options()
+
+    closure = set()
+    to_visit = [str(name) for name in package_names]
+    while to_visit:
+        package_name = to_visit.pop()
+        if package_name in closure:
+            continue
+        closure.add(package_name)
+        for dep in ar.get_dependencies(package_name, options) or []:
+            dep = str(dep)
+            if dep.startswith(root) and dep not in closure:
+                to_visit.append(dep)
+
+    return sorted(closure)
+
+
 @contextmanager
 def maintained_selection():
     """Stub to be either implemented or replaced.
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 import ast
 import collections
+import copy
+import os
 import sys
 import six
+from types import MappingProxyType
 from abc import (
     ABC,
     ABCMeta,
@@ -11,9 +14,13 @@ from abc import (
 import unreal
 
 from .pipeline import (
+    cast_map_to_str_dict,
     create_publish_instance,
+    get_assets_by_object_paths,
+    get_members_hash,
+    get_package_file_path,
+    get_publish_instances_asset_data,
     imprint,
-    ls_inst,
     UNREAL_VERSION
 )
 from ayon_core.lib import (
@@ -29,10 +36,81 @@ from ayon_core.pipeline import (
 )
 
 
+# Parsed publish instances by object path with modification time of their
+# package. Kept between publisher resets, only instances changed on disk
+# are loaded and parsed again.
+_parsed_instances_cache = {}
+
+
+def _get_package_mtime(package_name):
+    path = get_package_file_path(package_name)
+    if not path:
+        return None
+    return os.path.getmtime(path)
+
+
+def _parse_instance_data(data):
+    """Convert metadata of publish instance to frozen instance data.
+
+    Unreal saves metadata as strings, values of instances created by
+    creators are converted back. Legacy instances are kept as they are.
+    """
+    data = dict(data)
+    if data.get("creator_identifier"):
+        for key, default in (
+            ("creator_attributes", "{}"),
+            ("publish_attributes", "{}"),
+            ("members", "[]"),
+            ("families", "[]"),
+            ("active", "True"),
+        ):
+            data[key] = ast.literal_eval(data.get(key) or default)
+    return MappingProxyType(data)
+
+
+def get_parsed_instances():
+    """Get parsed data of all publish instances in the project.
+
+    Only instances whose package changed since the previous call are
+    loaded and parsed, data of removed instances are dropped.
+
+    Returns:
+        list[MappingProxyType]: Read-only data of publish instances.
+    """
+    found = set()
+    for asset_data in get_publish_instances_asset_data():
+        package_name = str(asset_data.package_name)
+        object_path = f"{package_name}.{asset_data.asset_name}"
+        found.add(object_path)
+
+        mtime = _get_package_mtime(package_name)
+        cached = _parsed_instances_cache.get(object_path)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            continue
+
+        asset = asset_data.get_asset()
+        data = unreal.EditorAssetLibrary.get_metadata_tag_values(asset)
+        data = cast_map_to_str_dict(data)
+        data["objectName"] = str(asset_data.asset_name)
+        _parsed_instances_cache[object_path] = (
+            mtime, _parse_instance_data(data))
+
+    for object_path in set(_parsed_instances_cache) - found:
+        del _parsed_instances_cache[object_path]
+
+    return [
+        _parsed_instances_cache[object_path][1]
+        for object_path in sorted(found)
+    ]
+
+
 class UnrealCreateLogic():
     """Universal class for logic that Unreal creators could inherit from."""
     root = "/Game/Ayon/AyonPublishInstances"
     suffix = "_INS"
+    # Members are collected from the publish instance asset by
+    # CollectInstanceMembers and not stored in instance data
+    collect_members = False
 
 
     @staticmethod
@@ -41,7 +119,8 @@ class UnrealCreateLogic():
 
         Create `unreal_cached_subsets` key when needed in shared data and
         fill it with all collected instances from the scene under its
-        respective creator identifiers.
+        respective creator identifiers. Instances are parsed and read-only,
+        they are shared by all creators and publisher resets.
 
         If legacy instances are detected in the scene, create
         `unreal_cached_legacy_subsets` there and fill it with
@@ -57,7 +136,7 @@ class UnrealCreateLogic():
         if shared_data.get("unreal_cached_subsets") is None:
             unreal_cached_subsets = collections.defaultdict(list)
             unreal_cached_legacy_subsets = collections.defaultdict(list)
-            for instance in ls_inst():
+            for instance in get_parsed_instances():
                 creator_id = instance.get("creator_identifier")
                 if creator_id:
                     unreal_cached_subsets[creator_id].append(instance)
@@ -76,18 +155,9 @@ class UnrealCreateLogic():
         self.get_cached_instances(self.collection_shared_data)
         for instance in self.collection_shared_data[
                 "unreal_cached_subsets"].get(self.identifier, []):
-            # Unreal saves metadata as string, so we need to convert it back
-            instance['creator_attributes'] = ast.literal_eval(
-                instance.get('creator_attributes', '{}'))
-            instance['publish_attributes'] = ast.literal_eval(
-                instance.get('publish_attributes', '{}'))
-            instance['members'] = ast.literal_eval(
-                instance.get('members', '[]'))
-            instance['families'] = ast.literal_eval(
-                instance.get('families', '[]'))
-            instance['active'] = ast.literal_eval(
-                instance.get('active', ''))
-            created_instance = CreatedInstance.from_existing(instance, self)
+            # Cached data are shared, instance gets its own copy
+            created_instance = CreatedInstance.from_existing(
+                copy.deepcopy(dict(instance)), self)
             self._add_instance_to_context(created_instance)
 
     def _default_update_instances(self, update_list):
@@ -119,6 +189,15 @@ class UnrealCreateLogic():
 
     def create_unreal(self, product_name, instance_data, pre_create_data):
         try:
+            # Members are resolved first, so no instance is created when
+            # some of them are missing.
+            members = pre_create_data.get("members", [])
+            assets_by_path = get_assets_by_object_paths(members)
+            missing = set(members) - set(assets_by_path)
+            if missing:
+                raise CreatorError(
+                    f"Assets not found: {', '.join(sorted(missing))}")
+
             instance_name = f"{product_name}{self.suffix}"
             pub_instance = create_publish_instance(instance_name, self.root)
 
@@ -135,14 +214,20 @@ class UnrealCreateLogic():
             pub_instance.set_editor_property('add_external_assets', True)
             assets = pub_instance.get_editor_property('asset_data_external')
 
-            ar = unreal.AssetRegistryHelpers.get_asset_registry()
+            # Publish instance holds object references, so the members are
+            # loaded once here.
+            for asset_data in assets_by_path.values():
+                assets.add(asset_data.get_asset())
 
-            for member in pre_create_data.get("members", []):
-                obj = ar.get_asset_by_object_path(member).get_asset()
-                assets.add(obj)
+            data = instance.data_to_store()
+            if members and self.collect_members:
+                # Members are held by the publish instance asset and
+                # collected from it, only their hash is stored to detect
+                # changes.
+                data.pop("members", None)
+                data["members_hash"] = get_members_hash(members)
 
-            imprint(f"{self.root}/{instance_name}",
-                    instance.data_to_store())
+            imprint(f"{self.root}/{instance_name}", data)
 
             return instance
 
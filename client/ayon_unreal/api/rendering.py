@@ -1,4 +1,11 @@
+import atexit
+import json
 import os
+import re
+import shutil
+import subprocess
+import time
+from pathlib import Path
 
 import unreal
 
@@ -6,10 +13,16 @@ from ayon_core.settings import get_project_settings
 from ayon_core.pipeline import Anatomy
 from ayon_unreal.api import pipeline
 from ayon_core.tools.utils import show_message_dialog
+from ayon_unreal.lib import get_editor_exe_path
 
 
 queue = None
 executor = None
+telemetry = None
+
+# Render configs prepared for jobs cached by config path, render format
+# and resolution.
+_prepared_render_configs = {}
 
 SUPPORTED_EXTENSION_MAP = {
     "png": unreal.MoviePipelineImageSequenceOutput_PNG,
@@ -18,15 +31,36 @@ SUPPORTED_EXTENSION_MAP = {
     "bmp": unreal.MoviePipelineImageSequenceOutput_BMP,
 }
 
+# Extensions written by Movie Render Queue for given render format and
+# signatures of the file header used to check rendered frames are valid.
+RENDERED_FILE_EXTENSIONS = {
+    "png": ("png",),
+    "exr": ("exr",),
+    "jpg": ("jpeg", "jpg"),
+    "bmp": ("bmp",),
+}
+RENDERED_FILE_SIGNATURES = {
+    "png": b"\x89PNG\r\n\x1a\n",
+    "exr": b"\x76\x2f\x31\x01",
+    "jpg": b"\xff\xd8\xff",
+    "jpeg": b"\xff\xd8\xff",
+    "bmp": b"BM",
+}
+
 
 def _queue_finish_callback(exec, success):
     unreal.log("Render completed. Success: " + str(success))
 
+    global telemetry
+    if telemetry:
+        telemetry.queue_finished(success)
+
     # Delete our reference so we don't keep it alive.
     global executor
     global queue
-    del executor
-    del queue
+    executor = None
+    queue = None
+    telemetry = None
 
 
 def _job_finish_callback(job, success):
@@ -35,6 +69,653 @@ def _job_finish_callback(job, success):
     # edits in OnQueueFinishedCallback if you don't want to leak state changes
     # into the editor world.
     unreal.log("Individual job completed.")
+    if telemetry:
+        telemetry.job_finished(job, success)
+
+
+def split_frame_range(frame_start, frame_end, chunk_size):
+    """Split frame range into chunks of given size.
+
+    Frame ranges follow Movie Render Queue convention where the end frame
+    is exclusive.
+
+    Args:
+        frame_start (int): First frame of the range.
+        frame_end (int): End frame of the range (exclusive).
+        chunk_size (int): Number of frames in each chunk. When it is not
+            a positive number, the whole range is returned as single chunk.
+
+    Returns:
+        list[tuple[int, int]]: List of (start, end) tuples.
+
+    Example:
+        >>> split_frame_range(1001, 1011, 4)
+        [(1001, 1005), (1005, 1009), (1009, 1011)]
+
+    """
+    frame_start = int(frame_start)
+    frame_end = int(frame_end)
+    if not chunk_size or chunk_size <= 0:
+        return [(frame_start, frame_end)]
+
+    return [
+        (start, min(start + chunk_size, frame_end))
+        for start in range(frame_start, frame_end, chunk_size)
+    ]
+
+
+class LocalRenderProcessPool(object):
+    """Render queue jobs in parallel headless editor processes.
+
+    Each job of the queue is saved into its own queue manifest and rendered
+    by a child editor process the same way `MoviePipelineNewProcessExecutor`
+    does it. At most `max_workers` processes run at the same time. The pool
+    is polled from Slate tick so the editor stays responsive and completion
+    is reported back through the same callbacks as the in-editor executor
+    uses.
+
+    Progress is merged from frames written by all processes into output
+    directories of the jobs and passed to `progress_callback`. Rendering can
+    be cancelled with `cancel`, child processes are also terminated when
+    the editor exits. Manifests are removed when their job finishes.
+
+    Args:
+        queue (unreal.MoviePipelineQueue): Queue with jobs to render.
+        max_workers (int): Maximum number of concurrent processes.
+        render_format (str): Rendered image format.
+        progress_callback (Optional[Callable[[int, int, str, bool], None]]):
+            Called with rendered and total frame count, status message
+            and whether rendering ended on each poll.
+
+    """
+
+    poll_interval = 1.0
+    # Seconds to wait for process to terminate before it is killed
+    terminate_timeout = 10.0
+
+    def __init__(self, queue, max_workers, render_format="png",
+                 progress_callback=None):
+        self._queue = queue
+        self._max_workers = max(1, int(max_workers))
+        self._render_format = render_format
+        self._progress_callback = progress_callback
+        self._pending = []
+        self._running = []
+        self._finished = []
+        self._manifests = {}
+        self._job_outputs = {}
+        self._frames_done = {}
+        self._tick_handle = None
+        self._time_since_poll = 0.0
+        self._total = 0
+        self._frames_total = 0
+        self._cancelled = False
+
+    @staticmethod
+    def _get_editor_exe():
+        engine_dir = unreal.Paths.convert_relative_path_to_full(
+            unreal.Paths.engine_dir())
+        engine_path = Path(engine_dir).parent
+        engine_version = unreal.SystemLibrary.get_engine_version()
+        return get_editor_exe_path(engine_path, engine_version)
+
+    def _save_job_manifest(self, job, index):
+        """Save single job queue manifest and return its absolute path.
+
+        Manifest is always saved to the same file by Unreal, so it is
+        renamed to be unique for the job.
+        """
+        job_queue = unreal.MoviePipelineQueue()
+        job_queue.duplicate_job(job)
+        _, manifest_path = (
+            unreal.MoviePipelineEditorLibrary.save_queue_to_manifest_file(
+                job_queue))
+
+        manifest = Path(manifest_path)
+        if not manifest.is_absolute():
+            saved_dir = unreal.Paths.convert_relative_path_to_full(
+                unreal.Paths.project_saved_dir())
+            manifest = Path(saved_dir) / manifest
+        job_manifest = manifest.with_name(
+            f"{manifest.stem}_{index}{manifest.suffix}")
+        shutil.move(manifest.as_posix(), job_manifest.as_posix())
+
+        return job_manifest.resolve().as_posix()
+
+    @staticmethod
+    def _get_job_output(job):
+        """Get output directory, file prefix and frame range of job."""
+        settings = job.get_configuration().find_or_add_setting_by_class(
+            unreal.MoviePipelineOutputSetting)
+        return {
+            "output_dir": settings.output_directory.path,
+            "file_prefix": settings.file_name_format.replace(
+                ".{frame_number}", ""),
+            "frame_range": (
+                settings.custom_start_frame, settings.custom_end_frame),
+            "resolution": (
+                settings.output_resolution.x, settings.output_resolution.y),
+        }
+
+    def execute(self):
+        """Prepare job manifests and start rendering."""
+        # Child processes load the project from disk, so everything
+        # has to be saved first.
+        unreal.EditorLoadingAndSavingUtils.save_dirty_packages(True, True)
+
+        editor_exe = self._get_editor_exe()
+        project_file = unreal.Paths.convert_relative_path_to_full(
+            unreal.Paths.get_project_file_path())
+
+        try:
+            for index, job in enumerate(self._queue.get_jobs()):
+                job_output = self._get_job_output(job)
+                manifest_path = self._save_job_manifest(job, index)
+                self._manifests[job.user_data] = manifest_path
+                self._job_outputs[job.user_data] = job_output
+                res_x, res_y = job_output["resolution"]
+                cmd = [
+                    editor_exe.as_posix(),
+                    project_file,
+                    job.map.export_text().split(".")[0],
+                    "-game",
+                    f"-MoviePipelineConfig={manifest_path}",
+                    "-Multiprocess",
+                    "-NoLoadingScreen",
+                    "-FixedSeed",
+                    "-Unattended",
+                    "-NoSplash",
+                    "-nohmd",
+                    "-windowed",
+                    f"-ResX={res_x}",
+                    f"-ResY={res_y}",
+                    f"-log=AyonRender_{index}.log",
+                ]
+                self._pending.append((job, cmd))
+        except Exception:
+            self._remove_manifests()
+            raise
+
+        self._total = len(self._pending)
+        self._frames_total = sum(
+            end - start
+            for start, end in (
+                output["frame_range"]
+                for output in self._job_outputs.values()
+            )
+        )
+        unreal.log(
+            f"Rendering {self._total} jobs in up to "
+            f"{self._max_workers} parallel processes.")
+
+        atexit.register(self._terminate_processes)
+        self._tick_handle = unreal.register_slate_post_tick_callback(
+            self._on_tick)
+
+    def cancel(self):
+        """Stop rendering, terminate running processes and clean up."""
+        if self._tick_handle is None:
+            return
+        unreal.log_warning("Cancelling render processes.")
+        self._cancelled = True
+        for job, _ in self._pending:
+            self._finished.append((job, False))
+            _job_finish_callback(job, False)
+        self._pending = []
+        self._terminate_processes()
+        for job, _, _ in self._running:
+            self._finished.append((job, False))
+            _job_finish_callback(job, False)
+        self._running = []
+        self._finish()
+
+    def _terminate_processes(self):
+        for _, process, _ in self._running:
+            if process.poll() is None:
+                process.terminate()
+        for _, process, _ in self._running:
+            try:
+                process.wait(self.terminate_timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def _remove_manifests(self, job_ids=None):
+        if job_ids is None:
+            job_ids = list(self._manifests)
+        for job_id in job_ids:
+            manifest_path = self._manifests.pop(job_id, None)
+            if not manifest_path:
+                continue
+            try:
+                os.remove(manifest_path)
+            except OSError:
+                pass
+
+    def _start_pending(self):
+        while self._pending and len(self._running) < self._max_workers:
+            job, cmd = self._pending.pop(0)
+            unreal.log(f"Starting render process: {' '.join(cmd)}")
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL)
+            if telemetry:
+                telemetry.job_started(job)
+            self._running.append((job, process, time.time()))
+
+    def _update_progress(self):
+        """Count frames written by running processes and report them."""
+        for job, _, start in self._running:
+            output = self._job_outputs[job.user_data]
+            self._frames_done[job.user_data] = len(get_rendered_frame_mtimes(
+                output["output_dir"],
+                output["file_prefix"],
+                self._render_format,
+                output["frame_range"],
+                since=start,
+            ))
+        frames_done = sum(self._frames_done.values())
+        message = (
+            f"Rendered {frames_done}/{self._frames_total} frames, "
+            f"{len(self._finished)}/{self._total} jobs finished.")
+        unreal.log(f"Render progress: {message}")
+        if self._progress_callback:
+            self._progress_callback(
+                frames_done, self._frames_total, message, False)
+
+    def _on_tick(self, delta_seconds):
+        self._time_since_poll += delta_seconds
+        if self._time_since_poll < self.poll_interval:
+            return
+        self._time_since_poll = 0.0
+
+        self._update_progress()
+        still_running = []
+        for job, process, start in self._running:
+            return_code = process.poll()
+            if return_code is None:
+                still_running.append((job, process, start))
+                continue
+
+            success = return_code == 0
+            self._finished.append((job, success))
+            self._remove_manifests([job.user_data])
+            if success:
+                output = self._job_outputs[job.user_data]
+                start_frame, end_frame = output["frame_range"]
+                self._frames_done[job.user_data] = end_frame - start_frame
+            else:
+                unreal.log_error(
+                    f"Render process for {job.job_name} failed "
+                    f"with return code {return_code}")
+            _job_finish_callback(job, success)
+        self._running = still_running
+
+        self._start_pending()
+
+        if not self._pending and not self._running:
+            self._update_progress()
+            self._finish()
+
+    def _finish(self):
+        unreal.unregister_slate_post_tick_callback(self._tick_handle)
+        self._tick_handle = None
+        atexit.unregister(self._terminate_processes)
+        self._remove_manifests()
+        if self._progress_callback:
+            message = "Rendering finished."
+            if self._cancelled:
+                message = "Rendering cancelled."
+            # Cancelled rendering reports only frames actually rendered
+            self._progress_callback(
+                sum(self._frames_done.values()), self._frames_total,
+                message, True)
+        _queue_finish_callback(
+            self,
+            not self._cancelled
+            and all(success for _, success in self._finished)
+        )
+
+
+def cancel_rendering():
+    """Cancel local rendering started by `start_rendering`."""
+    if executor is None:
+        return
+    if isinstance(executor, LocalRenderProcessPool):
+        executor.cancel()
+    else:
+        executor.cancel_all_jobs()
+
+
+def _is_valid_frame_file(entry, ext):
+    """Check rendered frame is not empty and has readable header.
+
+    Args:
+        entry (os.DirEntry): Directory entry of rendered frame.
+        ext (str): File extension.
+
+    Returns:
+        bool: True if file looks like complete image of given format.
+
+    """
+    try:
+        if entry.stat().st_size == 0:
+            return False
+        signature = RENDERED_FILE_SIGNATURES.get(ext.lower())
+        if not signature:
+            return True
+        with open(entry.path, "rb") as f:
+            return f.read(len(signature)) == signature
+    except OSError:
+        return False
+
+
+def _get_frame_file_pattern(file_prefix, render_format):
+    """Get compiled regex matching rendered frames of given format."""
+    extensions = RENDERED_FILE_EXTENSIONS.get(
+        render_format.lower(), (render_format.lower(),))
+    return re.compile(
+        r"^{}\.(?P<frame>-?\d+)\.(?P<ext>{})$".format(
+            re.escape(file_prefix), "|".join(extensions)),
+        re.IGNORECASE)
+
+
+def get_rendered_frame_mtimes(output_dir, file_prefix, render_format,
+                              frame_range, since=None):
+    """Get modification times of frames rendered in directory.
+
+    Args:
+        output_dir (str): Render output directory.
+        file_prefix (str): File name before frame number.
+        render_format (str): "png"|"jpg"|"exr"|"bmp"
+        frame_range (tuple[int, int]): Frame range, end exclusive.
+        since (Optional[float]): Skip frames modified before this time,
+            e.g. frames of previous renders.
+
+    Returns:
+        list[float]: Modification times of rendered frames.
+
+    """
+    pattern = _get_frame_file_pattern(file_prefix, render_format)
+    frame_start, frame_end = frame_range
+    mtimes = []
+    if not os.path.isdir(output_dir):
+        return mtimes
+
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            match = pattern.match(entry.name)
+            if not match:
+                continue
+            if not frame_start <= int(match.group("frame")) < frame_end:
+                continue
+            mtime = entry.stat().st_mtime
+            if since is None or mtime >= since:
+                mtimes.append(mtime)
+    return mtimes
+
+
+def get_valid_rendered_frames(output_dir, file_prefix, render_format):
+    """Get frame numbers of valid frames already rendered in directory.
+
+    Directory is scanned only once. Only files matching
+    `{file_prefix}.{frame}.{ext}` are considered.
+
+    Args:
+        output_dir (str): Render output directory.
+        file_prefix (str): File name before frame number.
+        render_format (str): "png"|"jpg"|"exr"|"bmp"
+
+    Returns:
+        set[int]: Frame numbers of valid rendered frames.
+
+    """
+    pattern = _get_frame_file_pattern(file_prefix, render_format)
+
+    frames = set()
+    if not os.path.isdir(output_dir):
+        return frames
+
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            match = pattern.match(entry.name)
+            if not match or not entry.is_file():
+                continue
+            if _is_valid_frame_file(entry, match.group("ext")):
+                frames.add(int(match.group("frame")))
+
+    return frames
+
+
+def get_frame_index(output_dir, file_prefix, render_format):
+    """Collect rendered frames in directory into compact frame index.
+
+    Directory is scanned only once with `os.scandir`. Only files matching
+    `{file_prefix}.{frame}.{ext}` with extension of the render format are
+    considered.
+
+    Args:
+        output_dir (str): Render output directory.
+        file_prefix (str): File name before frame number.
+        render_format (str): "png"|"jpg"|"exr"|"bmp"
+
+    Returns:
+        Optional[dict]: Frame index with keys:
+            "files" (list[str]): file names sorted by frame,
+            "frames" (list[int]): sorted frame numbers,
+            "padding" (Optional[int]): frame number padding, None if
+                files don't use the same padding,
+            "pattern" (str): printf style file name pattern,
+            "ext" (str): file extension.
+            None is returned when no frame was found.
+
+    """
+    pattern = _get_frame_file_pattern(file_prefix, render_format)
+
+    found = []
+    if os.path.isdir(output_dir):
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match and entry.is_file():
+                    found.append((
+                        int(match.group("frame")),
+                        match.group("frame"),
+                        match.group("ext"),
+                        entry.name))
+
+    if not found:
+        return None
+
+    found.sort()
+    frame_strings = [frame_str.lstrip("-") for _, frame_str, _, _ in found]
+    padding = min(len(frame_str) for frame_str in frame_strings)
+    if any(
+        frame_str != str(abs(frame)).zfill(padding)
+        for frame_str, (frame, _, _, _) in zip(frame_strings, found)
+    ):
+        padding = None
+
+    ext = found[0][2]
+    return {
+        "files": [name for _, _, _, name in found],
+        "frames": [frame for frame, _, _, _ in found],
+        "padding": padding,
+        "pattern": f"{file_prefix}.%0{padding or 1}d.{ext}",
+        "ext": ext,
+    }
+
+
+def get_missing_frame_ranges(frame_start, frame_end, existing_frames):
+    """Get continuous frame ranges which are not in existing frames.
+
+    Args:
+        frame_start (int): First frame of the range.
+        frame_end (int): End frame of the range (exclusive).
+        existing_frames (set[int]): Frames which don't need rendering.
+
+    Returns:
+        list[tuple[int, int]]: Missing (start, end) ranges, end exclusive.
+
+    Example:
+        >>> get_missing_frame_ranges(1, 10, {3, 4, 7})
+        [(1, 3), (5, 7), (8, 10)]
+
+    """
+    missing_ranges = []
+    range_start = None
+    for frame in range(frame_start, frame_end):
+        if frame in existing_frames:
+            if range_start is not None:
+                missing_ranges.append((range_start, frame))
+                range_start = None
+        elif range_start is None:
+            range_start = frame
+
+    if range_start is not None:
+        missing_ranges.append((range_start, frame_end))
+
+    return missing_ranges
+
+
+class RenderTelemetry(object):
+    """Timing statistics of render queue and its jobs.
+
+    Jobs are identified by their `user_data`. Start of the job is
+    recorded by `job_started`, if it is not called (in-editor executor
+    renders jobs one after another) the job starts when previous job
+    finished.
+
+    Frames rendered, warm-up cost and seconds per frame are computed from
+    modification times of frames in the job output directory. Warm-up cost
+    is time from job start to first written frame, so it includes loading
+    of the map, pre-roll and warm-up frames. Seconds per frame is average
+    time between first and last written frame.
+
+    When the queue finishes, statistics are written as JSON file into
+    output directory of each job, where `CollectRenderFiles` picks them
+    up for publish instance.
+
+    Args:
+        executor_name (str): Name of executor rendering the queue.
+        render_format (str): Rendered image format.
+        workers (int): Number of parallel render processes.
+        preroll_frames (int): Number of pre-roll frames.
+
+    """
+
+    file_name = "render_telemetry.json"
+
+    def __init__(self, executor_name, render_format, workers=1,
+                 preroll_frames=0):
+        self._render_format = render_format
+        self._jobs = {}
+        self._job_starts = {}
+        self._last_job_end = None
+        self.data = {
+            "executor": executor_name,
+            "workers": workers,
+            "preroll_frames": preroll_frames,
+            "engine_version": unreal.SystemLibrary.get_engine_version(),
+            "project": os.environ.get("AYON_PROJECT_NAME"),
+            "queue_start": None,
+            "queue_end": None,
+            "wall_time": None,
+            "success": None,
+        }
+
+    def add_job(self, job, sequence_name, output_dir, frame_range):
+        """Register job of the queue.
+
+        Args:
+            job (unreal.MoviePipelineExecutorJob): Render job.
+            sequence_name (str): Name of rendered sequence (file prefix).
+            output_dir (str): Render output directory.
+            frame_range (tuple[int, int]): Rendered frame range, end
+                exclusive.
+
+        """
+        job.user_data = str(len(self._jobs))
+        self._jobs[job.user_data] = {
+            "sequence": sequence_name,
+            "output_dir": output_dir,
+            "frame_range": list(frame_range),
+            "start": None,
+            "end": None,
+            "wall_time": None,
+            "frames_rendered": 0,
+            "warmup_time": None,
+            "seconds_per_frame": None,
+            "success": None,
+        }
+
+    def queue_started(self):
+        self.data["queue_start"] = self._last_job_end = time.time()
+
+    def job_started(self, job):
+        self._job_starts[job.user_data] = time.time()
+
+    def job_finished(self, job, success):
+        job_data = self._jobs.get(job.user_data)
+        if job_data is None:
+            return
+
+        end = time.time()
+        start = self._job_starts.get(job.user_data, self._last_job_end)
+        self._last_job_end = end
+
+        job_data.update({
+            "start": start,
+            "end": end,
+            "wall_time": end - start,
+            "success": success,
+        })
+        job_data.update(self._get_frame_stats(job_data, start))
+
+    def _get_frame_stats(self, job_data, start):
+        mtimes = get_rendered_frame_mtimes(
+            job_data["output_dir"],
+            job_data["sequence"],
+            self._render_format,
+            job_data["frame_range"],
+            since=start,
+        )
+        if not mtimes:
+            return {}
+
+        first, last = min(mtimes), max(mtimes)
+        stats = {
+            "frames_rendered": len(mtimes),
+            "warmup_time": first - start,
+        }
+        if len(mtimes) > 1:
+            stats["seconds_per_frame"] = (last - first) / (len(mtimes) - 1)
+        return stats
+
+    def queue_finished(self, success):
+        """Record queue end and write statistics next to rendered files."""
+        end = time.time()
+        self.data["queue_end"] = end
+        self.data["success"] = success
+        if self.data["queue_start"]:
+            self.data["wall_time"] = end - self.data["queue_start"]
+
+        jobs_by_dir = {}
+        for job_data in self._jobs.values():
+            jobs_by_dir.setdefault(job_data["output_dir"], []).append(
+                job_data)
+
+        for output_dir, jobs in jobs_by_dir.items():
+            if not os.path.isdir(output_dir):
+                continue
+            data = dict(self.data, jobs=jobs)
+            path = os.path.join(output_dir, self.file_name)
+            try:
+                with open(path, "w") as f:
+                    json.dump(data, f, indent=4)
+            except OSError as e:
+                unreal.log_warning(
+                    f"Failed to write render telemetry to {path}: {e}")
 
 
 def get_render_config(project_name, project_settings=None):
@@ -70,6 +751,94 @@ def get_render_config(project_name, project_settings=None):
     return config_path, config
 
 
+def _get_render_config_state(config_path):
+    """Get state of render config asset used to invalidate cache.
+
+    Args:
+        config_path (str): Object path of the render config.
+
+    Returns:
+        tuple: modification time of the package file and whether the
+            package has unsaved changes.
+    """
+    package_name = config_path.split(".")[0]
+    content_dir = unreal.Paths.convert_relative_path_to_full(
+        unreal.Paths.project_content_dir())
+    package_file = package_name.replace(
+        "/Game/", content_dir, 1) + ".uasset"
+    try:
+        mtime = os.path.getmtime(package_file)
+    except OSError:
+        mtime = None
+
+    is_dirty = any(
+        package.get_name() == package_name
+        for package in (
+            unreal.EditorLoadingAndSavingUtils.get_dirty_content_packages())
+    )
+    return mtime, is_dirty
+
+
+def get_prepared_render_config(
+    project_name, project_settings=None, resolution=None
+):
+    """Get render config prepared to be copied to render jobs.
+
+    Config asset is copied into transient config, so the asset itself is
+    never modified. Output extension from Settings and output resolution
+    are set and deferred pass is added on the copy. Prepared config is
+    cached per config path, render format and resolution, jobs then only
+    need to copy it. Cache is invalidated when the config asset is saved
+    or has unsaved changes.
+
+    Args:
+        project_name (str):
+        project_settings (dict): Settings from get_project_settings
+        resolution (Optional[tuple[int, int]]): Output resolution. If not
+            set, resolution from the config is kept.
+    Returns
+        (str, unreal.MoviePipelineMasterConfig): path and prepared config
+    """
+    if not project_settings:
+        project_settings = get_project_settings(project_name)
+
+    unreal_settings = project_settings["unreal"]
+    config_path = unreal_settings["render_config_path"]
+    render_format = unreal_settings.get("render_format")
+    if resolution:
+        resolution = tuple(resolution)
+    key = (config_path, render_format, resolution)
+
+    state = _get_render_config_state(config_path) if config_path else None
+    cached = _prepared_render_configs.get(key)
+    if cached:
+        prepared_config, cached_state = cached
+        if (
+            cached_state == state
+            and not state[1]
+            and unreal.SystemLibrary.is_valid(prepared_config)
+        ):
+            return config_path, prepared_config
+
+    config_path, config = get_render_config(project_name, project_settings)
+
+    prepared_config = unreal.new_object(
+        type(config), outer=unreal.get_transient_package())
+    prepared_config.copy_from(config)
+    set_output_extension_from_settings(render_format, prepared_config)
+
+    if resolution:
+        output_settings = prepared_config.find_or_add_setting_by_class(
+            unreal.MoviePipelineOutputSetting)
+        output_settings.output_resolution = unreal.IntPoint(*resolution)
+
+    prepared_config.find_or_add_setting_by_class(
+        unreal.MoviePipelineDeferredPassBase)
+
+    _prepared_render_configs[key] = (prepared_config, state)
+    return config_path, prepared_config
+
+
 def set_output_extension_from_settings(render_format, config):
     """Forces output extension from Settings if available.
 
@@ -97,9 +866,24 @@ def set_output_extension_from_settings(render_format, config):
     return config
 
 
-def start_rendering():
+def start_rendering(resume=None, dry_run=False, progress_callback=None):
     """
     Start the rendering process.
+
+    Args:
+        resume (Optional[bool]): Render only frames that are missing or
+            invalid in the output directories. If not set, value from
+            `ayon+settings://unreal/local_render_resume` is used.
+        dry_run (bool): Don't render anything, only report which frames
+            would be rendered and which skipped.
+        progress_callback (Optional[Callable[[int, int, str, bool], None]]):
+            Called with rendered and total frame count, status message
+            and whether rendering ended while jobs are rendered in
+            parallel processes.
+
+    Returns:
+        Optional[dict]: Report with rendered and skipped frame counts
+            when `dry_run` is enabled.
     """
     unreal.log("Starting rendering...")
 
@@ -152,7 +936,29 @@ def start_rendering():
     ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
     project_settings = get_project_settings(project_name)
-    _, config = get_render_config(project_name, project_settings)
+    _, config = get_prepared_render_config(
+        project_name, project_settings, resolution=(1920, 1080))
+
+    unreal_settings = project_settings["unreal"]
+    chunk_size = unreal_settings.get("local_render_chunk_size", 0)
+    render_workers = unreal_settings.get("local_render_workers", 1)
+    render_format = unreal_settings.get("render_format", "png")
+    if resume is None:
+        resume = unreal_settings.get("local_render_resume", False)
+
+    preroll_frames = unreal_settings.get("preroll_frames", 0)
+
+    report = {"frames_total": 0, "frames_skipped": 0, "jobs": []}
+    rendered_frames_cache = {}
+
+    global telemetry
+    telemetry = None
+    if not dry_run:
+        telemetry = RenderTelemetry(
+            "processes" if render_workers > 1 else "pie",
+            render_format,
+            workers=render_workers,
+            preroll_frames=preroll_frames)
 
     les = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
     current_level = les.get_current_level()
@@ -197,51 +1003,90 @@ def start_rendering():
             )
             i["master_level"] = current_level_name
 
-        # Create the rendering jobs and add them to the queue.
-        for render_setting in render_list:
+        # Create the rendering jobs and add them to the queue. Each
+        # sequence can be split into several jobs by frame chunks.
+        render_chunks = [
+            (render_setting, frame_range)
+            for render_setting in render_list
+            for frame_range in split_frame_range(
+                *render_setting.get("frame_range"), chunk_size)
+        ]
+        if resume:
+            render_chunks = _get_resume_render_chunks(
+                render_chunks, render_dir, render_format,
+                rendered_frames_cache, report)
+
+        for render_setting, frame_range in render_chunks:
+            report["jobs"].append({
+                "sequence": render_setting.get("sequence").get_name(),
+                "frame_range": frame_range,
+            })
+            if dry_run:
+                continue
+
             job = queue.allocate_new_job(unreal.MoviePipelineExecutorJob)
             job.sequence = unreal.SoftObjectPath(i["master_sequence"])
             job.map = unreal.SoftObjectPath(i["master_level"])
             job.author = "Ayon"
 
-            # If we have a saved configuration, copy it to the job.
-            if config:
-                job.get_configuration().copy_from(config)
+            # Copy the prepared configuration to the job.
+            job.get_configuration().copy_from(config)
 
             job_config = job.get_configuration()
-            # User data could be used to pass data to the job, that can be
-            # read in the job's OnJobFinished callback. We could,
-            # for instance, pass the AyonPublishInstance's path to the job.
-            # job.user_data = ""
 
             output_dir = render_setting.get('output')
             shot_name = render_setting.get('sequence').get_name()
 
+            # User data is used to identify the job in the job's
+            # OnJobFinished callback.
+            telemetry.add_job(
+                job, shot_name, f"{render_dir}/{output_dir}", frame_range)
+
             settings = job_config.find_or_add_setting_by_class(
                 unreal.MoviePipelineOutputSetting)
-            settings.output_resolution = unreal.IntPoint(1920, 1080)
-            settings.custom_start_frame = render_setting.get("frame_range")[0]
-            settings.custom_end_frame = render_setting.get("frame_range")[1]
+            settings.custom_start_frame = frame_range[0]
+            settings.custom_end_frame = frame_range[1]
             settings.use_custom_playback_range = True
             settings.file_name_format = f"{shot_name}" + ".{frame_number}"
             settings.output_directory.path = f"{render_dir}/{output_dir}"
 
-            job_config.find_or_add_setting_by_class(
-                unreal.MoviePipelineDeferredPassBase)
+            if render_workers > 1 and preroll_frames:
+                # Initial delay of PIE executor is not available in new
+                # processes, engine warm up frames are rendered instead.
+                aa_settings = job_config.find_or_add_setting_by_class(
+                    unreal.MoviePipelineAntiAliasingSetting)
+                aa_settings.engine_warm_up_count = max(
+                    aa_settings.engine_warm_up_count, preroll_frames)
 
-            render_format = project_settings.get("unreal").get("render_format",
-                                                               "png")
+    if resume and not dry_run:
+        unreal.log(
+            "Resuming render: {} of {} frames are already rendered and "
+            "skipped, {} jobs will render the rest.".format(
+                report["frames_skipped"], report["frames_total"],
+                len(report["jobs"])))
 
-            set_output_extension_from_settings(render_format,
-                                               job_config)
+    if dry_run:
+        report["frames_to_render"] = sum(
+            end - start for start, end in (
+                job["frame_range"] for job in report["jobs"]))
+        unreal.log(
+            "Render dry run: {} jobs would render {} frames, {} of {} "
+            "frames would be skipped as already rendered.".format(
+                len(report["jobs"]), report["frames_to_render"],
+                report["frames_skipped"], report["frames_total"]))
+        return report
 
     # If there are jobs in the queue, start the rendering process.
     if queue.get_jobs():
         global executor
-        executor = unreal.MoviePipelinePIEExecutor()
+        if render_workers > 1:
+            executor = LocalRenderProcessPool(
+                queue, render_workers, render_format, progress_callback)
+            telemetry.queue_started()
+            executor.execute()
+            return
 
-        preroll_frames = project_settings.get("unreal").get("preroll_frames",
-                                                            0)
+        executor = unreal.MoviePipelinePIEExecutor()
 
         settings = unreal.MoviePipelinePIEExecutorSettings()
         settings.set_editor_property(
@@ -251,4 +1096,47 @@ def start_rendering():
             _queue_finish_callback)
         executor.on_individual_job_finished_delegate.add_callable_unique(
             _job_finish_callback)  # Only available on PIE Executor
+        telemetry.queue_started()
         executor.execute(queue)
+
+
+def _get_resume_render_chunks(
+    render_chunks, render_dir, render_format, rendered_frames_cache, report
+):
+    """Replace render chunks by sub-ranges of frames that are not rendered.
+
+    Args:
+        render_chunks (list[tuple[dict, tuple[int, int]]]): Render settings
+            with frame range to render.
+        render_dir (str): Render root directory.
+        render_format (str): Rendered image format.
+        rendered_frames_cache (dict): Valid rendered frames by output
+            directory and shot, so each directory is scanned only once.
+        report (dict): Report updated with total and skipped frame counts.
+
+    Returns:
+        list[tuple[dict, tuple[int, int]]]: Render settings with missing
+            frame ranges.
+    """
+    resumed_chunks = []
+    for render_setting, frame_range in render_chunks:
+        output_dir = f"{render_dir}/{render_setting.get('output')}"
+        shot_name = render_setting.get("sequence").get_name()
+        key = (output_dir, shot_name)
+        if key not in rendered_frames_cache:
+            rendered_frames_cache[key] = get_valid_rendered_frames(
+                output_dir, shot_name, render_format)
+
+        missing_ranges = get_missing_frame_ranges(
+            *frame_range, rendered_frames_cache[key])
+        frames_count = frame_range[1] - frame_range[0]
+        missing_count = sum(end - start for start, end in missing_ranges)
+        report["frames_total"] += frames_count
+        report["frames_skipped"] += frames_count - missing_count
+
+        resumed_chunks.extend(
+            (render_setting, missing_range)
+            for missing_range in missing_ranges
+        )
+
+    return resumed_chunks
@@ -11,6 +11,25 @@ from ayon_unreal.api import rendering
 from ayon_unreal.api import hierarchy
 
 
+class RenderProgressDialog(QtWidgets.QProgressDialog):
+    """Progress of local rendering which allows to cancel it."""
+    def __init__(self, parent=None):
+        super(RenderProgressDialog, self).__init__(parent)
+
+        self.setWindowTitle("Ayon rendering")
+        self.setLabelText("Starting render processes...")
+        self.setCancelButtonText("Cancel")
+        self.setWindowModality(QtCore.Qt.NonModal)
+        self.setMinimumDuration(0)
+
+        self.canceled.connect(rendering.cancel_rendering)
+
+    def update_progress(self, frames_done, frames_total, message):
+        self.setMaximum(frames_total)
+        self.setValue(frames_done)
+        self.setLabelText(message)
+
+
 class ToolsBtnsWidget(QtWidgets.QWidget):
     """Widget containing buttons which are clickable."""
     tool_required = QtCore.Signal(str)
@@ -22,6 +41,8 @@ class ToolsBtnsWidget(QtWidgets.QWidget):
         publish_btn = QtWidgets.QPushButton("Publisher...", self)
         manage_btn = QtWidgets.QPushButton("Manage...", self)
         render_btn = QtWidgets.QPushButton("Render...", self)
+        resume_render_btn = QtWidgets.QPushButton("Resume render...", self)
+        render_dry_run_btn = QtWidgets.QPushButton("Render dry run...", self)
         sequence_btn = QtWidgets.QPushButton(
             "Build sequence hierarchy...", self)
         experimental_tools_btn = QtWidgets.QPushButton(
@@ -34,6 +55,8 @@ class ToolsBtnsWidget(QtWidgets.QWidget):
         layout.addWidget(publish_btn, 0)
         layout.addWidget(manage_btn, 0)
         layout.addWidget(render_btn, 0)
+        layout.addWidget(resume_render_btn, 0)
+        layout.addWidget(render_dry_run_btn, 0)
         layout.addWidget(sequence_btn, 0)
         layout.addWidget(experimental_tools_btn, 0)
         layout.addStretch(1)
@@ -42,9 +65,13 @@ class ToolsBtnsWidget(QtWidgets.QWidget):
         publish_btn.clicked.connect(self._on_publish)
         manage_btn.clicked.connect(self._on_manage)
         render_btn.clicked.connect(self._on_render)
+        resume_render_btn.clicked.connect(self._on_resume_render)
+        render_dry_run_btn.clicked.connect(self._on_render_dry_run)
         sequence_btn.clicked.connect(self._on_sequence)
         experimental_tools_btn.clicked.connect(self._on_experimental)
 
+        self._render_progress_dialog = None
+
     def _on_create(self):
         self.tool_required.emit("creator")
 
@@ -58,7 +85,39 @@ class ToolsBtnsWidget(QtWidgets.QWidget):
         self.tool_required.emit("sceneinventory")
 
     def _on_render(self):
-        rendering.start_rendering()
+        rendering.start_rendering(
+            progress_callback=self._on_render_progress)
+
+    def _on_resume_render(self):
+        rendering.start_rendering(
+            resume=True, progress_callback=self._on_render_progress)
+
+    def _on_render_dry_run(self):
+        report = rendering.start_rendering(resume=True, dry_run=True)
+        QtWidgets.QMessageBox.information(
+            self,
+            "Render dry run",
+            (
+                f"{len(report['jobs'])} jobs would render "
+                f"{report['frames_to_render']} frames.\n"
+                f"{report['frames_skipped']} of {report['frames_total']} "
+                "frames are already rendered and would be skipped."
+            )
+        )
+
+    def _on_render_progress(
+        self, frames_done, frames_total, message, finished
+    ):
+        if self._render_progress_dialog is None:
+            self._render_progress_dialog = RenderProgressDialog(self)
+        if finished:
+            # Finished or cancelled
+            self._render_progress_dialog.reset()
+            return
+        if not self._render_progress_dialog.isVisible():
+            self._render_progress_dialog.show()
+        self._render_progress_dialog.update_progress(
+            frames_done, frames_total, message)
 
     def _on_sequence(self):
         hierarchy.build_sequence_hierarchy()
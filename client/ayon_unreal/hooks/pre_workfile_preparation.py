@@ -4,6 +4,7 @@ import os
 import copy
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 
 from qtpy import QtCore
@@ -75,14 +76,15 @@ class UnrealPrelaunchHook(PreLaunchHook):
         # Return filename
         return template_obj.format_strict(workdir_data)
 
-    def exec_plugin_install(self, engine_path: Path, env: dict = None):
+    def exec_plugin_install(self, engine_path: Path, env: dict = None,
+                            timings=None, engine_version: str = None):
         # set up the QThread and worker with necessary signals
         env = env or os.environ
         q_thread = QtCore.QThread()
         ue_plugin_worker = UEPluginInstallWorker()
 
         q_thread.started.connect(ue_plugin_worker.run)
-        ue_plugin_worker.setup(engine_path, env)
+        ue_plugin_worker.setup(engine_path, env, engine_version)
         ue_plugin_worker.moveToThread(q_thread)
 
         splash_screen = SplashScreen(
@@ -96,6 +98,10 @@ class UnrealPrelaunchHook(PreLaunchHook):
         )
         ue_plugin_worker.progress.connect(splash_screen.update_progress)
         ue_plugin_worker.log.connect(splash_screen.append_log)
+        ue_plugin_worker.phase_finished.connect(
+            splash_screen.append_phase_timing)
+        if timings is not None:
+            ue_plugin_worker.phase_finished.connect(timings.add)
         ue_plugin_worker.finished.connect(splash_screen.quit_and_close)
         ue_plugin_worker.failed.connect(splash_screen.fail)
 
@@ -110,7 +116,8 @@ class UnrealPrelaunchHook(PreLaunchHook):
                             engine_version: str,
                             unreal_project_name: str,
                             engine_path: Path,
-                            project_dir: Path):
+                            project_dir: Path,
+                            timings=None):
         self.log.info((
             f"{self.signature} Creating unreal "
             f"project [ {unreal_project_name} ]"
@@ -138,6 +145,10 @@ class UnrealPrelaunchHook(PreLaunchHook):
         )
         ue_project_worker.progress.connect(splash_screen.update_progress)
         ue_project_worker.log.connect(splash_screen.append_log)
+        ue_project_worker.phase_finished.connect(
+            splash_screen.append_phase_timing)
+        if timings is not None:
+            ue_project_worker.phase_finished.connect(timings.add)
         ue_project_worker.finished.connect(splash_screen.quit_and_close)
         ue_project_worker.failed.connect(splash_screen.fail)
 
@@ -148,6 +159,111 @@ class UnrealPrelaunchHook(PreLaunchHook):
             raise ApplicationLaunchFailed("Couldn't run the application! "
                                           "Failed to generate the project!")
 
+    def prewarm_ddc(self,
+                    engine_version: str,
+                    engine_path: Path,
+                    project_file: Path,
+                    project_setup: dict,
+                    timings):
+        """Start Derived Data Cache pre-warm if project content changed.
+
+        Commandlet runs in background alongside the editor, so it doesn't
+        delay the launch. Failed pre-warm is only logged, editor builds
+        missing derived data on its own.
+        """
+        if not project_setup.get("ddc_prewarm"):
+            return
+
+        ddc_path = project_setup.get("shared_ddc_path", "").strip()
+        project_dir = project_file.parent
+        with timings.phase("ddc_content_hash"):
+            content_hash = unreal_lib.get_project_content_hash(
+                project_dir, engine_path, engine_version, ddc_path)
+        state = unreal_lib.get_ddc_prewarm_state(project_dir)
+        if state.get("content_hash") == content_hash:
+            self.log.info(
+                f"{self.signature} Derived Data Cache is up to date.")
+            return
+
+        self.log.info(
+            f"{self.signature} Pre-warming Derived Data Cache of "
+            f"[ {project_file.name} ] in background.")
+        threading.Thread(
+            target=unreal_lib.fill_ddc,
+            args=(engine_path, engine_version, project_file, content_hash,
+                  ddc_path),
+            name="ayon_unreal_ddc_prewarm",
+            daemon=True,
+        ).start()
+
+    def generate_project(self,
+                         engine_version: str,
+                         unreal_project_name: str,
+                         engine_path: Path,
+                         project_path: Path,
+                         project_file: Path,
+                         timings=None,
+                         timeout: float = 7200.0):
+        """Generate project next to the workdir and move it in place.
+
+        Project is generated to a staging directory on the same filesystem
+        and moved to the project directory with renames. Lock file
+        prevents concurrent launches of the same task from generating the
+        project at the same time, it is refreshed while the project is
+        generated and other launches wait for it up to `timeout` seconds.
+        """
+        lock_path = project_path.parent / f".{project_path.name}.lock"
+        try:
+            with unreal_lib.file_lock(lock_path, timeout=timeout):
+                if project_file.is_file():
+                    self.log.info(
+                        f"{self.signature} Project was generated by "
+                        "another launch.")
+                    return
+
+                staging_dir = Path(tempfile.mkdtemp(
+                    prefix=f".{project_path.name}.",
+                    dir=project_path.parent))
+                try:
+                    self.exec_ue_project_gen(engine_version,
+                                             unreal_project_name,
+                                             engine_path,
+                                             staging_dir,
+                                             timings)
+                    self.log.info((
+                        f"Moving from {staging_dir} to "
+                        f"{project_path.as_posix()}"
+                    ))
+                    self._move_project(staging_dir, project_path)
+                except OSError as e:
+                    raise ApplicationLaunchFailed((
+                        f"{self.signature} Cannot move directory "
+                        f"{staging_dir} to {project_path.as_posix()} - {e}"
+                    )) from e
+                finally:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+        except TimeoutError as e:
+            raise ApplicationLaunchFailed(
+                f"{self.signature} Project is being generated by another "
+                f"launch - {e}") from e
+
+    @staticmethod
+    def _move_project(staging_dir: Path, project_path: Path):
+        """Move generated project to project directory with renames."""
+        if project_path.is_dir() and not any(project_path.iterdir()):
+            project_path.rmdir()
+        if not project_path.exists():
+            os.rename(staging_dir, project_path)
+            return
+
+        # Directory has other content, move generated entries one by one
+        for entry in staging_dir.iterdir():
+            target = project_path / entry.name
+            if target.is_dir() and entry.is_dir():
+                shutil.copytree(entry, target, dirs_exist_ok=True)
+            else:
+                os.replace(entry, target)
+
     def execute(self):
         """Hook entry method."""
         workdir = self.launch_context.env["AYON_WORKDIR"]
@@ -166,7 +282,13 @@ class UnrealPrelaunchHook(PreLaunchHook):
             # so let's keep it quiet.
             ...
 
-        unreal_project_filename = self._get_work_filename()
+        timings = unreal_lib.LaunchTimings({
+            "project_name": self.data["project_name"],
+            "app_name": self.app_name,
+            "engine_version": engine_version,
+        })
+        with timings.phase("workfile_template"):
+            unreal_project_filename = self._get_work_filename()
         unreal_project_name = os.path.splitext(unreal_project_filename)[0]
         # Unreal is sensitive about project names longer then 20 chars
         if len(unreal_project_name) > 20:
@@ -204,18 +326,33 @@ class UnrealPrelaunchHook(PreLaunchHook):
         # so, we are going up from the executable itself 3 levels.
         engine_path: Path = Path(executable).parents[3]
 
+        # Detected engine paths are cached until the engine changes, so the
+        # workers below don't need to discover them again.
+        with timings.phase("engine_detection"):
+            engine_info = unreal_lib.get_engine_info(
+                engine_path, engine_version)
+        self.log.info((
+            f"{self.signature} using engine {engine_info['path']} "
+            f"with build id {engine_info['build_id']}"
+        ))
+
         # Check if new env variable exists, and if it does, if the path
         # actually contains the plugin. If not, install it.
 
         built_plugin_path = self.launch_context.env.get(
             "AYON_BUILT_UNREAL_PLUGIN", None)
 
-        if unreal_lib.check_built_plugin_existance(built_plugin_path):
+        with timings.phase("built_plugin_check"):
+            built_plugin_exists = unreal_lib.check_built_plugin_existance(
+                built_plugin_path)
+        if built_plugin_exists:
             self.log.info((
                 f"{self.signature} using existing built Ayon plugin from "
                 f"{built_plugin_path}"
             ))
-            unreal_lib.copy_built_plugin(engine_path, Path(built_plugin_path))
+            with timings.phase("plugin_copy"):
+                unreal_lib.copy_built_plugin(
+                    engine_path, Path(built_plugin_path))
         else:
             # Set "AYON_UNREAL_PLUGIN" to current process environment for
             # execution of `create_unreal_project`
@@ -228,37 +365,36 @@ class UnrealPrelaunchHook(PreLaunchHook):
             if self.launch_context.env.get(env_key):
                 os.environ[env_key] = self.launch_context.env[env_key]
 
-            if not unreal_lib.check_plugin_existence(engine_path):
-                self.exec_plugin_install(engine_path)
+            with timings.phase("plugin_check"):
+                plugin_exists = unreal_lib.check_plugin_existence(
+                    engine_path)
+            if not plugin_exists:
+                with timings.phase("plugin_install"):
+                    self.exec_plugin_install(
+                        engine_path, timings=timings,
+                        engine_version=engine_version)
 
         project_file = project_path / unreal_project_filename
 
+        current_project = get_current_project_name()
+        unreal_settings = get_project_settings(current_project).get("unreal")
+        project_setup = unreal_settings["project_setup"]
         if not project_file.is_file():
 
             #Get project settings -> allow project creation
-            current_project = get_current_project_name()
-            unreal_settings = get_project_settings(current_project).get("unreal")
-            allow_project_creation = unreal_settings["project_setup"].get(
+            allow_project_creation = project_setup.get(
             "allow_project_creation")
             if allow_project_creation:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    self.exec_ue_project_gen(engine_version,
-                                             unreal_project_name,
-                                             engine_path,
-                                             Path(temp_dir))
-                    try:
-                        self.log.info((
-                            f"Moving from {temp_dir} to "
-                            f"{project_path.as_posix()}"
-                        ))
-                        shutil.copytree(
-                            temp_dir, project_path, dirs_exist_ok=True)
-
-                    except shutil.Error as e:
-                        raise ApplicationLaunchFailed((
-                            f"{self.signature} Cannot copy directory {temp_dir} "
-                            f"to {project_path.as_posix()} - {e}"
-                        )) from e
+                with timings.phase("project_generation"):
+                    self.generate_project(engine_version,
+                                          unreal_project_name,
+                                          engine_path,
+                                          project_path,
+                                          project_file,
+                                          timings,
+                                          project_setup.get(
+                                              "project_generation_timeout",
+                                              7200))
             else:
                 raise ApplicationLaunchFailed(
                     f"Could not open project; Project file not found.\n\n"
@@ -267,7 +403,27 @@ class UnrealPrelaunchHook(PreLaunchHook):
                     f"Make sure the project is in the correct folder. Or enable 'allow project creation' in studio settings"
                 )
 
+        self.prewarm_ddc(engine_version,
+                         engine_path,
+                         project_file,
+                         unreal_settings["project_setup"],
+                         timings)
+
+        try:
+            launch_log = timings.write()
+        except OSError as e:
+            self.log.warning(f"{self.signature} Launch log not written: {e}")
+        else:
+            self.log.info(
+                f"{self.signature} Launch phases took "
+                f"{timings.to_data()['duration']:.1f}s, see {launch_log}")
+
         self.launch_context.env["AYON_UNREAL_VERSION"] = engine_version
         # Append project file to launch arguments
         self.launch_context.launch_args.append(
             f"\"{project_file.as_posix()}\"")
+        # Editor uses the shared DDC filled by the pre-warm
+        shared_ddc_path = project_setup.get("shared_ddc_path", "").strip()
+        if shared_ddc_path:
+            self.launch_context.launch_args.append(
+                f"-SharedDataCachePath={shared_ddc_path}")
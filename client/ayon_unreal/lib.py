@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 """Unreal launching and project tools."""
 
+import hashlib
 import json
 import os
 import platform
 import re
+import shutil
 import subprocess
+import threading
+import time
+import uuid
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from distutils import dir_util
 from pathlib import Path
 from typing import List
@@ -14,6 +21,80 @@ from typing import List
 from ayon_core.settings import get_project_settings
 
 
+ENGINE_CACHE_FILE = "engines.json"
+_engine_cache = None
+
+
+def _get_path_mtime(path):
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _get_engine_cache_path() -> Path:
+    return get_cache_dir() / ENGINE_CACHE_FILE
+
+
+def _load_engine_cache() -> dict:
+    global _engine_cache
+    if _engine_cache is None:
+        _engine_cache = {}
+        try:
+            with open(_get_engine_cache_path(), "r") as f:
+                _engine_cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+    return _engine_cache
+
+
+def _get_sources_signature(sources: list) -> dict:
+    """Get modification times of paths validating a cached value."""
+    return {
+        str(source): _get_path_mtime(source)
+        for source in sources
+        if source
+    }
+
+
+def _get_cached(section: str, key: str, signature: dict):
+    """Get value from engine cache if its sources didn't change.
+
+    Args:
+        section (str): Cache section.
+        key (str): Key of the value in the section.
+        signature (dict): Current signature of the value sources, see
+            `_get_sources_signature`.
+
+    Returns:
+        tuple[bool, Any]: True and cached value on hit, False and None on
+            miss.
+
+    """
+    entry = _load_engine_cache().get(section, {}).get(key)
+    if entry is not None and entry["sources"] == signature:
+        return True, entry["value"]
+    return False, None
+
+
+def _set_cached(section: str, key: str, signature: dict, value) -> None:
+    cache = _load_engine_cache()
+    cache.setdefault(section, {})[key] = {
+        "sources": signature, "value": value
+    }
+    try:
+        cache_path = _get_engine_cache_path()
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f, indent=1)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Cache is optional, values are detected again next time
+        pass
+
+
 def get_engine_versions(env=None):
     """Detect Unreal Engine versions.
 
@@ -338,6 +419,18 @@ def get_path_to_uat(engine_path: Path) -> Path:
         return engine_path / "Engine/Build/BatchFiles/RunUAT.sh"
 
 
+def _list_integration_dirs(integration_root: Path) -> List[Path]:
+    """List integration directories, cached until the root changes."""
+    key = Path(integration_root).resolve().as_posix()
+    signature = _get_sources_signature([integration_root])
+    found, names = _get_cached("integrations", key, signature)
+    if not found:
+        names = [p.name for p in Path(integration_root).iterdir()
+                 if p.is_dir()]
+        _set_cached("integrations", key, signature, names)
+    return [Path(integration_root) / name for name in names]
+
+
 def get_compatible_integration(
         ue_version: str, integration_root: Path) -> List[Path]:
     """Get path to compatible version of integration plugin.
@@ -355,8 +448,7 @@ def get_compatible_integration(
 
     """
     major, minor = ue_version.split(".")
-    integration_paths = [p for p in integration_root.iterdir()
-                         if p.is_dir()]
+    integration_paths = _list_integration_dirs(integration_root)
 
     compatible_versions = []
     for i in integration_paths:
@@ -379,28 +471,39 @@ def get_compatible_integration(
     return compatible_versions
 
 
+def _get_integration_version_dir(ue_version: str, integration_root: Path):
+    """Get integration directory of engine version or the closest one.
+
+    Returns:
+        Union[Path, None]: Directory of the version or of the closest
+            compatible version, None if there is none.
+
+    """
+    version_dir = integration_root / f"UE_{ue_version}"
+    if version_dir in _list_integration_dirs(integration_root):
+        return version_dir
+    if compatible_versions := get_compatible_integration(
+        ue_version, integration_root
+    ):
+        return compatible_versions[-1]
+    return None
+
+
 def get_path_to_cmdlet_project(ue_version: str) -> Path:
-    cmd_project = Path(
-        os.path.dirname(os.path.abspath(__file__)))
+    integration_root = Path(
+        os.path.dirname(os.path.abspath(__file__))) / "integration"
 
     # For now, only tested on Windows (For Linux and Mac
     # it has to be implemented)
-    cmd_project /= f"integration/UE_{ue_version}"
-
     # if the integration doesn't exist for current engine version
     # try to find the closest to it.
-    if cmd_project.exists():
-        return cmd_project / "CommandletProject/CommandletProject.uproject"
-
-    if compatible_versions := get_compatible_integration(
-        ue_version, cmd_project.parent
-    ):
-        return compatible_versions[-1] / "CommandletProject/CommandletProject.uproject"  # noqa: E501
-    else:
+    version_dir = _get_integration_version_dir(ue_version, integration_root)
+    if version_dir is None:
         raise RuntimeError(
             ("There are no compatible versions of Unreal "
              "integration plugin compatible with running version "
              f"of Unreal Engine {ue_version}"))
+    return version_dir / "CommandletProject/CommandletProject.uproject"
 
 
 def get_path_to_ubt(engine_path: Path, ue_version: str) -> Path:
@@ -414,7 +517,7 @@ def get_path_to_ubt(engine_path: Path, ue_version: str) -> Path:
     return Path(u_build_tool_path)
 
 
-def get_build_id(engine_path: Path, ue_version: str) -> str:
+def _get_modules_path(engine_path: Path, ue_version: str) -> Path:
     ue_modules = Path()
     if platform.system().lower() == "windows":
         ue_modules_path = engine_path / "Engine/Binaries/Win64"
@@ -431,7 +534,11 @@ def get_build_id(engine_path: Path, ue_version: str) -> str:
     if platform.system().lower() == "darwin":
         ue_modules = Path(os.path.join(engine_path, "Engine", "Binaries",
                                        "Mac", "UE4Editor.modules"))
+    return ue_modules
 
+
+def get_build_id(engine_path: Path, ue_version: str) -> str:
+    ue_modules = _get_modules_path(engine_path, ue_version)
     if ue_modules.exists():
         print("--- Loading Engine ID from modules file ...")
         with open(ue_modules, "r") as mp:
@@ -439,6 +546,101 @@ def get_build_id(engine_path: Path, ue_version: str) -> str:
 
         if loaded_modules.get("BuildId"):
             return "{" + loaded_modules.get("BuildId") + "}"
+    return None
+
+
+def get_engine_python_path(engine_path: Path):
+    """Get path to Python bundled with the engine.
+
+    Returns:
+        Union[Path, None]: Path to Python executable, None on unsupported
+            platform.
+
+    """
+    python_dir = engine_path / "Engine/Binaries/ThirdParty/Python3"
+    system = platform.system().lower()
+    if system == "windows":
+        return python_dir / "Win64/python.exe"
+    if system == "linux":
+        return python_dir / "Linux/bin/python3"
+    if system == "darwin":
+        return python_dir / "Mac/bin/python3"
+    return None
+
+
+def get_integration_plugin_path(ue_version: str, integration_root: Path):
+    """Get path to integration plugin sources for engine version.
+
+    Args:
+        ue_version (str): Version of the engine.
+        integration_root (Path): Path to built-in integration plugins.
+
+    Returns:
+        Path: Path to `Ayon` plugin of the version or of the closest
+            compatible version.
+
+    """
+    integration_root = Path(integration_root)
+    version_dir = (
+        _get_integration_version_dir(ue_version, integration_root)
+        or integration_root / f"UE_{ue_version}"
+    )
+    return version_dir / "Ayon"
+
+
+def get_engine_info(engine_path: Path, ue_version: str) -> dict:
+    """Get detected engine record, cached until the engine changes.
+
+    Record is validated by modification times of the engine build and
+    modules files and of the integration root, so repeated launches don't
+    crawl the engine and integration directories again.
+
+    Args:
+        engine_path (Path): Path to Unreal Engine installation.
+        ue_version (str): Version of the engine.
+
+    Returns:
+        dict: Engine `path`, `version`, `build_id` and paths to `editor`,
+            `ubt`, `uat`, `python`, `cmdlet_project` and compatible
+            `integration` plugin, paths as strings. Paths which can't be
+            resolved on this platform or for this version are None.
+
+    """
+    engine_path = Path(engine_path)
+    integration_root = Path(
+        os.path.dirname(os.path.abspath(__file__))) / "integration"
+    key = json.dumps([engine_path.as_posix(), ue_version])
+    signature = _get_sources_signature([
+        engine_path / "Engine/Build/Build.version",
+        _get_modules_path(engine_path, ue_version),
+        integration_root,
+    ])
+    found, info = _get_cached("engines", key, signature)
+    if found:
+        return info
+
+    def _as_posix(path):
+        return path.as_posix() if path else None
+
+    try:
+        cmdlet_project = get_path_to_cmdlet_project(ue_version)
+    except RuntimeError:
+        cmdlet_project = None
+
+    info = {
+        "path": engine_path.as_posix(),
+        "version": ue_version,
+        "build_id": get_build_id(engine_path, ue_version),
+        "editor": _as_posix(get_editor_exe_path(engine_path, ue_version)),
+        "ubt": _as_posix(get_path_to_ubt(engine_path, ue_version)),
+        "uat": _as_posix(get_path_to_uat(engine_path)),
+        "python": _as_posix(get_engine_python_path(engine_path)),
+        "cmdlet_project": _as_posix(cmdlet_project),
+        "integration": _as_posix(
+            get_integration_plugin_path(ue_version, integration_root)),
+    }
+    _set_cached("engines", key, signature, info)
+    return info
 
 
 def check_built_plugin_existance(plugin_path) -> bool:
@@ -457,7 +659,108 @@ def check_built_plugin_existance(plugin_path) -> bool:
     return True
 
 
-def copy_built_plugin(engine_path: Path, plugin_path: Path) -> None:
+PLUGIN_MANIFEST_NAME = ".ayon_manifest.json"
+
+
+def _load_plugin_manifest(plugin_path: Path) -> dict:
+    manifest_path = plugin_path / PLUGIN_MANIFEST_NAME
+    if not manifest_path.is_file():
+        return {}
+    try:
+        with open(manifest_path, "r") as f:
+            return json.load(f)
+    except ValueError:
+        return {}
+
+
+def _stage_file(src: str, dst: str) -> None:
+    """Copy file next to its destination to be renamed over it."""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    shutil.copy2(src, f"{dst}.ayon_tmp")
+
+
+def _remove_file(path: str) -> bool:
+    """Remove file if it exists, files locked by the system are kept.
+
+    Returns:
+        bool: File doesn't exist anymore.
+
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
+    return True
+
+
+def _replace_staged_files(paths: List[str],
+                          removed_paths: List[str] = None) -> None:
+    """Rename staged files over their destinations with rollback.
+
+    Installed files are moved aside first, as files locked by the system
+    (e.g. loaded DLL on Windows) can be renamed but not overwritten or
+    removed. Files no longer in the plugin are moved aside the same way.
+    When any rename fails, already replaced and removed files are
+    restored and new ones removed. Backups which can't be removed are
+    left for the next sync.
+
+    Args:
+        paths (list[str]): Destination paths of files staged with
+            `_stage_file`.
+        removed_paths (Optional[list[str]]): Installed files to remove.
+
+    """
+    replaced = []
+    try:
+        for dst in removed_paths or []:
+            if not os.path.isfile(dst):
+                continue
+            backup = f"{dst}.ayon_bak"
+            _remove_file(backup)
+            os.replace(dst, backup)
+            replaced.append((dst, backup))
+
+        for dst in paths:
+            backup = None
+            if os.path.exists(dst):
+                backup = f"{dst}.ayon_bak"
+                _remove_file(backup)
+                os.replace(dst, backup)
+            replaced.append((dst, backup))
+            os.replace(f"{dst}.ayon_tmp", dst)
+    except Exception:
+        for dst, backup in reversed(replaced):
+            if backup is None:
+                _remove_file(dst)
+            elif os.path.exists(backup):
+                os.replace(backup, dst)
+        raise
+
+    for _, backup in replaced:
+        if backup:
+            _remove_file(backup)
+
+
+def copy_built_plugin(engine_path: Path, plugin_path: Path,
+                      max_workers: int = 8) -> None:
+    """Sync built plugin into the engine copying only changed files.
+
+    Manifest with relative path, size, modification time and hash of every
+    file is written next to the installed plugin. Source files whose size
+    and modification time match the manifest are skipped without reading
+    them, others are hashed and copied only if their hash differs. Changed
+    files are copied in parallel next to their destination and renamed
+    over it once all copies succeed. If any rename fails, installed files
+    are restored and the error is raised.
+
+    Args:
+        engine_path (Path): Path to the engine root.
+        plugin_path (Path): Path to the built plugin.
+        max_workers (int): Number of parallel copies.
+
+    """
     ayon_plugin_path: Path = engine_path / "Engine/Plugins/Marketplace/Ayon"
 
     if not ayon_plugin_path.is_dir():
@@ -466,9 +769,73 @@ def copy_built_plugin(engine_path: Path, plugin_path: Path) -> None:
         engine_plugin_config_path: Path = ayon_plugin_path / "Config"
         engine_plugin_config_path.mkdir(exist_ok=True)
 
-        dir_util._path_created = {}
+    # Backups of files which were locked during previous sync
+    for backup in ayon_plugin_path.rglob("*.ayon_bak"):
+        _remove_file(backup)
+
+    old_manifest = _load_plugin_manifest(ayon_plugin_path)
+    new_manifest = {}
+    to_copy = []
+    skipped_bytes = 0
+    copied_bytes = 0
+    for src in plugin_path.rglob("*"):
+        if not src.is_file() or src.name == PLUGIN_MANIFEST_NAME:
+            continue
+        relative_path = src.relative_to(plugin_path).as_posix()
+        stat = src.stat()
+        dst = ayon_plugin_path / relative_path
+        old_entry = old_manifest.get(relative_path)
+        installed = (
+            old_entry is not None
+            and dst.is_file()
+            and dst.stat().st_size == old_entry["size"]
+        )
+        if (
+            installed
+            and old_entry["size"] == stat.st_size
+            and old_entry["mtime"] == stat.st_mtime
+        ):
+            new_manifest[relative_path] = old_entry
+            skipped_bytes += stat.st_size
+            continue
+
+        file_hash = get_file_hash(src)
+        new_manifest[relative_path] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": file_hash,
+        }
+        if installed and old_entry["hash"] == file_hash:
+            skipped_bytes += stat.st_size
+            continue
+        to_copy.append((src.as_posix(), dst.as_posix()))
+        copied_bytes += stat.st_size
 
-    dir_util.copy_tree(plugin_path.as_posix(), ayon_plugin_path.as_posix())
+    # All files are staged first so failed copy doesn't leave the installed
+    # plugin half updated.
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Consume results to raise the first copy error
+            list(pool.map(lambda item: _stage_file(*item), to_copy))
+        _replace_staged_files(
+            [dst for _, dst in to_copy],
+            [
+                (ayon_plugin_path / relative_path).as_posix()
+                for relative_path in set(old_manifest) - set(new_manifest)
+            ]
+        )
+    finally:
+        for _, dst in to_copy:
+            _remove_file(f"{dst}.ayon_tmp")
+
+    manifest_path = ayon_plugin_path / PLUGIN_MANIFEST_NAME
+    with open(f"{manifest_path}.ayon_tmp", "w") as f:
+        json.dump(new_manifest, f, indent=1)
+    os.replace(f"{manifest_path}.ayon_tmp", manifest_path)
+
+    print(
+        f"--- Plugin synced: {len(to_copy)} files copied "
+        f"({copied_bytes} bytes), {skipped_bytes} bytes unchanged.")
 
 
 def check_plugin_existence(engine_path: Path, env: dict = None) -> bool:
@@ -523,6 +890,14 @@ def _build_and_move_plugin(engine_path: Path,
     env = env or os.environ
     integration_plugin_path: Path = Path(env.get("AYON_UNREAL_PLUGIN", ""))
 
+    build_key = get_plugin_build_key(engine_path, integration_plugin_path)
+    cached_build = get_cached_plugin_build(build_key)
+    if cached_build:
+        print(f"--- Using cached plugin build {build_key}")
+        dir_util.copy_tree(cached_build.as_posix(),
+                           plugin_build_path.as_posix())
+        return
+
     if uat_path.is_file():
         temp_dir: Path = integration_plugin_path.parent / "Temp"
         temp_dir.mkdir(exist_ok=True)
@@ -534,7 +909,10 @@ def _build_and_move_plugin(engine_path: Path,
                                        'BuildPlugin',
                                        f'-Plugin={uplugin_path.as_posix()}',
                                        f'-Package={temp_dir.as_posix()}']
-        subprocess.run(build_plugin_cmd)
+        build_proc = subprocess.run(build_plugin_cmd)
+        if build_proc.returncode == 0:
+            cache_plugin_build(
+                temp_dir, integration_plugin_path / "Config", build_key)
 
         # Copy the contents of the 'Temp' dir into the
         # 'Ayon' directory in the engine
@@ -549,3 +927,717 @@ def _build_and_move_plugin(engine_path: Path,
                            plugin_install_config_path.as_posix())
 
         dir_util.remove_tree(temp_dir.as_posix())
+
+
+def get_file_hash(file_path, algorithm: str = "sha256",
+                  chunk_size: int = 1024 * 1024) -> str:
+    """Compute hash of file content reading it in chunks.
+
+    Args:
+        file_path (str | Path): Path to file.
+        algorithm (str): Name of `hashlib` algorithm.
+        chunk_size (int): Size of chunks read from file.
+
+    Returns:
+        str: Hex digest of the file content.
+
+    """
+    hasher = hashlib.new(algorithm)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _reflink_file(src: str, dst: str) -> None:
+    """Clone file using copy-on-write if filesystem supports it."""
+    system = platform.system().lower()
+    if system == "linux":
+        import fcntl
+
+        ficlone = 0x40049409
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), ficlone, src_file.fileno())
+
+    elif system == "darwin":
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0):
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    else:
+        raise OSError(f"Reflink is not supported on {system}")
+
+
+def _kernel_copy_file(src: str, dst: str) -> None:
+    """Copy file without passing its data through user space."""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    sendfile = getattr(os, "sendfile", None)
+    if not copy_file_range and not sendfile:
+        raise OSError("Kernel copy is not supported")
+
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        size = os.fstat(src_file.fileno()).st_size
+        offset = 0
+        while offset < size:
+            if copy_file_range:
+                copied = copy_file_range(
+                    src_file.fileno(), dst_file.fileno(), size - offset)
+            else:
+                copied = sendfile(
+                    dst_file.fileno(), src_file.fileno(), offset,
+                    size - offset)
+            if not copied:
+                break
+            offset += copied
+
+    if offset != size:
+        raise OSError(f"Kernel copy of {src} is incomplete")
+
+
+def _copy_file_with_hash(src: str, dst: str, hasher,
+                         chunk_size: int = 1024 * 1024) -> None:
+    """Copy file and update hasher with its content while streaming."""
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        for chunk in iter(lambda: src_file.read(chunk_size), b""):
+            hasher.update(chunk)
+            dst_file.write(chunk)
+    shutil.copystat(src, dst)
+
+
+def transfer_file(src, dst, hash_algorithm: str = None):
+    """Copy file to destination using the cheapest available method.
+
+    Destination never shares data with the source that could be changed
+    in place, so only copy-on-write clone (reflink), kernel copy or a real
+    copy is used. When hash is requested, the cloned or kernel copied file
+    is hashed in one read pass, the user space copy is hashed while
+    streaming.
+
+    Args:
+        src (str | Path): Source file.
+        dst (str | Path): Destination file. It must not exist.
+        hash_algorithm (str, optional): Name of `hashlib` algorithm to
+            hash the content with.
+
+    Returns:
+        tuple[str, Union[str, None]]: Used method ("reflink",
+            "kernel_copy" or "copy") and hex digest of the file content,
+            None if hash was not requested.
+
+    """
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+
+    for method, transfer in (
+        ("reflink", _reflink_file),
+        ("kernel_copy", _kernel_copy_file),
+    ):
+        try:
+            transfer(src, dst)
+        except (OSError, NotImplementedError):
+            if os.path.lexists(dst):
+                os.remove(dst)
+            continue
+        shutil.copystat(src, dst)
+        file_hash = None
+        if hash_algorithm:
+            file_hash = get_file_hash(dst, algorithm=hash_algorithm)
+        return method, file_hash
+
+    if hash_algorithm:
+        hasher = hashlib.new(hash_algorithm)
+        _copy_file_with_hash(src, dst, hasher)
+        return "copy", hasher.hexdigest()
+
+    shutil.copy2(src, dst)
+    return "copy", None
+
+
+def get_cache_dir(*subdirs: str) -> Path:
+    """Get local directory for Unreal integration caches.
+
+    Root can be overridden with `AYON_UNREAL_CACHE_DIR` environment
+    variable, e.g. to share caches on a network drive.
+
+    Args:
+        *subdirs (str): Subdirectories of the cache root.
+
+    Returns:
+        Path: Existing cache directory.
+
+    """
+    root = os.getenv("AYON_UNREAL_CACHE_DIR")
+    if not root:
+        try:
+            from ayon_core.lib import get_launcher_local_dir
+        except ImportError:
+            from ayon_core.lib import get_ayon_appdirs as get_launcher_local_dir  # noqa: E501
+        root = get_launcher_local_dir("addons", "unreal")
+    cache_dir = Path(root, *subdirs)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_plugin_version(engine_path: Path) -> str:
+    """Get version of Ayon plugin installed in the engine.
+
+    Returns:
+        str: `VersionName` from `Ayon.uplugin` or empty string if the
+            plugin is not installed.
+
+    """
+    uplugin_path = engine_path / "Engine/Plugins/Marketplace/Ayon/Ayon.uplugin"
+    if not uplugin_path.is_file():
+        return ""
+    with open(uplugin_path, "r") as f:
+        return str(json.load(f).get("VersionName", ""))
+
+
+def get_project_template_key(engine_path: Path, ue_version: str,
+                             dev_mode: bool) -> str:
+    """Get key of generated project template.
+
+    Template is valid only for the same engine build, plugin and addon
+    version, any change of those results in a different key.
+
+    Returns:
+        str: Key usable as directory name.
+
+    """
+    from ayon_unreal import __version__
+
+    key_data = json.dumps([
+        ue_version,
+        get_engine_info(engine_path, ue_version)["build_id"],
+        get_plugin_version(engine_path),
+        __version__,
+        bool(dev_mode),
+    ])
+    key_hash = hashlib.sha1(key_data.encode("utf-8")).hexdigest()[:16]
+    return f"UE_{ue_version}_{__version__}_{key_hash}"
+
+
+def _get_template_lock_path(templates_dir: Path, key: str) -> Path:
+    """Get lock of templates sharing engine and addon version with key."""
+    version_prefix = key.rsplit("_", 1)[0]
+    return templates_dir / f".{version_prefix}.lock"
+
+
+def get_project_template(key: str):
+    """Get cached project template.
+
+    Returns:
+        Union[Path, None]: Template directory or None if not cached.
+
+    """
+    template_dir = get_cache_dir("project_templates") / key
+    if not (template_dir / "template.json").is_file():
+        return None
+    if not list(template_dir.glob("*.uproject")):
+        return None
+    return template_dir
+
+
+def cache_project_template(project_dir: Path, key: str,
+                           generation_time: float):
+    """Store generated project as template.
+
+    Template is copied to a temporary directory first and renamed to its
+    final location, so concurrent launches never see an incomplete
+    template. Templates of the same engine and addon version with
+    different key are removed as they are no longer valid.
+
+    Caching is best-effort, failure is logged and the project is not
+    affected by it.
+
+    Args:
+        project_dir (Path): Freshly generated project.
+        key (str): Template key, see `get_project_template_key`.
+        generation_time (float): Seconds it took to generate the project.
+
+    Returns:
+        Union[Path, None]: Template directory or None if caching failed.
+
+    """
+    try:
+        templates_dir = get_cache_dir("project_templates")
+        template_dir = templates_dir / key
+        tmp_dir = templates_dir / f".{key}.{os.getpid()}"
+
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        shutil.copytree(
+            project_dir, tmp_dir,
+            ignore=shutil.ignore_patterns(
+                "Saved", "Intermediate", "DerivedDataCache"))
+        with open(tmp_dir / "template.json", "w") as f:
+            json.dump({"key": key, "generation_time": generation_time}, f)
+
+        with file_lock(_get_template_lock_path(templates_dir, key)):
+            try:
+                os.rename(tmp_dir, template_dir)
+            except OSError:
+                # Another launch cached the same template meanwhile
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+            version_prefix = key.rsplit("_", 1)[0] + "_"
+            for stale_dir in templates_dir.glob(f"{version_prefix}*"):
+                if stale_dir.name != key:
+                    shutil.rmtree(stale_dir, ignore_errors=True)
+
+    except Exception as e:
+        print(f"--- Failed to cache project template {key}: {e}")
+        return None
+
+    return template_dir
+
+
+def regenerate_project_id(project_dir: Path):
+    """Set new `ProjectID` in project config.
+
+    Projects cloned from the same template would share the id otherwise.
+
+    Args:
+        project_dir (Path): Project directory.
+
+    """
+    config_path = project_dir / "Config" / "DefaultGame.ini"
+    if not config_path.is_file():
+        return
+    with open(config_path, "r") as f:
+        content = f.read()
+    project_id = uuid.uuid4().hex.upper()
+    content, count = re.subn(
+        r"^ProjectID=.*$", f"ProjectID={project_id}", content,
+        flags=re.MULTILINE)
+    if count:
+        with open(config_path, "w") as f:
+            f.write(content)
+
+
+def clone_project_template(template_dir: Path, project_dir: Path,
+                           project_name: str) -> float:
+    """Create project from cached template.
+
+    Template is locked while cloned, so it is not removed as stale by
+    another launch meanwhile.
+
+    Args:
+        template_dir (Path): Template directory.
+        project_dir (Path): Target project directory.
+        project_name (str): Name of the new project.
+
+    Returns:
+        float: Seconds the template took to generate originally.
+
+    """
+    lock_path = _get_template_lock_path(
+        template_dir.parent, template_dir.name)
+    with file_lock(lock_path):
+        shutil.copytree(
+            template_dir, project_dir, dirs_exist_ok=True,
+            ignore=shutil.ignore_patterns("template.json"))
+        with open(template_dir / "template.json", "r") as f:
+            generation_time = json.load(f).get("generation_time", 0.0)
+
+    project_file = project_dir / f"{project_name}.uproject"
+    for uproject in project_dir.glob("*.uproject"):
+        if uproject != project_file:
+            os.replace(uproject, project_file)
+            break
+
+    regenerate_project_id(project_dir)
+
+    return generation_time
+
+
+def _remove_stale_lock(lock_path: Path, stale_after: float) -> None:
+    """Remove stale lock file without removing a fresh lock of another one.
+
+    Lock file is renamed to a unique name first, so only one waiter takes
+    it, and its age is checked again. If it was refreshed or replaced by
+    a new lock meanwhile, it is restored unless another lock was created
+    in the meantime.
+
+    """
+    taken_path = lock_path.with_name(
+        f"{lock_path.name}.{platform.node()}.{os.getpid()}"
+        f".{threading.get_ident()}.stale")
+    os.rename(lock_path, taken_path)
+    try:
+        if time.time() - taken_path.stat().st_mtime > stale_after:
+            return
+        # Fresh lock, put it back unless another lock exists already
+        with open(taken_path, "rb") as f:
+            owner = f.read()
+        fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        os.write(fd, owner)
+        os.close(fd)
+    except FileExistsError:
+        pass
+    finally:
+        taken_path.unlink()
+
+
+@contextmanager
+def file_lock(lock_path: Path, timeout: float = 600.0,
+              stale_after: float = 3600.0, refresh_interval: float = 60.0):
+    """Hold exclusive lock file for the duration of the context.
+
+    Lock file is created atomically, waiting until another process
+    releases it. Modification time of the lock file is refreshed while
+    the lock is held, lock files not refreshed for `stale_after` seconds
+    are considered left behind by a crashed process and removed.
+
+    Args:
+        lock_path (Path): Path to lock file.
+        timeout (float): Seconds to wait for the lock.
+        stale_after (float): Age in seconds of lock file considered stale.
+        refresh_interval (float): Seconds between refreshes of held lock.
+
+    Raises:
+        TimeoutError: Lock was not acquired in time.
+
+    """
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.time() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > stale_after:
+                    _remove_stale_lock(lock_path, stale_after)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.time() > deadline:
+                raise TimeoutError(f"Timed out waiting for {lock_path}")
+            time.sleep(0.5)
+
+    released = threading.Event()
+
+    def _refresh():
+        while not released.wait(refresh_interval):
+            try:
+                os.utime(lock_path)
+            except OSError:
+                pass
+
+    refresh_thread = threading.Thread(target=_refresh, daemon=True)
+    try:
+        os.write(fd, f"{platform.node()}:{os.getpid()}".encode("utf-8"))
+        os.close(fd)
+        refresh_thread.start()
+        yield lock_path
+    finally:
+        released.set()
+        if refresh_thread.is_alive():
+            refresh_thread.join()
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def get_engine_build_version(engine_path: Path) -> dict:
+    """Get build information of the engine.
+
+    Returns:
+        dict: Content of `Engine/Build/Build.version`, empty if missing.
+
+    """
+    build_version_path = engine_path / "Engine/Build/Build.version"
+    if not build_version_path.is_file():
+        return {}
+    with open(build_version_path, "r") as f:
+        return json.load(f)
+
+
+def get_plugin_build_key(engine_path: Path, plugin_dir: Path) -> str:
+    """Get key of plugin build from its sources and the engine build.
+
+    Args:
+        engine_path (Path): Path to the engine root.
+        plugin_dir (Path): Path to sources of the integration plugin.
+
+    Returns:
+        str: Key usable as directory name.
+
+    """
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([
+        get_engine_build_version(engine_path),
+        platform.system().lower(),
+    ], sort_keys=True).encode("utf-8"))
+
+    for path in sorted(plugin_dir.rglob("*")):
+        relative_path = path.relative_to(plugin_dir)
+        if not path.is_file() or relative_path.parts[0] in {
+            "Binaries", "Intermediate"
+        }:
+            continue
+        hasher.update(relative_path.as_posix().encode("utf-8"))
+        hasher.update(get_file_hash(path).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def get_cached_plugin_build(key: str):
+    """Get cached plugin build.
+
+    Returns:
+        Union[Path, None]: Directory with built plugin or None if not
+            cached.
+
+    """
+    build_dir = get_cache_dir("plugin_builds") / key
+    if not build_dir.is_dir():
+        return None
+    return build_dir
+
+
+def cache_plugin_build(build_dir: Path, config_dir: Path, key: str):
+    """Store built plugin in cache.
+
+    Build is copied to a temporary directory first and renamed to its
+    final location, so other processes never see an incomplete build.
+
+    Caching is best-effort, failure is logged and the built plugin is not
+    affected by it.
+
+    Args:
+        build_dir (Path): Output of `RunUAT BuildPlugin`.
+        config_dir (Path): Config directory of the plugin sources, it's
+            not part of the build output.
+        key (str): Build key, see `get_plugin_build_key`.
+
+    Returns:
+        Union[Path, None]: Cached build directory or None if caching
+            failed.
+
+    """
+    tmp_dir = None
+    try:
+        builds_dir = get_cache_dir("plugin_builds")
+        cached_dir = builds_dir / key
+        tmp_dir = builds_dir / f".{key}.{platform.node()}.{os.getpid()}"
+
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        shutil.copytree(build_dir, tmp_dir)
+        if config_dir.is_dir():
+            shutil.copytree(
+                config_dir, tmp_dir / "Config", dirs_exist_ok=True)
+
+        try:
+            os.rename(tmp_dir, cached_dir)
+        except OSError:
+            # Another process cached the same build meanwhile
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    except Exception as e:
+        print(f"--- Failed to cache plugin build {key}: {e}")
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None
+
+    return cached_dir
+
+
+DDC_PREWARM_STATE_FILE = "ddc_prewarm.json"
+
+
+def get_project_content_hash(project_dir: Path, engine_path: Path,
+                             ue_version: str, ddc_path: str = "") -> str:
+    """Get hash of project content relevant for Derived Data Cache.
+
+    Hash is computed from paths of packages in project content and plugins,
+    so it changes when a project is created and when assets are loaded or
+    removed. Saving existing assets doesn't change it, editor caches their
+    derived data on its own. Engine build and DDC path are part of the hash
+    as derived data of other engine or cache are not reusable.
+
+    Args:
+        project_dir (Path): Unreal project directory.
+        engine_path (Path): Path to the engine root.
+        ue_version (str): Version of the engine.
+        ddc_path (str, optional): Shared DDC path.
+
+    Returns:
+        str: Content hash.
+
+    """
+    content_hash = hashlib.sha1(json.dumps([
+        ue_version,
+        get_engine_info(engine_path, ue_version)["build_id"],
+        ddc_path,
+    ]).encode("utf-8"))
+    packages = []
+    for sub_dir in ("Content", "Plugins"):
+        root = project_dir / sub_dir
+        for dir_path, _, file_names in os.walk(root):
+            for file_name in file_names:
+                if not file_name.endswith((".uasset", ".umap")):
+                    continue
+                file_path = os.path.join(dir_path, file_name)
+                packages.append(
+                    Path(file_path).relative_to(project_dir).as_posix())
+    for package in sorted(packages):
+        content_hash.update(json.dumps(package).encode("utf-8"))
+    return content_hash.hexdigest()
+
+
+def get_ddc_prewarm_state(project_dir: Path) -> dict:
+    """Get state of the last Derived Data Cache pre-warm of project.
+
+    Returns:
+        dict: State with `content_hash` of pre-warmed content, empty if
+            the project was never pre-warmed.
+
+    """
+    state_path = project_dir / "Saved" / "Ayon" / DDC_PREWARM_STATE_FILE
+    try:
+        with open(state_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def set_ddc_prewarm_state(project_dir: Path, content_hash: str,
+                          duration: float) -> Path:
+    """Store state of finished Derived Data Cache pre-warm of project.
+
+    Args:
+        project_dir (Path): Unreal project directory.
+        content_hash (str): Hash of pre-warmed content, see
+            `get_project_content_hash`.
+        duration (float): Seconds the pre-warm took.
+
+    Returns:
+        Path: Path to the state file.
+
+    """
+    state_path = project_dir / "Saved" / "Ayon" / DDC_PREWARM_STATE_FILE
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path.with_name(f".{state_path.name}.{os.getpid()}")
+    with open(tmp_path, "w") as f:
+        json.dump({
+            "content_hash": content_hash,
+            "duration": duration,
+            "time": time.time(),
+        }, f, indent=4)
+    os.replace(tmp_path, state_path)
+    return state_path
+
+
+def fill_ddc(engine_path: Path, ue_version: str, project_file: Path,
+             content_hash: str, ddc_path: str = None) -> bool:
+    """Fill Derived Data Cache of project with commandlet.
+
+    Meant to run in background alongside the editor. Commandlet output is
+    written to `Saved/Ayon/ddc_prewarm.log` of the project and pre-warm
+    state is stored when it succeeds. Pre-warm already running for the
+    project is not started again.
+
+    Args:
+        engine_path (Path): Path to the engine root.
+        ue_version (str): Version of the engine.
+        project_file (Path): Path to the .uproject file.
+        content_hash (str): Hash of project content stored when the fill
+            succeeds, see `get_project_content_hash`.
+        ddc_path (str, optional): Shared DDC path to fill. Engine
+            configured shared cache is used if not set.
+
+    Returns:
+        bool: Whether the fill finished successfully.
+
+    """
+    project_dir = Path(project_file).parent
+    ayon_dir = project_dir / "Saved" / "Ayon"
+    ddc_cmd = [
+        get_engine_info(engine_path, ue_version)["editor"],
+        Path(project_file).as_posix(),
+        "-run=DerivedDataCache",
+        "-fill",
+        "-unattended",
+        "-nosplash",
+    ]
+    if ddc_path:
+        ddc_cmd.append(f"-SharedDataCachePath={ddc_path}")
+
+    try:
+        with file_lock(ayon_dir / "ddc_prewarm.lock", timeout=0):
+            print("--- Filling Derived Data Cache ...")
+            start = time.time()
+            with open(ayon_dir / "ddc_prewarm.log", "w") as log_file:
+                return_code = subprocess.call(
+                    ddc_cmd, stdout=log_file, stderr=subprocess.STDOUT)
+            if return_code != 0:
+                print("--- Failed to pre-warm Derived Data Cache, "
+                      f"exited with return code {return_code}")
+                return False
+            set_ddc_prewarm_state(
+                project_dir, content_hash, time.time() - start)
+    except TimeoutError:
+        print("--- Derived Data Cache pre-warm is already running")
+        return False
+    except OSError as e:
+        print(f"--- Failed to pre-warm Derived Data Cache: {e}")
+        return False
+    return True
+
+
+class LaunchTimings:
+    """Durations of launch phases written to JSON launch log.
+
+    Args:
+        context (dict): Information about the launch stored with timings,
+            e.g. engine version or project name.
+
+    """
+
+    def __init__(self, context: dict = None):
+        self.context = dict(context or {})
+        self.started = time.time()
+        self.phases = []
+
+    def add(self, name: str, duration: float) -> None:
+        self.phases.append({"name": name, "duration": round(duration, 3)})
+
+    @contextmanager
+    def phase(self, name: str):
+        """Measure duration of code in the context as a phase."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add(name, time.time() - start)
+
+    def to_data(self) -> dict:
+        return {
+            "context": self.context,
+            "host": platform.node(),
+            "platform": platform.system().lower(),
+            "started": self.started,
+            "duration": round(time.time() - self.started, 3),
+            "phases": list(self.phases),
+        }
+
+    def write(self) -> Path:
+        """Write launch log to `launch_logs` in cache directory.
+
+        Returns:
+            Path: Path to the written log.
+
+        """
+        started = time.strftime(
+            "%Y%m%dT%H%M%S", time.localtime(self.started))
+        log_path = get_cache_dir("launch_logs") / (
+            f"launch_{started}_{os.getpid()}.json")
+        with open(log_path, "w") as f:
+            json.dump(self.to_data(), f, indent=4)
+        return log_path
@@ -14,6 +14,7 @@ class CreateCamera(UnrealAssetCreator):
     identifier = "io.ayon.creators.unreal.camera"
     label = "Camera"
     product_type = "camera"
+    collect_members = True
     icon = "fa.camera"
 
     def create(self, product_name, instance_data, pre_create_data):
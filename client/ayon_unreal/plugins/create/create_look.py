@@ -17,6 +17,7 @@ class CreateLook(UnrealAssetCreator):
     identifier = "io.ayon.creators.unreal.look"
     label = "Look"
     product_type = "look"
+    collect_members = True
     icon = "paint-brush"
 
     def create(self, product_name, instance_data, pre_create_data):
@@ -10,4 +10,5 @@ class CreateStaticMeshFBX(UnrealAssetCreator):
     identifier = "io.ayon.creators.unreal.staticmeshfbx"
     label = "Static Mesh (FBX)"
     product_type = "staticMesh"
+    collect_members = True
     icon = "cube"
@@ -3,7 +3,9 @@ from pathlib import Path
 
 import unreal
 
+from ayon_core.lib import BoolDef
 from ayon_core.pipeline import CreatorError
+from ayon_unreal.api.pipeline import get_package_file_path
 from ayon_unreal.api.plugin import (
     UnrealAssetCreator,
 )
@@ -15,39 +17,71 @@ class CreateUAsset(UnrealAssetCreator):
     identifier = "io.ayon.creators.unreal.uasset"
     label = "UAsset"
     product_type = "uasset"
+    collect_members = True
     icon = "cube"
 
     extension = ".uasset"
 
     def create(self, product_name, instance_data, pre_create_data):
-        if pre_create_data.get("use_selection"):
-            ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        bundle = bool(pre_create_data.get("bundle"))
+        instance_data.setdefault("creator_attributes", {})["bundle"] = bundle
 
-            sel_objects = unreal.EditorUtilityLibrary.get_selected_assets()
-            selection = [a.get_path_name() for a in sel_objects]
+        if pre_create_data.get("use_selection"):
+            # Asset data of selection, so selected assets are not loaded
+            selection = [
+                f"{asset_data.package_name}.{asset_data.asset_name}"
+                for asset_data in
+                unreal.EditorUtilityLibrary.get_selected_asset_data()
+            ]
+
+            if not selection:
+                raise CreatorError("Please select at least one object.")
+            if len(selection) != 1 and not bundle:
+                raise CreatorError(
+                    "Please select only one object or enable "
+                    "'Include dependencies'.")
 
-            if len(selection) != 1:
-                raise CreatorError("Please select only one object.")
+            for obj in selection:
+                sys_path = get_package_file_path(obj.split(".", 1)[0])
 
-            obj = selection[0]
+                if not sys_path:
+                    raise CreatorError(
+                        f"{Path(obj).name} is not on the disk in project "
+                        "content. Likely it needs to be saved first.")
 
-            asset = ar.get_asset_by_object_path(obj).get_asset()
-            sys_path = unreal.SystemLibrary.get_system_path(asset)
+                if not bundle and Path(sys_path).suffix != self.extension:
+                    raise CreatorError(
+                        f"{Path(sys_path).name} is not a {self.label}.")
 
-            if not sys_path:
-                raise CreatorError(
-                    f"{Path(obj).name} is not on the disk. Likely it needs to"
-                    "be saved first.")
-
-            if Path(sys_path).suffix != self.extension:
-                raise CreatorError(
-                    f"{Path(sys_path).name} is not a {self.label}.")
+            pre_create_data["members"] = selection
 
         super(CreateUAsset, self).create(
             product_name,
             instance_data,
             pre_create_data)
 
+    def get_pre_create_attr_defs(self):
+        return super(CreateUAsset, self).get_pre_create_attr_defs() + [
+            BoolDef(
+                "bundle",
+                label="Include dependencies",
+                tooltip=(
+                    "Publish all selected assets together with all /Game "
+                    "assets they depend on."
+                ),
+                default=False
+            )
+        ]
+
+    def get_instance_attr_defs(self):
+        return [
+            BoolDef(
+                "bundle",
+                label="Include dependencies",
+                default=False
+            )
+        ]
+
 
 class CreateUMap(CreateUAsset):
     """Create Level."""
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Load UAsset."""
 from pathlib import Path
+import ast
+import json
 import os
 import shutil
 
@@ -10,6 +12,7 @@ from ayon_core.pipeline import (
 )
 from ayon_unreal.api import plugin
 from ayon_unreal.api import pipeline as unreal_pipeline
+from ayon_unreal.lib import get_file_hash
 import unreal  # noqa
 
 
@@ -156,3 +159,227 @@ class UMapLoader(UAssetLoader):
     representations = {"umap"}
 
     extension = "umap"
+
+
+class UAssetBundleLoader(UAssetLoader):
+    """Load UAsset bundle.
+
+    Packages of the bundle are restored to their original paths in project
+    content so references between them stay valid. Only the container is
+    created in Ayon asset directory.
+
+    Container stores all packages of the bundle in `bundle_packages` and
+    packages created by the loader in `created_packages`. Packages which
+    already were in the project are reused and never overwritten or
+    deleted by the loader.
+    """
+
+    product_types = {"uasset"}
+    label = "Load UAsset Bundle"
+    representations = {"bundle"}
+
+    def _restore_bundle(self, manifest_path, owned_packages=None):
+        """Copy bundle packages to project content and register them.
+
+        Missing packages are created. Packages created by the container
+        before are updated if their hash differs, they are unloaded first
+        so the editor doesn't keep stale data. Other existing packages are
+        kept as they are. All restored files are scanned by Asset Registry
+        at once.
+
+        Args:
+            manifest_path (str): Path to bundle manifest.
+            owned_packages (Optional[set[str]]): Packages created by the
+                container on previous load.
+
+        Returns:
+            tuple[list[str], list[str]]: Package names of the bundle and
+                package names created or owned by the container.
+        """
+        owned_packages = owned_packages or set()
+        with open(manifest_path, "r") as fp:
+            manifest = json.load(fp)
+
+        content_dir = Path(unreal.Paths.project_content_dir()).as_posix()
+        manifest_dir = os.path.dirname(manifest_path)
+        to_restore = []
+        to_unload = []
+        created = []
+        for entry in manifest["packages"]:
+            package_name = entry["package"]
+            src = os.path.join(manifest_dir, entry["file"])
+            ext = os.path.splitext(src)[1]
+            dst = f"{content_dir}/{package_name[len('/Game/'):]}{ext}"
+
+            if not os.path.isfile(dst):
+                created.append(package_name)
+                to_restore.append((src, dst))
+                continue
+
+            if package_name not in owned_packages:
+                # Existing project content is never overwritten
+                algorithm, _, file_hash = entry["hash"].partition(":")
+                if get_file_hash(dst, algorithm=algorithm) != file_hash:
+                    self.log.warning(
+                        f"{package_name} already exists in the project "
+                        "and differs from the published one, keeping the "
+                        "project version.")
+                continue
+
+            created.append(package_name)
+            algorithm, _, file_hash = entry["hash"].partition(":")
+            if get_file_hash(dst, algorithm=algorithm) != file_hash:
+                to_unload.append(package_name)
+                to_restore.append((src, dst))
+
+        self._unload_packages(to_unload)
+        for src, dst in to_restore:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            shutil.copy(src, dst)
+
+        if to_restore:
+            ar = unreal.AssetRegistryHelpers.get_asset_registry()
+            ar.scan_files_synchronous([dst for _, dst in to_restore], True)
+        self.log.info(
+            f"Restored {len(to_restore)} of {len(manifest['packages'])} "
+            "bundle packages.")
+
+        packages = [entry["package"] for entry in manifest["packages"]]
+        return packages, created
+
+    @staticmethod
+    def _unload_packages(package_names):
+        """Unload packages from memory before their files are replaced."""
+        packages = []
+        for package_name in package_names:
+            package = unreal.find_package(package_name)
+            if package:
+                packages.append(package)
+        if packages and not (
+            unreal.EditorLoadingAndSavingUtils.unload_packages(packages)
+        ):
+            raise RuntimeError(
+                "Failed to unload bundle packages before update: "
+                f"{', '.join(package_names)}")
+
+    def load(self, context, name, namespace, options):
+        """Restore bundle and containerise it in Content Browser.
+
+        Args:
+            context (dict): application context
+            name (str): Product name
+            namespace (str): Not used, set by the loader.
+            options (dict): Not used.
+
+        Returns:
+            list(str): list of bundle packages
+        """
+        root = unreal_pipeline.AYON_ASSET_DIR
+        folder_path = context["folder"]["path"]
+        folder_name = context["folder"]["name"]
+        suffix = "_CON"
+        tools = unreal.AssetToolsHelpers().get_asset_tools()
+        asset_dir, container_name = tools.create_unique_asset_name(
+            f"{root}/{folder_name}/{name}", suffix=""
+        )
+
+        unique_number = 1
+        while unreal.EditorAssetLibrary.does_directory_exist(
+            f"{asset_dir}_{unique_number:02}"
+        ):
+            unique_number += 1
+
+        asset_dir = f"{asset_dir}_{unique_number:02}"
+        container_name = f"{container_name}_{unique_number:02}{suffix}"
+
+        unreal.EditorAssetLibrary.make_directory(asset_dir)
+
+        packages, created = self._restore_bundle(
+            self.filepath_from_context(context))
+
+        unreal_pipeline.create_container(
+            container=container_name, path=asset_dir)
+
+        product_type = context["product"]["productType"]
+        data = {
+            "schema": "ayon:container-2.0",
+            "id": AYON_CONTAINER_ID,
+            "namespace": asset_dir,
+            "folder_path": folder_path,
+            "container_name": container_name,
+            "asset_name": name,
+            "loader": str(self.__class__.__name__),
+            "representation": context["representation"]["id"],
+            "parent": context["representation"]["versionId"],
+            "product_type": product_type,
+            "bundle_packages": packages,
+            "created_packages": created,
+            # TODO these should be probably removed
+            "asset": folder_path,
+            "family": product_type,
+        }
+        unreal_pipeline.imprint(f"{asset_dir}/{container_name}", data)
+
+        unreal.EditorAssetLibrary.save_directory(asset_dir)
+
+        return packages
+
+    def update(self, container, context):
+        repre_entity = context["representation"]
+
+        owned_packages = set(
+            self._get_container_packages(container, "created_packages"))
+        packages, created = self._restore_bundle(
+            get_representation_path(repre_entity), owned_packages)
+
+        # Remove created packages which are not part of the new version
+        self._delete_packages(
+            container, owned_packages.difference(packages))
+
+        container_path = f'{container["namespace"]}/{container["objectName"]}'
+        unreal_pipeline.imprint(
+            container_path,
+            {
+                "representation": repre_entity["id"],
+                "parent": repre_entity["versionId"],
+                "bundle_packages": packages,
+                "created_packages": created,
+            }
+        )
+
+    def remove(self, container):
+        self._delete_packages(
+            container,
+            self._get_container_packages(container, "created_packages"))
+
+        super(UAssetBundleLoader, self).remove(container)
+
+    def _delete_packages(self, container, package_names):
+        """Delete packages created by container if no other bundle uses them.
+
+        Args:
+            container (dict): Container which created the packages.
+            package_names (Iterable[str]): Packages to delete.
+        """
+        used_packages = set()
+        for other in unreal_pipeline.ls():
+            if other.get("namespace") == container.get("namespace"):
+                continue
+            used_packages.update(
+                self._get_container_packages(other, "bundle_packages"))
+
+        for package_name in package_names:
+            if package_name in used_packages:
+                self.log.info(
+                    f"Keeping {package_name}, other bundle uses it.")
+                continue
+            if unreal.EditorAssetLibrary.does_asset_exist(package_name):
+                unreal.EditorAssetLibrary.delete_asset(package_name)
+
+    @staticmethod
+    def _get_container_packages(container, key):
+        packages = container.get(key) or []
+        if isinstance(packages, str):
+            # Metadata values are read back as strings
+            packages = ast.literal_eval(packages)
+        return packages
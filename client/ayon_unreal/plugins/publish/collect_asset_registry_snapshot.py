@@ -0,0 +1,27 @@
+import pyblish.api
+
+from ayon_unreal.api.pipeline import get_asset_data_snapshot
+
+
+class CollectAssetRegistrySnapshot(pyblish.api.ContextPlugin):
+    """Collect asset registry data of all instance members.
+
+    Members of all instances are queried once and stored in
+    `assetRegistrySnapshot` of the context by their object path, so later
+    plugins don't need to query the registry or load assets to get their
+    class, package, dependencies or path on disk.
+    """
+
+    order = pyblish.api.CollectorOrder + 0.15
+    hosts = ["unreal"]
+    label = "Collect Asset Registry Snapshot"
+
+    def process(self, context):
+        object_paths = []
+        for instance in context:
+            object_paths.extend(instance.data.get("members") or [])
+
+        snapshot = get_asset_data_snapshot(object_paths)
+        self.log.debug(f"Collected asset data of {len(snapshot)} assets.")
+
+        context.data["assetRegistrySnapshot"] = snapshot
@@ -11,7 +11,6 @@ from ayon_unreal.api.pipeline import UNREAL_VERSION
 from ayon_unreal.api.rendering import (
     SUPPORTED_EXTENSION_MAP,
     get_render_config,
-    set_output_extension_from_settings
 )
 
 
@@ -46,19 +45,25 @@ class CollectUnrealRemoteRender(publish.AbstractCollectRender):
 
         project_name = context.data["projectName"]
         project_settings = context.data['project_settings']
-        config_path, config = get_render_config(project_name, project_settings)
+        # Farm renders with the saved config asset, so expected files
+        # must come from the asset itself and not from a prepared copy.
+        config_path, config = get_render_config(
+            project_name, project_settings)
         if not config:
             raise RuntimeError("Please provide stored render config at path "
                 "set in `ayon+settings://unreal/render_config_path`")
 
-        output_ext_from_settings = project_settings["unreal"]["render_format"]
-        config = set_output_extension_from_settings(output_ext_from_settings,
-                                                    config)
-
         ext = self._get_ext_from_config(config)
         if not ext:
             raise RuntimeError("Please provide output extension in config!")
 
+        render_format = project_settings["unreal"].get("render_format")
+        if render_format and render_format.lower() != ext:
+            self.log.warning(
+                f"Render config `{config_path}` outputs `{ext}` but "
+                f"`{render_format}` is set in settings. Farm renders "
+                f"`{ext}` as stored in the config.")
+
         output_settings = config.find_or_add_setting_by_class(
             unreal.MoviePipelineOutputSetting)
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import unreal  # noqa
 import pyblish.api
-from ayon_unreal.api.pipeline import get_frame_range
+from ayon_unreal.api.pipeline import get_asset_class_name, get_frame_range
 
 
 class CollectFrameRange(pyblish.api.InstancePlugin):
@@ -17,7 +17,7 @@ class CollectFrameRange(pyblish.api.InstancePlugin):
             ar = unreal.AssetRegistryHelpers.get_asset_registry()
             data = ar.get_asset_by_object_path(member)
             is_level_sequence = (
-                data.asset_class_path.asset_name == "LevelSequence")
+                get_asset_class_name(data) == "LevelSequence")
             if is_level_sequence:
                 sequence = data.get_asset()
                 frameStart, frameEnd = get_frame_range(sequence)
@@ -2,6 +2,8 @@ import unreal
 
 import pyblish.api
 
+from ayon_unreal.api.pipeline import get_members_hash
+
 
 class CollectInstanceMembers(pyblish.api.InstancePlugin):
     """
@@ -43,4 +45,9 @@ class CollectInstanceMembers(pyblish.api.InstancePlugin):
 
         self.log.debug(f"Members: {members}")
 
+        members_hash = instance.data.get("members_hash")
+        if members_hash and members_hash != get_members_hash(members):
+            self.log.warning(
+                "Members of the instance changed since it was created.")
+
         instance.data["members"] = members
@@ -1,10 +1,12 @@
-from pathlib import Path
+import json
+import os
 
 import unreal
 
 from ayon_core.pipeline import get_current_project_name
 from ayon_core.pipeline import Anatomy
 from ayon_unreal.api import pipeline
+from ayon_unreal.api.rendering import RenderTelemetry, get_frame_index
 import pyblish.api
 
 
@@ -13,6 +15,11 @@ class CollectRenderFiles(pyblish.api.InstancePlugin):
 
     Secondary step after local rendering. Should collect all rendered files and
     add them as representation.
+
+    Each output directory is scanned only once and only files with extension
+    of configured render format are collected. Representation stores frame
+    index with sorted frame numbers, padding and file name pattern, so
+    validators don't need to parse file names again.
     """
     order = pyblish.api.CollectorOrder
     hosts = ["unreal"]
@@ -26,6 +33,18 @@ class CollectRenderFiles(pyblish.api.InstancePlugin):
         data = instance.data
         data['remove'] = True
 
+        render_format = context.data["project_settings"]["unreal"].get(
+            "render_format", "png")
+
+        try:
+            project = get_current_project_name()
+            anatomy = Anatomy(project)
+            root = anatomy.roots['renders']
+        except Exception as e:
+            raise Exception((
+                "Could not find render root "
+                "in anatomy settings.")) from e
+
         ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
         sequence = ar.get_asset_by_object_path(
@@ -57,6 +76,16 @@ class CollectRenderFiles(pyblish.api.InstancePlugin):
                     seq = s.get('sequence')
                     seq_name = seq.get_name()
 
+                    render_dir = f"{root}/{project}/{s.get('output')}"
+
+                    # Instance is created only for rendered frames
+                    frame_index = get_frame_index(
+                        render_dir, seq_name, render_format)
+                    if not frame_index:
+                        self.log.warning(
+                            f"No rendered frames found in {render_dir}")
+                        continue
+
                     product_type = "render"
                     new_product_name = f"{data.get('productName')}_{seq_name}"
                     new_instance = context.create_instance(
@@ -84,33 +113,27 @@ class CollectRenderFiles(pyblish.api.InstancePlugin):
 
                     self.log.debug(f"new instance data: {new_data}")
 
-                    try:
-                        project = get_current_project_name()
-                        anatomy = Anatomy(project)
-                        root = anatomy.roots['renders']
-                    except Exception as e:
-                        raise Exception((
-                            "Could not find render root "
-                            "in anatomy settings.")) from e
-
-                    render_dir = f"{root}/{project}/{s.get('output')}"
-                    render_path = Path(render_dir)
-
-                    frames = []
-
-                    for x in render_path.iterdir():
-                        if x.is_file() and x.suffix == '.png':
-                            frames.append(str(x.name))
+                    telemetry_path = os.path.join(
+                        render_dir, RenderTelemetry.file_name)
+                    if os.path.isfile(telemetry_path):
+                        with open(telemetry_path, "r") as f:
+                            new_data["renderTelemetry"] = json.load(f)
 
                     if "representations" not in new_instance.data:
                         new_instance.data["representations"] = []
 
+                    ext = frame_index["ext"]
                     repr = {
                         'frameStart': instance.data["frameStart"],
                         'frameEnd': instance.data["frameEnd"],
-                        'name': 'png',
-                        'ext': 'png',
-                        'files': frames,
+                        'name': ext,
+                        'ext': ext,
+                        'files': frame_index["files"],
+                        'frameIndex': {
+                            "frames": frame_index["frames"],
+                            "padding": frame_index["padding"],
+                            "pattern": frame_index["pattern"],
+                        },
                         'stagingDir': render_dir,
                         'tags': ['review']
                     }
@@ -7,6 +7,7 @@ import unreal
 from ayon_core.pipeline import publish
 from ayon_unreal.api.pipeline import (
     UNREAL_VERSION,
+    get_asset_class_name,
     select_camera
 )
 
@@ -39,11 +40,8 @@ class ExtractCamera(publish.Extractor):
 
         for member in instance.data.get('members'):
             data = ar.get_asset_by_object_path(member)
-            if UNREAL_VERSION.major == 5:
-                is_level_sequence = (
-                    data.asset_class_path.asset_name == "LevelSequence")
-            else:
-                is_level_sequence = (data.asset_class == "LevelSequence")
+            is_level_sequence = (
+                get_asset_class_name(data) == "LevelSequence")
 
             if is_level_sequence:
                 sequence = data.get_asset()
@@ -34,6 +34,9 @@ class ExtractLayout(publish.Extractor):
         json_data = []
         project_name = instance.context.data["projectName"]
 
+        # Collect meshes first so containers and representations can be
+        # resolved in batches for all actors.
+        actor_meshes = []
         for member in instance[:]:
             actor = ell.get_actor_reference(member)
             mesh = None
@@ -45,54 +48,72 @@ class ExtractLayout(publish.Extractor):
                 mesh = actor.static_mesh_component.static_mesh
 
             if mesh:
-                # Search the reference to the Asset Container for the object
                 path = unreal.Paths.get_path(mesh.get_path_name())
-                filter = unreal.ARFilter(
-                    class_names=["AyonAssetContainer"], package_paths=[path])
-                ar = unreal.AssetRegistryHelpers.get_asset_registry()
-                try:
-                    asset_container = ar.get_assets(filter)[0].get_asset()
-                except IndexError:
-                    self.log.error("AssetContainer not found.")
-                    return
-
-                parent_id = eal.get_metadata_tag(asset_container, "parent")
-                family = eal.get_metadata_tag(asset_container, "family")
-
-                self.log.info("Parent: {}".format(parent_id))
-                blend = ayon_api.get_representation_by_name(
-                    project_name, "blend", parent_id, fields={"id"}
-                )
-                blend_id = blend["id"]
-
-                json_element = {}
-                json_element["reference"] = str(blend_id)
-                json_element["family"] = family
-                json_element["product_type"] = family
-                json_element["instance_name"] = actor.get_name()
-                json_element["asset_name"] = mesh.get_name()
-                import_data = mesh.get_editor_property("asset_import_data")
-                json_element["file_path"] = import_data.get_first_filename()
-                transform = actor.get_actor_transform()
-
-                json_element["transform"] = {
-                    "translation": {
-                        "x": -transform.translation.x,
-                        "y": transform.translation.y,
-                        "z": transform.translation.z
-                    },
-                    "rotation": {
-                        "x": math.radians(transform.rotation.euler().x),
-                        "y": math.radians(transform.rotation.euler().y),
-                        "z": math.radians(180.0 - transform.rotation.euler().z)
-                    },
-                    "scale": {
-                        "x": transform.scale3d.x,
-                        "y": transform.scale3d.y,
-                        "z": transform.scale3d.z
-                    }
+                actor_meshes.append((actor, mesh, path))
+
+        containers_by_path = self._get_containers_by_path(
+            {path for _, _, path in actor_meshes})
+
+        missing = {
+            path for _, _, path in actor_meshes
+            if path not in containers_by_path
+        }
+        if missing:
+            self.log.error(
+                "AssetContainer not found for: {}".format(
+                    ", ".join(sorted(missing))))
+            return
+
+        parent_ids = {
+            parent_id for parent_id, _ in containers_by_path.values()
+        }
+        blend_ids_by_version_id = {
+            repre["versionId"]: repre["id"]
+            for repre in ayon_api.get_representations(
+                project_name,
+                representation_names={"blend"},
+                version_ids=parent_ids,
+                fields={"id", "versionId"}
+            )
+        }
+
+        for actor, mesh, path in actor_meshes:
+            parent_id, family = containers_by_path[path]
+            blend_id = blend_ids_by_version_id.get(parent_id)
+            if blend_id is None:
+                self.log.error(
+                    "Blend representation not found for version "
+                    "{}.".format(parent_id))
+                return
+
+            json_element = {}
+            json_element["reference"] = str(blend_id)
+            json_element["family"] = family
+            json_element["product_type"] = family
+            json_element["instance_name"] = actor.get_name()
+            json_element["asset_name"] = mesh.get_name()
+            import_data = mesh.get_editor_property("asset_import_data")
+            json_element["file_path"] = import_data.get_first_filename()
+            transform = actor.get_actor_transform()
+
+            json_element["transform"] = {
+                "translation": {
+                    "x": -transform.translation.x,
+                    "y": transform.translation.y,
+                    "z": transform.translation.z
+                },
+                "rotation": {
+                    "x": math.radians(transform.rotation.euler().x),
+                    "y": math.radians(transform.rotation.euler().y),
+                    "z": math.radians(180.0 - transform.rotation.euler().z)
+                },
+                "scale": {
+                    "x": transform.scale3d.x,
+                    "y": transform.scale3d.y,
+                    "z": transform.scale3d.z
                 }
-                json_data.append(json_element)
+            }
+            json_data.append(json_element)
 
         json_filename = "{}.json".format(instance.name)
         json_path = os.path.join(staging_dir, json_filename)
@@ -110,3 +131,33 @@ class ExtractLayout(publish.Extractor):
             "stagingDir": staging_dir,
         }
         instance.data["representations"].append(json_representation)
+
+    @staticmethod
+    def _get_containers_by_path(paths):
+        """Get container data for package paths with single registry query.
+
+        Args:
+            paths (set[str]): Package paths of the meshes.
+
+        Returns:
+            dict[str, tuple[str, str]]: Parent version id and family of
+                the container by its package path.
+        """
+        if not paths:
+            return {}
+
+        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        filter = unreal.ARFilter(
+            class_names=["AyonAssetContainer"], package_paths=list(paths))
+
+        containers_by_path = {}
+        for asset_data in ar.get_assets(filter):
+            path = str(asset_data.package_path)
+            if path in containers_by_path:
+                continue
+            asset_container = asset_data.get_asset()
+            containers_by_path[path] = (
+                eal.get_metadata_tag(asset_container, "parent"),
+                eal.get_metadata_tag(asset_container, "family")
+            )
+        return containers_by_path
@@ -6,20 +6,35 @@ import unreal
 from unreal import MaterialEditingLibrary as mat_lib
 
 from ayon_core.pipeline import publish
+from ayon_core.pipeline.publish import KnownPublishError
+from ayon_unreal.lib import get_file_hash, transfer_file
 
 
 class ExtractLook(publish.Extractor):
-    """Extract look."""
+    """Extract look.
+
+    Textures shared by several members are exported only once. Exported
+    textures are cached in Saved directory of the project with hashes of
+    their source packages, so texture is not exported again when its
+    package didn't change since the last publish.
+    """
 
     label = "Extract Look"
     hosts = ["unreal"]
     families = ["look"]
     optional = True
 
+    texture_cache_dir = "Ayon/texture_cache"
+    texture_hashes_file = "texture_hashes.json"
+
     def process(self, instance):
         # Define extract output file path
         staging_dir = self.staging_dir(instance)
         resources_dir = instance.data["resourcesDir"]
+        texture_format = (
+            instance.context.data["project_settings"]["unreal"]
+            .get("look_texture_format", "tga")
+        )
 
         ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
@@ -27,6 +42,18 @@ class ExtractLook(publish.Extractor):
 
         json_data = []
 
+        cache_dir = os.path.join(
+            unreal.Paths.project_saved_dir(), self.texture_cache_dir)
+        texture_hashes_path = os.path.join(
+            cache_dir, self.texture_hashes_file)
+        texture_hashes = {}
+        if os.path.isfile(texture_hashes_path):
+            with open(texture_hashes_path, "r") as fp:
+                texture_hashes = json.load(fp)
+
+        # Texture filename by texture path name
+        exported_textures = {}
+
         for member in instance:
             asset = ar.get_asset_by_object_path(member)
             obj = asset.get_asset()
@@ -47,28 +74,25 @@ class ExtractLook(publish.Extractor):
                 material, base_color_name)
 
             if texture:
-                # Export Texture
-                tga_filename = f"{instance.name}_{name}_texture.tga"
-
-                tga_exporter = unreal.TextureExporterTGA()
-
-                tga_export_task = unreal.AssetExportTask()
-
-                tga_export_task.set_editor_property('exporter', tga_exporter)
-                tga_export_task.set_editor_property('automated', True)
-                tga_export_task.set_editor_property('object', texture)
-                tga_export_task.set_editor_property(
-                    'filename', f"{staging_dir}/{tga_filename}")
-                tga_export_task.set_editor_property('prompt', False)
-                tga_export_task.set_editor_property('selected', False)
-
-                unreal.Exporter.run_asset_export_task(tga_export_task)
-
-                json_element['tga_filename'] = tga_filename
-
-                transfers.append((
-                    f"{staging_dir}/{tga_filename}",
-                    f"{resources_dir}/{tga_filename}"))
+                texture_path = texture.get_path_name()
+                texture_filename = exported_textures.get(texture_path)
+                if texture_filename is None:
+                    # Named by the first member using the texture
+                    texture_filename = (
+                        f"{instance.name}_{name}_texture.{texture_format}")
+                    exported_textures[texture_path] = texture_filename
+                    self._export_texture(
+                        texture, cache_dir, texture_format,
+                        f"{staging_dir}/{texture_filename}",
+                        texture_hashes)
+
+                    transfers.append((
+                        f"{staging_dir}/{texture_filename}",
+                        f"{resources_dir}/{texture_filename}"))
+
+                json_element['texture_filename'] = texture_filename
+                # Read by look loaders, kept for any texture format
+                json_element['tga_filename'] = texture_filename
 
             fbx_filename = f"{instance.name}_{name}.fbx"
 
@@ -83,7 +107,7 @@ class ExtractLook(publish.Extractor):
             task.set_editor_property('exporter', fbx_exporter)
             task.set_editor_property('options', options)
             task.set_editor_property('automated', True)
-            task.set_editor_property('object', object)
+            task.set_editor_property('object', obj)
             task.set_editor_property(
                 'filename', f"{staging_dir}/{fbx_filename}")
             task.set_editor_property('prompt', False)
@@ -99,6 +123,15 @@ class ExtractLook(publish.Extractor):
 
             json_data.append(json_element)
 
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{texture_hashes_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump(texture_hashes, fp, indent=4)
+        os.replace(tmp_path, texture_hashes_path)
+
+        self.log.debug(
+            f"Exported {len(exported_textures)} unique textures.")
+
         json_filename = f"{instance.name}.json"
         json_path = os.path.join(staging_dir, json_filename)
 
@@ -119,3 +152,67 @@ class ExtractLook(publish.Extractor):
 
         instance.data["representations"].append(json_representation)
         instance.data["transfers"].extend(transfers)
+
+    def _export_texture(
+        self, texture, cache_dir, texture_format, filepath, texture_hashes
+    ):
+        """Export texture to cache unless cached file is up to date.
+
+        The cached file is then transferred to the staging directory.
+
+        Args:
+            texture (unreal.Texture): Texture to export.
+            cache_dir (str): Texture cache directory.
+            texture_format (str): Extension of exported texture.
+            filepath (str): Path of texture file in staging directory.
+            texture_hashes (dict[str, dict]): Package hash and format of
+                cached textures by texture path. Updated after export.
+        """
+        texture_path = texture.get_path_name()
+        package_path = texture_path.split(".")[0].strip("/")
+        cache_path = os.path.join(
+            cache_dir, f"{package_path}.{texture_format}")
+        sys_path = unreal.SystemLibrary.get_system_path(texture)
+        package_hash = get_file_hash(sys_path) if sys_path else None
+
+        cached = texture_hashes.get(texture_path) or {}
+        if (
+            package_hash
+            and os.path.isfile(cache_path)
+            and cached.get("hash") == package_hash
+            and cached.get("format") == texture_format
+        ):
+            self.log.debug(f"{texture_path} is up to date, skipping export.")
+        else:
+            # Outdated file must not pass for a successful export
+            texture_hashes.pop(texture_path, None)
+            if os.path.isfile(cache_path):
+                os.remove(cache_path)
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Other exporters are picked by Unreal based on the file
+            # extension
+            export_task = unreal.AssetExportTask()
+            if texture_format == "tga":
+                export_task.set_editor_property(
+                    'exporter', unreal.TextureExporterTGA())
+            export_task.set_editor_property('automated', True)
+            export_task.set_editor_property('object', texture)
+            export_task.set_editor_property('filename', cache_path)
+            export_task.set_editor_property('prompt', False)
+            export_task.set_editor_property('selected', False)
+
+            if (
+                not unreal.Exporter.run_asset_export_task(export_task)
+                or not os.path.isfile(cache_path)
+            ):
+                raise KnownPublishError(
+                    f"Failed to export texture {texture_path} "
+                    f"to {cache_path}.")
+
+            if package_hash:
+                texture_hashes[texture_path] = {
+                    "hash": package_hash,
+                    "format": texture_format,
+                }
+
+        transfer_file(cache_path, filepath)
@@ -1,23 +1,48 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import shutil
-
-import unreal
 
 from ayon_core.pipeline import publish
+from ayon_core.pipeline.publish import KnownPublishError
+from ayon_unreal.api.pipeline import (
+    get_asset_data_snapshot,
+    get_dependency_closure,
+    get_package_file_path,
+)
+from ayon_unreal.lib import transfer_file
 
 
 class ExtractUAsset(publish.Extractor):
-    """Extract a UAsset."""
+    """Extract a UAsset.
+
+    The asset file is cloned to staging directory when the filesystem
+    supports copy-on-write, it is copied otherwise. Content hash of the
+    file is stored on the representation under `hashes`, keyed by file
+    name.
+
+    With `bundle` creator attribute enabled all members are published
+    together with all `/Game` packages they depend on. Package files keep
+    their path relative to project content directory and are listed in
+    `bundle` manifest representation which is used by loader to restore
+    them.
+    """
 
     label = "Extract UAsset"
     hosts = ["unreal"]
     families = ["uasset", "umap"]
     optional = True
 
+    hash_algorithm = "sha256"
+    max_workers = 8
+
     def process(self, instance):
+        if instance.data.get("creator_attributes", {}).get("bundle"):
+            self._process_bundle(instance)
+            return
+
         extension = (
             "umap" if "umap" in instance.data.get("families") else "uasset")
-        ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
         self.log.debug("Performing extraction..")
         staging_dir = self.staging_dir(instance)
@@ -30,11 +55,22 @@ class ExtractUAsset(publish.Extractor):
         # UAsset publishing supports only one member
         obj = members[0]
 
-        asset = ar.get_asset_by_object_path(obj).get_asset()
-        sys_path = unreal.SystemLibrary.get_system_path(asset)
+        snapshot = get_asset_data_snapshot(
+            [obj], instance.context.data.get("assetRegistrySnapshot"))
+        sys_path = (
+            snapshot.get(obj, {}).get("system_path")
+            or get_package_file_path(obj.split(".", 1)[0])
+        )
+        if not sys_path:
+            raise RuntimeError(
+                f"{obj} is not on the disk. Likely it needs to be saved "
+                "first.")
         filename = Path(sys_path).name
 
-        shutil.copy(sys_path, staging_dir)
+        method, file_hash = transfer_file(
+            sys_path, os.path.join(staging_dir, filename),
+            hash_algorithm=self.hash_algorithm)
+        self.log.debug(f"Transferred {filename} to staging using {method}")
 
         self.log.info(f"instance.data: {instance.data}")
 
@@ -46,5 +82,96 @@ class ExtractUAsset(publish.Extractor):
             "ext": extension,
             "files": filename,
             "stagingDir": staging_dir,
+            "hashes": {filename: f"{self.hash_algorithm}:{file_hash}"},
+        }
+        instance.data["representations"].append(representation)
+
+    def _process_bundle(self, instance):
+        self.log.debug("Performing bundle extraction..")
+        staging_dir = self.staging_dir(instance)
+
+        members = instance.data.get("members", [])
+
+        if not members:
+            raise RuntimeError("No members found in instance.")
+
+        snapshot = get_asset_data_snapshot(
+            members, instance.context.data.get("assetRegistrySnapshot"))
+        package_names = {
+            asset_data["package_name"] for asset_data in snapshot.values()
+        }
+        packages = get_dependency_closure(package_names)
+
+        files = {}
+        for package_name in packages:
+            if not package_name.startswith("/Game/"):
+                raise RuntimeError(
+                    f"{package_name} is not in project content directory.")
+            sys_path = get_package_file_path(package_name)
+            if not sys_path:
+                raise RuntimeError(
+                    f"{package_name} is not on the disk. Likely it needs "
+                    "to be saved first.")
+            relative_path = (
+                package_name[len("/Game/"):] + os.path.splitext(sys_path)[1])
+            files[package_name] = (sys_path, relative_path)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = dict(zip(files, pool.map(
+                lambda item: self._stage_file(staging_dir, *item),
+                files.values()
+            )))
+
+        # Package files are integrated to resources of the version, manifest
+        # stores their path relative to the published manifest.
+        resources_dir = instance.data.get("resourcesDir")
+        publish_dir = instance.data.get("publishDir")
+        if not resources_dir or not publish_dir:
+            raise KnownPublishError(
+                "Resources directory of the instance is not collected, "
+                "bundle package files can't be published.")
+        resources_rel = os.path.relpath(resources_dir, publish_dir)
+        transfers = instance.data.setdefault("transfers", [])
+        package_entries = []
+        for package_name, (_, relative_path) in files.items():
+            method, file_hash = results[package_name]
+            self.log.debug(
+                f"Transferred {relative_path} to staging using {method}")
+            transfers.append((
+                os.path.join(staging_dir, relative_path),
+                os.path.join(resources_dir, relative_path)
+            ))
+            package_entries.append({
+                "package": package_name,
+                "file": Path(resources_rel, relative_path).as_posix(),
+                "hash": f"{self.hash_algorithm}:{file_hash}",
+            })
+
+        manifest_name = "bundle.json"
+        with open(os.path.join(staging_dir, manifest_name), "w") as fp:
+            json.dump({
+                "members": sorted(members),
+                "packages": package_entries,
+            }, fp, indent=4)
+
+        self.log.info(
+            f"Bundled {len(members)} member(s) with "
+            f"{len(packages) - len(package_names)} dependencies.")
+
+        if "representations" not in instance.data:
+            instance.data["representations"] = []
+
+        representation = {
+            "name": "bundle",
+            "ext": "json",
+            "files": manifest_name,
+            "stagingDir": staging_dir,
         }
         instance.data["representations"].append(representation)
+
+    def _stage_file(self, staging_dir, sys_path, relative_path):
+        """Transfer package file to staging keeping its relative path."""
+        dst = os.path.join(staging_dir, relative_path)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        return transfer_file(
+            sys_path, dst, hash_algorithm=self.hash_algorithm)
@@ -3,6 +3,7 @@
 import pyblish.api
 import unreal
 from ayon_core.pipeline.publish import PublishValidationError, RepairAction
+from ayon_unreal.api.pipeline import get_asset_class_name
 
 
 class ValidateCameraTracks(pyblish.api.InstancePlugin):
@@ -27,7 +28,7 @@ class ValidateCameraTracks(pyblish.api.InstancePlugin):
         for member in members:
             data = ar.get_asset_by_object_path(member)
             is_level_sequence = (
-                data.asset_class_path.asset_name == "LevelSequence")
+                get_asset_class_name(data) == "LevelSequence")
             if not is_level_sequence:
                 invalid.append(
                     "The published assets must be Level Sequence")
@@ -68,7 +69,7 @@ class ValidateCameraTracks(pyblish.api.InstancePlugin):
         for member in members:
             data = ar.get_asset_by_object_path(member)
             is_level_sequence = (
-                data.asset_class_path.asset_name == "LevelSequence")
+                get_asset_class_name(data) == "LevelSequence")
             if is_level_sequence:
                 sequence = data.get_asset()
                 sequence.add_master_track(unreal.MovieSceneCameraCutTrack)
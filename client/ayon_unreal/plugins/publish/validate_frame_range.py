@@ -10,6 +10,7 @@ from ayon_core.pipeline.publish import (
     KnownPublishError
 )
 from ayon_unreal.api.pipeline import (
+    get_asset_class_name,
     get_frame_range_from_folder_attributes,
     get_camera_tracks
 )
@@ -72,7 +73,7 @@ class ValidateFrameRange(pyblish.api.InstancePlugin,
             ar = unreal.AssetRegistryHelpers.get_asset_registry()
             data = ar.get_asset_by_object_path(member)
             is_level_sequence = (
-                data.asset_class_path.asset_name == "LevelSequence")
+                get_asset_class_name(data) == "LevelSequence")
             if is_level_sequence:
                 sequence = data.get_asset()
                 camera_tracks = get_camera_tracks(sequence)
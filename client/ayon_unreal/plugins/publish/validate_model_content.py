@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-import unreal
 import pyblish.api
 from ayon_core.pipeline.publish import PublishValidationError
+from ayon_unreal.api.pipeline import get_asset_data_snapshot
 
 
 class ValidateNoDependencies(pyblish.api.InstancePlugin):
@@ -16,10 +16,11 @@ class ValidateNoDependencies(pyblish.api.InstancePlugin):
     def process(self, instance):
         invalid_asset = []
         members = set(instance.data.get("members", []))
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        snapshot = get_asset_data_snapshot(
+            members, instance.context.data.get("assetRegistrySnapshot"))
         for member in members:
-            asset = asset_registry.get_asset_by_object_path(member).get_asset()
-            if asset.get_class().get_name() != "StaticMesh":
+            asset_class = snapshot.get(member, {}).get("asset_class")
+            if asset_class != "StaticMesh":
                 invalid_asset.append(member)
 
         if invalid_asset:
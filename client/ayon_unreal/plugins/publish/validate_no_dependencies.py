@@ -1,13 +1,14 @@
-import unreal
-
 import pyblish.api
 
+from ayon_unreal.api.pipeline import get_asset_data_snapshot
+
 
 class ValidateNoDependencies(pyblish.api.InstancePlugin):
     """Ensure that the uasset has no dependencies
 
     The uasset is checked for dependencies. If there are any, the instance
-    cannot be published.
+    cannot be published. Bundles are skipped as their dependencies are
+    published with them.
     """
 
     order = pyblish.api.ValidatorOrder
@@ -17,24 +18,17 @@ class ValidateNoDependencies(pyblish.api.InstancePlugin):
     optional = True
 
     def process(self, instance):
-        ar = unreal.AssetRegistryHelpers.get_asset_registry()
-        all_dependencies = []
+        if instance.data.get("creator_attributes", {}).get("bundle"):
+            self.log.debug("Bundle includes its dependencies, skipping.")
+            return
 
-        for obj in instance[:]:
-            asset = ar.get_asset_by_object_path(obj)
-            dependencies = ar.get_dependencies(
-                asset.package_name,
-                unreal.AssetRegistryDependencyOptions(
-                    include_soft_package_references=False,
-                    include_hard_package_references=True,
-                    include_searchable_names=False,
-                    include_soft_management_references=False,
-                    include_hard_management_references=False
-                ))
-            if dependencies:
-                for dep in dependencies:
-                    if str(dep).startswith("/Game/"):
-                        all_dependencies.append(str(dep))
+        members = instance.data.get("members", [])
+        snapshot = get_asset_data_snapshot(
+            members, instance.context.data.get("assetRegistrySnapshot"))
+
+        all_dependencies = []
+        for asset_data in snapshot.values():
+            all_dependencies.extend(asset_data["dependencies"])
 
         if all_dependencies:
             raise RuntimeError(
@@ -1,11 +1,37 @@
-import clique
-import os
+import re
+
 from ayon_core.pipeline import (
     OptionalPyblishPluginMixin
 )
 import pyblish.api
 from ayon_core.pipeline.publish import PublishValidationError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Same as clique's "frames" pattern, with head and tail kept to detect
+# files which don't belong to single sequence.
+FRAME_FILE_REGEX = re.compile(
+    r"^(?P<head>.*\.)(?P<frame>-?\d+)(?P<tail>\.\D+\d?)$")
+
+
+def format_frame_ranges(frame_ranges):
+    """Format list of frame ranges into compact string.
+
+    Args:
+        frame_ranges (list[tuple[int, int]]): Inclusive (start, end) ranges.
+
+    Returns:
+        str: Ranges like "1001-1010, 1500".
+    """
+    return ", ".join(
+        str(start) if start == end else f"{start}-{end}"
+        for start, end in frame_ranges
+    )
+
 
 class ValidateSequenceFrames(pyblish.api.InstancePlugin,
                              OptionalPyblishPluginMixin):
@@ -14,6 +40,11 @@ class ValidateSequenceFrames(pyblish.api.InstancePlugin,
     The files found in the folder are checked against the frameStart and
     frameEnd of the instance. If the first or last file is not
     corresponding with the first or last frame it is flagged as invalid.
+
+    Frame numbers are taken from frame index collected with the files or
+    parsed from file names with single regex. The checks then run on the
+    whole array of frames at once and missing frames are reported as
+    ranges.
     """
 
     order = pyblish.api.ValidatorOrder
@@ -39,40 +70,36 @@ class ValidateSequenceFrames(pyblish.api.InstancePlugin,
             if isinstance(repr_files, str):
                 continue
 
-            ext = repr.get("ext")
-            if not ext:
-                _, ext = os.path.splitext(repr_files[0])
-            elif not ext.startswith("."):
-                ext = ".{}".format(ext)
-
-            collections, remainder = clique.assemble(
-                repr["files"], minimum_items=1,
-                patterns=[clique.PATTERNS['frames']])
+            frame_index = repr.get("frameIndex")
+            if frame_index:
+                frames = frame_index["frames"]
+                padding = frame_index["padding"]
+            else:
+                frames, padding = self._parse_frames(repr_files)
 
-            if remainder:
+            if padding is None:
                 raise PublishValidationError(
-                    "Some files have been found outside a sequence. "
-                    f"Invalid files: {remainder}")
-            if not collections:
-                raise PublishValidationError(
-                    "We have been unable to find a sequence in the "
-                    "files. Please ensure the files are named "
-                    "appropriately. "
-                    f"Files: {repr_files}")
-            if len(collections) > 1:
-                raise PublishValidationError(
-                    "Multiple collections detected. There should be a single "
-                    "collection per representation. "
-                    f"Collections identified: {collections}")
+                    "Frame numbers of the files don't use the same "
+                    f"padding. Files: {repr_files[0]} ... {repr_files[-1]}")
 
-            collection = collections[0]
-            frames = list(collection.indexes)
+            frames = self._to_array(frames)
 
             if instance.data.get("slate"):
                 # Slate is not part of the frame range
                 frames = frames[1:]
 
-            current_range = (frames[0], frames[-1])
+            if not len(frames):
+                raise PublishValidationError(
+                    "No frames to validate, representation contains only "
+                    f"slate or no files. Files: {repr_files}")
+
+            duplicates = self._get_duplicates(frames)
+            if len(duplicates):
+                raise PublishValidationError(
+                    "Duplicate frames have been detected. "
+                    f"Duplicate frames: {self._format_frames(duplicates)}")
+
+            current_range = (int(frames[0]), int(frames[-1]))
             required_range = (folder_attributes.get("clipIn"),
                               folder_attributes.get("clipOut"))
 
@@ -81,8 +108,91 @@ class ValidateSequenceFrames(pyblish.api.InstancePlugin,
                     f"Invalid frame range: {current_range} - "
                     f"expected: {required_range}")
 
-            missing = collection.holes().indexes
+            missing = self._get_missing_ranges(frames)
             if missing:
                 raise PublishValidationError(
                     "Missing frames have been detected. "
-                    f"Missing frames: {missing}")
+                    f"Missing frames: {format_frame_ranges(missing)}")
+
+    def _parse_frames(self, files):
+        """Parse sorted frame numbers and padding from file names.
+
+        Args:
+            files (list[str]): File names.
+
+        Returns:
+            tuple[list[int], Optional[int]]: Sorted frames and padding. The
+                padding is None if files don't use the same padding.
+        """
+        heads_and_tails = set()
+        parsed = []
+        remainder = []
+        for filename in files:
+            match = FRAME_FILE_REGEX.match(filename)
+            if not match:
+                remainder.append(filename)
+                continue
+            heads_and_tails.add((match.group("head"), match.group("tail")))
+            parsed.append(match.group("frame"))
+
+        if remainder:
+            raise PublishValidationError(
+                "Some files have been found outside a sequence. "
+                f"Invalid files: {remainder}")
+        if not parsed:
+            raise PublishValidationError(
+                "We have been unable to find a sequence in the "
+                "files. Please ensure the files are named "
+                "appropriately. "
+                f"Files: {files}")
+        if len(heads_and_tails) > 1:
+            collections = sorted(
+                f"{head}#{tail}" for head, tail in heads_and_tails)
+            raise PublishValidationError(
+                "Multiple collections detected. There should be a single "
+                "collection per representation. "
+                f"Collections identified: {collections}")
+
+        frames = [int(frame) for frame in parsed]
+        widths = [len(frame.lstrip("-")) for frame in parsed]
+        padding = min(widths)
+        # Frames wider than padding are fine only if they are not padded.
+        for frame, width in zip(frames, widths):
+            if width != padding and len(str(abs(frame))) != width:
+                padding = None
+                break
+
+        return sorted(frames), padding
+
+    @staticmethod
+    def _to_array(frames):
+        if np is not None:
+            return np.sort(np.asarray(frames, dtype=np.int64))
+        return sorted(frames)
+
+    @staticmethod
+    def _get_duplicates(frames):
+        if np is not None:
+            return frames[1:][np.diff(frames) == 0]
+        return sorted({
+            frame for prev, frame in zip(frames, frames[1:])
+            if prev == frame
+        })
+
+    @staticmethod
+    def _get_missing_ranges(frames):
+        """Get inclusive (start, end) ranges missing in sorted frames."""
+        if np is not None:
+            gaps = np.flatnonzero(np.diff(frames) > 1)
+            starts = frames[gaps] + 1
+            ends = frames[gaps + 1] - 1
+            return list(zip(starts.tolist(), ends.tolist()))
+        return [
+            (prev + 1, frame - 1)
+            for prev, frame in zip(frames, frames[1:])
+            if frame - prev > 1
+        ]
+
+    @staticmethod
+    def _format_frames(frames):
+        return ", ".join(str(int(frame)) for frame in frames)
@@ -1,9 +1,13 @@
 import json
 import os
 import platform
+import queue
 import re
 import subprocess
+import sys
 import tempfile
+import threading
+import time
 from distutils import dir_util
 from distutils.dir_util import copy_tree
 from pathlib import Path
@@ -15,40 +19,145 @@ import ayon_unreal.lib as ue_lib
 from ayon_core.settings import get_project_settings
 
 
+COMP_PROGRESS_REGEX = re.compile(r"\[([1-9]+)/([0-9]+)]")
+PRJ_PROGRESS_REGEX = re.compile(r"@progress")
+PERCENT_REGEX = re.compile(r"\d{1,3}")
+EXIT_CODE_REGEX = re.compile(r"ExitCode=(\d+)")
+
+
 def parse_comp_progress(line: str, progress_signal: QtCore.Signal(int)):
-    match = re.search(r"\[[1-9]+/[0-9]+]", line)
+    match = COMP_PROGRESS_REGEX.search(line)
     if match is not None:
-        split: list[str] = match.group().split("/")
-        curr: float = float(split[0][1:])
-        total: float = float(split[1][:-1])
+        curr: float = float(match.group(1))
+        total: float = float(match.group(2))
         progress_signal.emit(int((curr / total) * 100.0))
 
 
 def parse_prj_progress(line: str, progress_signal: QtCore.Signal(int)):
-    match = re.search("@progress", line)
+    match = PRJ_PROGRESS_REGEX.search(line)
     if match is not None:
-        percent_match = re.search(r"\d{1,3}", line)
+        percent_match = PERCENT_REGEX.search(line)
         progress_signal.emit(int(percent_match.group()))
 
 
 def retrieve_exit_code(line: str):
-    match = re.search(r"ExitCode=\d+", line)
+    match = EXIT_CODE_REGEX.search(line)
     if match is not None:
-        split: list[str] = match.group().split("=")
-        return int(split[1])
+        return int(match.group(1))
 
     return None
 
 
+class _ChangedValueSignal:
+    """Emit signal only when value differs from the last emitted one."""
+
+    def __init__(self, signal):
+        self._signal = signal
+        self._last_value = None
+
+    def emit(self, value):
+        if value != self._last_value:
+            self._last_value = value
+            self._signal.emit(value)
+
+
+def _read_pipe(pipe, lines: queue.Queue):
+    """Put decoded lines from pipe to queue, None marks the end."""
+    try:
+        for line in pipe:
+            lines.put(line.decode(errors="replace"))
+    finally:
+        pipe.close()
+        lines.put(None)
+
+
 class UEWorker(QtCore.QObject):
     finished = QtCore.Signal(str)
     failed = QtCore.Signal(str, int)
     progress = QtCore.Signal(int)
     log = QtCore.Signal(str)
+    # Name of launch phase and its duration in seconds
+    phase_finished = QtCore.Signal(str, float)
 
     engine_path: Path = None
     env = None
 
+    # Seconds between batched emits of log signal
+    log_interval = 0.2
+
+    def run_process(self, cmd: List[str], line_parser=None) -> int:
+        """Run process streaming its output to the log.
+
+        Stdout and stderr are drained concurrently by reader threads so
+        the process can't block on a full pipe. Lines are parsed as they
+        arrive, but printed and emitted with `log` signal in batches every
+        `log_interval` seconds.
+
+        Args:
+            cmd (List[str]): Command to run.
+            line_parser (Callable[[str, Any], None], optional): Called with
+                every line and progress signal which emits only changed
+                values, e.g. `parse_comp_progress`.
+
+        Returns:
+            int: Return code of the process.
+
+        """
+        print(" ".join(cmd))
+        process = subprocess.Popen(cmd,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE)
+        lines = queue.Queue()
+        readers = [
+            threading.Thread(
+                target=_read_pipe, args=(pipe, lines), daemon=True)
+            for pipe in (process.stdout, process.stderr)
+        ]
+        for reader in readers:
+            reader.start()
+
+        progress = _ChangedValueSignal(self.progress)
+        running_readers = len(readers)
+        batch = []
+        next_emit = time.time() + self.log_interval
+        while running_readers:
+            try:
+                line = lines.get(timeout=self.log_interval)
+            except queue.Empty:
+                line = ""
+            if line is None:
+                running_readers -= 1
+            elif line:
+                batch.append(line)
+                if line_parser is not None:
+                    line_parser(line, progress)
+
+            if batch and (not running_readers or time.time() >= next_emit):
+                text = "".join(batch)
+                batch = []
+                sys.stdout.write(text)
+                self.log.emit(text)
+                next_emit = time.time() + self.log_interval
+
+        for reader in readers:
+            reader.join()
+        return process.wait()
+
+    def finish_phase(self, name: str, start: float) -> float:
+        """Report duration of finished phase.
+
+        Args:
+            name (str): Name of the phase.
+            start (float): Time the phase started.
+
+        Returns:
+            float: Current time, start of the next phase.
+
+        """
+        now = time.time()
+        self.phase_finished.emit(name, now - start)
+        return now
+
     def execute(self):
         raise NotImplementedError("Please implement this method!")
 
@@ -70,6 +179,8 @@ class UEProjectGenerationWorker(UEWorker):
     project_name: str = None
     project_dir: Path = None
     dev_mode = False
+    use_template_cache = True
+    qt_wheelhouse = None
 
     def setup(self, ue_version: str,
               project_name: str,
@@ -100,16 +211,17 @@ class UEProjectGenerationWorker(UEWorker):
 
         if dev_mode or preset["dev_mode"]:
             self.dev_mode = True
+        self.use_template_cache = preset.get("use_template_cache", True)
+        self.qt_wheelhouse = preset.get("qt_wheelhouse") or None
 
         self.project_name = unreal_project_name
         self.engine_path = engine_path
+        self.engine_info = ue_lib.get_engine_info(engine_path, ue_version)
 
     def execute(self):
         # engine_path should be the location of UE_X.X folder
 
-        ue_editor_exe = ue_lib.get_editor_exe_path(self.engine_path,
-                                                   self.ue_version)
-        cmdlet_project = ue_lib.get_path_to_cmdlet_project(self.ue_version)
+        ue_editor_exe = Path(self.engine_info["editor"])
         project_file = self.project_dir / f"{self.project_name}.uproject"
 
         print("--- Generating a new project ...")
@@ -118,74 +230,48 @@ class UEProjectGenerationWorker(UEWorker):
         if self.dev_mode:
             stage_count = 4
 
-        self.stage_begin.emit(
-            ("Generating a new UE project ... 1 out of "
-             f"{stage_count}"))
-
-        # Need to copy the commandlet project to a temporary folder where
-        # users don't need admin rights to write to.
-        cmdlet_tmp = tempfile.TemporaryDirectory()
-        cmdlet_filename = cmdlet_project.name
-        cmdlet_dir = cmdlet_project.parent.as_posix()
-        cmdlet_tmp_name = Path(cmdlet_tmp.name)
-        cmdlet_tmp_file = cmdlet_tmp_name.joinpath(cmdlet_filename)
-        copy_tree(
-            cmdlet_dir,
-            cmdlet_tmp_name.as_posix())
-
-        commandlet_cmd = [
-            f"{ue_editor_exe.as_posix()}",
-            f"{cmdlet_tmp_file.as_posix()}",
-            "-run=AyonGenerateProject",
-            f"{project_file.resolve().as_posix()}",
-        ]
-
-        if self.dev_mode:
-            commandlet_cmd.append("-GenerateCode")
-
-        gen_process = subprocess.Popen(commandlet_cmd,
-                                       stdout=subprocess.PIPE,
-                                       stderr=subprocess.PIPE)
-
-        for line in gen_process.stdout:
-            decoded_line = line.decode(errors="replace")
-            print(decoded_line, end="")
-            self.log.emit(decoded_line)
-        gen_process.stdout.close()
-        return_code = gen_process.wait()
-
-        cmdlet_tmp.cleanup()
-
-        if return_code and return_code != 0:
-            msg = (
-                f"Failed to generate {self.project_name} "
-                f"project! Exited with return code {return_code}"
-            )
-            self.failed.emit(msg, return_code)
-            raise RuntimeError(msg)
-
-        print("--- Project has been generated successfully.")
-        self.stage_begin.emit(
-            (f"Writing the Engine ID of the build UE ... 1"
-             f" out of {stage_count}"))
-
-        if not project_file.is_file():
-            msg = ("Failed to write the Engine ID into .uproject file! Can "
-                   "not read!")
-            self.failed.emit(msg)
-            raise RuntimeError(msg)
-
-        with open(project_file.as_posix(), mode="r+") as pf:
-            pf_json = json.load(pf)
-            pf_json["EngineAssociation"] = ue_lib.get_build_id(
-                self.engine_path,
-                self.ue_version
-            )
-            print(pf_json["EngineAssociation"])
-            pf.seek(0)
-            json.dump(pf_json, pf, indent=4)
-            pf.truncate()
-            print("--- Engine ID has been written into the project file")
+        # Projects with generated code have project name in their sources
+        # so they can't be created from template.
+        template_key = None
+        template_dir = None
+        if self.use_template_cache and not self.dev_mode:
+            template_key = ue_lib.get_project_template_key(
+                self.engine_path, self.ue_version, self.dev_mode)
+            template_dir = ue_lib.get_project_template(template_key)
+
+        start = time.time()
+        if template_dir:
+            self.stage_begin.emit(
+                ("Creating a new UE project from template ... 1 out of "
+                 f"{stage_count}"))
+            try:
+                generation_time = ue_lib.clone_project_template(
+                    template_dir, self.project_dir, self.project_name)
+            except OSError as e:
+                # Template removed or locked by another launch meanwhile
+                print(f"--- Failed to clone template, generating: {e}")
+                template_dir = None
+                start = time.time()
+            else:
+                print(
+                    f"--- Project created from template {template_dir.name} "
+                    f"in {time.time() - start:.1f}s, generating it took "
+                    f"{generation_time:.1f}s")
+                phase_start = self.finish_phase("project_template", start)
+
+        if not template_dir:
+            self.stage_begin.emit(
+                ("Generating a new UE project ... 1 out of "
+                 f"{stage_count}"))
+            self._generate_project(ue_editor_exe, project_file, stage_count)
+            generation_time = time.time() - start
+            print(f"--- Project generated in {generation_time:.1f}s")
+            phase_start = self.finish_phase("project_commandlet", start)
+            if template_key:
+                ue_lib.cache_project_template(
+                    self.project_dir, template_key, generation_time)
+                phase_start = self.finish_phase(
+                    "project_template_cache", phase_start)
 
         self.progress.emit(90)
         if self.dev_mode:
@@ -195,8 +281,7 @@ class UEProjectGenerationWorker(UEWorker):
                  f"{stage_count}"))
 
             self.progress.emit(0)
-            ubt_path = ue_lib.get_path_to_ubt(self.engine_path,
-                                              self.ue_version)
+            ubt_path = Path(self.engine_info["ubt"])
 
             arch = "Win64"
             if platform.system().lower() == "windows":
@@ -211,17 +296,8 @@ class UEProjectGenerationWorker(UEWorker):
                                  "-projectfiles",
                                  f"-project={project_file}",
                                  "-progress"]
-            gen_proc = subprocess.Popen(gen_prj_files_cmd,
-                                        stdout=subprocess.PIPE,
-                                        stderr=subprocess.PIPE)
-            for line in gen_proc.stdout:
-                decoded_line: str = line.decode(errors="replace")
-                print(decoded_line, end="")
-                self.log.emit(decoded_line)
-                parse_prj_progress(decoded_line, self.progress)
-
-            gen_proc.stdout.close()
-            return_code = gen_proc.wait()
+            return_code = self.run_process(
+                gen_prj_files_cmd, parse_prj_progress)
 
             if return_code and return_code != 0:
                 msg = ("Failed to generate project files! "
@@ -229,6 +305,9 @@ class UEProjectGenerationWorker(UEWorker):
                 self.failed.emit(msg, return_code)
                 raise RuntimeError(msg)
 
+            phase_start = self.finish_phase(
+                "ubt_project_files", phase_start)
+
             self.stage_begin.emit(
                 f"Building the project ... 3 out of {stage_count}")
             self.progress.emit(0)
@@ -242,17 +321,8 @@ class UEProjectGenerationWorker(UEWorker):
                              f"{project_file}",
                              "-IgnoreJunk"]
 
-            build_prj_proc = subprocess.Popen(build_prj_cmd,
-                                              stdout=subprocess.PIPE,
-                                              stderr=subprocess.PIPE)
-            for line in build_prj_proc.stdout:
-                decoded_line: str = line.decode(errors="replace")
-                print(decoded_line, end="")
-                self.log.emit(decoded_line)
-                parse_comp_progress(decoded_line, self.progress)
-
-            build_prj_proc.stdout.close()
-            return_code = build_prj_proc.wait()
+            return_code = self.run_process(
+                build_prj_cmd, parse_comp_progress)
 
             if return_code and return_code != 0:
                 msg = ("Failed to build project! "
@@ -260,89 +330,224 @@ class UEProjectGenerationWorker(UEWorker):
                 self.failed.emit(msg, return_code)
                 raise RuntimeError(msg)
 
+            phase_start = self.finish_phase("ubt_build", phase_start)
+
         # ensure we have PySide2/6 installed in engine
 
         self.progress.emit(0)
         self.stage_begin.emit(
             (f"Checking Qt bindings installation... {stage_count} "
              f" out of {stage_count}"))
-        python_path = None
-        if platform.system().lower() == "windows":
-            python_path = self.engine_path / ("Engine/Binaries/ThirdParty/"
-                                              "Python3/Win64/python.exe")
-
-        if platform.system().lower() == "linux":
-            python_path = self.engine_path / ("Engine/Binaries/ThirdParty/"
-                                              "Python3/Linux/bin/python3")
-
-        if platform.system().lower() == "darwin":
-            python_path = self.engine_path / ("Engine/Binaries/ThirdParty/"
-                                              "Python3/Mac/bin/python3")
-
-        if not python_path:
+        if not self.engine_info["python"]:
             msg = "Unsupported platform"
             self.failed.emit(msg, 1)
             raise NotImplementedError(msg)
+        python_path = Path(self.engine_info["python"])
         if not python_path.exists():
             msg = f"Unreal Python not found at {python_path}"
             self.failed.emit(msg, 1)
             raise RuntimeError(msg)
 
-        pyside_version = "PySide2"
+        qt_binding = "PySide2"
+        qt_version = None
         ue_version = self.ue_version.split(".")
         if int(ue_version[0]) == 5 and int(ue_version[1]) >= 4:
             # Use PySide6 6.6.3 because 6.7.0 had a bug
             #   - 'QPushButton' can't be added to 'QBoxLayout'
-            pyside_version = "PySide6==6.6.3"
+            qt_binding = "PySide6"
+            qt_version = "6.6.3"
+        pyside_version = qt_binding
+        if qt_version:
+            pyside_version = f"{qt_binding}=={qt_version}"
 
         site_packages_prefix = python_path.parent.as_posix()
 
-        pyside_cmd = [
-            python_path.as_posix(),
-            "-m", "pip",
+        if self._is_qt_installed(
+                python_path, site_packages_prefix, qt_binding, qt_version):
+            print(f"--- {pyside_version} is already installed.")
+        else:
+            wheelhouse = Path(
+                self.qt_wheelhouse or ue_lib.get_cache_dir("wheelhouse"))
+            # Parallel launches on the same machine install one at a time
+            with ue_lib.file_lock(
+                    ue_lib.get_cache_dir() / "qt_install.lock"):
+                if not self._is_qt_installed(
+                        python_path, site_packages_prefix, qt_binding,
+                        qt_version):
+                    self._install_qt(
+                        python_path, site_packages_prefix, pyside_version,
+                        wheelhouse, allow_download=not self.qt_wheelhouse)
+
+        self.finish_phase("qt_bindings", phase_start)
+
+        self.progress.emit(100)
+        self.finished.emit("Project successfully built!")
+
+    @staticmethod
+    def _is_qt_installed(python_path: Path, site_packages_prefix: str,
+                         qt_binding: str, qt_version: str = None) -> bool:
+        """Check if Qt binding can be imported by engine Python.
+
+        Args:
+            python_path (Path): Engine Python executable.
+            site_packages_prefix (str): Directory where bindings are
+                installed on Windows.
+            qt_binding (str): Name of the binding module.
+            qt_version (str, optional): Required version of the binding.
+
+        Returns:
+            bool: Binding is importable and its version matches.
+
+        """
+        probe = (
+            "import sys; "
+            f"sys.path.insert(0, {site_packages_prefix!r}); "
+            f"import {qt_binding}; "
+            f"print({qt_binding}.__version__)"
+        )
+        try:
+            result = subprocess.run(
+                [python_path.as_posix(), "-c", probe],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=60)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        if result.returncode != 0:
+            return False
+        installed_version = result.stdout.decode(errors="replace").strip()
+        return not qt_version or installed_version == qt_version
+
+    def _install_qt(self, python_path: Path, site_packages_prefix: str,
+                    pyside_version: str, wheelhouse: Path,
+                    allow_download: bool = True):
+        """Install Qt binding from wheelhouse without network access.
+
+        With `allow_download` wheels missing in wheelhouse are downloaded
+        to it first, so later installations on the machine don't need
+        network. Configured wheelhouse can be shared or read-only, it is
+        never downloaded to.
+
+        """
+        pip_cmd = [python_path.as_posix(), "-m", "pip"]
+        install_cmd = pip_cmd + [
             "install",
             "--ignore-installed",
+            "--no-index",
+            "--find-links", wheelhouse.as_posix(),
             pyside_version,
-
         ]
-
         if platform.system().lower() == "windows":
-            pyside_cmd += ["--target", site_packages_prefix]
+            install_cmd += ["--target", site_packages_prefix]
+
+        print(f"--- Installing {pyside_version} from {wheelhouse} ...")
+        return_code = None
+        if any(wheelhouse.glob("*.whl")):
+            return_code = self.run_process(install_cmd)
+            if return_code == 0:
+                return
+
+        if not allow_download:
+            msg = (f"Failed to create the project! "
+                   f"The installation of {pyside_version} has failed! "
+                   f"Wheel of {pyside_version} or its dependencies is "
+                   f"missing in wheelhouse {wheelhouse}.")
+            self.failed.emit(msg, return_code or 1)
+            raise RuntimeError(msg)
+
+        print(f"--- Downloading {pyside_version} to {wheelhouse} ...")
+        wheelhouse.mkdir(parents=True, exist_ok=True)
+        return_code = self.run_process(
+            pip_cmd + ["download", "--dest", wheelhouse.as_posix(),
+                       pyside_version])
+        if return_code == 0:
+            return_code = self.run_process(install_cmd)
+
+        if return_code != 0:
+            msg = (f"Failed to create the project! {return_code} "
+                   f"The installation of {pyside_version} has failed!")
+            self.failed.emit(msg, return_code)
+            raise RuntimeError(msg)
+
+    def _generate_project(self, ue_editor_exe: Path, project_file: Path,
+                          stage_count: int):
+        """Generate project with commandlet and write Engine ID to it."""
+        if not self.engine_info["cmdlet_project"]:
+            msg = ("There are no compatible versions of Unreal "
+                   "integration plugin compatible with running version "
+                   f"of Unreal Engine {self.ue_version}")
+            self.failed.emit(msg, 1)
+            raise RuntimeError(msg)
+        cmdlet_project = Path(self.engine_info["cmdlet_project"])
+
+        # Need to copy the commandlet project to a temporary folder where
+        # users don't need admin rights to write to.
+        cmdlet_tmp = tempfile.TemporaryDirectory()
+        cmdlet_filename = cmdlet_project.name
+        cmdlet_dir = cmdlet_project.parent.as_posix()
+        cmdlet_tmp_name = Path(cmdlet_tmp.name)
+        cmdlet_tmp_file = cmdlet_tmp_name.joinpath(cmdlet_filename)
+        copy_tree(
+            cmdlet_dir,
+            cmdlet_tmp_name.as_posix())
 
-        print(f"--- Installing {pyside_version} ...")
-        print(" ".join(pyside_cmd))
+        commandlet_cmd = [
+            f"{ue_editor_exe.as_posix()}",
+            f"{cmdlet_tmp_file.as_posix()}",
+            "-run=AyonGenerateProject",
+            f"{project_file.resolve().as_posix()}",
+        ]
 
-        pyside_install = subprocess.Popen(pyside_cmd,
-                                          stdout=subprocess.PIPE,
-                                          stderr=subprocess.PIPE)
+        if self.dev_mode:
+            commandlet_cmd.append("-GenerateCode")
 
-        for line in pyside_install.stdout:
-            decoded_line: str = line.decode(errors="replace")
-            print(decoded_line, end="")
-            self.log.emit(decoded_line)
+        return_code = self.run_process(commandlet_cmd)
 
-        pyside_install.stdout.close()
-        return_code = pyside_install.wait()
+        cmdlet_tmp.cleanup()
 
         if return_code and return_code != 0:
-            msg = (f"Failed to create the project! {return_code} "
-                   f"The installation of {pyside_version} has failed!: {pyside_install}")
+            msg = (
+                f"Failed to generate {self.project_name} "
+                f"project! Exited with return code {return_code}"
+            )
             self.failed.emit(msg, return_code)
             raise RuntimeError(msg)
 
-        self.progress.emit(100)
-        self.finished.emit("Project successfully built!")
+        print("--- Project has been generated successfully.")
+        self.stage_begin.emit(
+            (f"Writing the Engine ID of the build UE ... 1"
+             f" out of {stage_count}"))
+
+        if not project_file.is_file():
+            msg = ("Failed to write the Engine ID into .uproject file! Can "
+                   "not read!")
+            self.failed.emit(msg)
+            raise RuntimeError(msg)
+
+        with open(project_file.as_posix(), mode="r+") as pf:
+            pf_json = json.load(pf)
+            pf_json["EngineAssociation"] = self.engine_info["build_id"]
+            print(pf_json["EngineAssociation"])
+            pf.seek(0)
+            json.dump(pf_json, pf, indent=4)
+            pf.truncate()
+            print("--- Engine ID has been written into the project file")
 
 
 class UEPluginInstallWorker(UEWorker):
     installing = QtCore.Signal(str)
 
-    def setup(self, engine_path: Path, env: dict = None, ):
+    def setup(self, engine_path: Path, env: dict = None,
+              ue_version: str = None):
         self.engine_path = engine_path
         self.env = env or os.environ
+        self.uat_path = ue_lib.get_path_to_uat(engine_path)
+        if ue_version:
+            self.uat_path = Path(
+                ue_lib.get_engine_info(engine_path, ue_version)["uat"])
 
     def _build_and_move_plugin(self, plugin_build_path: Path):
-        uat_path: Path = ue_lib.get_path_to_uat(self.engine_path)
+        uat_path: Path = self.uat_path
         src_plugin_dir = Path(self.env.get("AYON_UNREAL_PLUGIN", ""))
 
         if not src_plugin_dir.is_dir():
@@ -350,6 +555,16 @@ class UEPluginInstallWorker(UEWorker):
             self.failed.emit(msg, 1)
             raise RuntimeError(msg)
 
+        build_key = ue_lib.get_plugin_build_key(
+            self.engine_path, src_plugin_dir)
+        cached_build = ue_lib.get_cached_plugin_build(build_key)
+        if cached_build:
+            self.installing.emit("Restoring the plugin from cache ...")
+            print(f"--- Using cached plugin build {build_key}")
+            dir_util.copy_tree(cached_build.as_posix(),
+                               plugin_build_path.as_posix())
+            return
+
         if not uat_path.is_file():
             msg = "Building failed! Path to UAT is invalid!"
             self.failed.emit(msg, 1)
@@ -366,20 +581,19 @@ class UEPluginInstallWorker(UEWorker):
                                        f"-Plugin={uplugin_path.as_posix()}",
                                        f"-Package={temp_dir.as_posix()}"]
 
-        build_proc = subprocess.Popen(build_plugin_cmd,
-                                      stdout=subprocess.PIPE,
-                                      stderr=subprocess.PIPE)
-        return_code: Union[None, int] = None
-        for line in build_proc.stdout:
-            decoded_line: str = line.decode(errors="replace")
-            print(decoded_line, end="")
-            self.log.emit(decoded_line)
-            if return_code is None:
-                return_code = retrieve_exit_code(decoded_line)
-            parse_comp_progress(decoded_line, self.progress)
-
-        build_proc.stdout.close()
-        build_proc.wait()
+        exit_codes: List[int] = []
+
+        def parse_build_line(line: str, progress_signal):
+            if not exit_codes:
+                exit_code = retrieve_exit_code(line)
+                if exit_code is not None:
+                    exit_codes.append(exit_code)
+            parse_comp_progress(line, progress_signal)
+
+        process_return_code = self.run_process(
+            build_plugin_cmd, parse_build_line)
+        return_code: Union[None, int] = (
+            exit_codes[0] if exit_codes else process_return_code)
 
         if return_code and return_code != 0:
             msg = ("Failed to build plugin"
@@ -388,6 +602,9 @@ class UEPluginInstallWorker(UEWorker):
             self.failed.emit(msg, return_code)
             raise RuntimeError(msg)
 
+        ue_lib.cache_plugin_build(
+            temp_dir, src_plugin_dir / "Config", build_key)
+
         # Copy the contents of the 'Temp' dir into the
         # 'Ayon' directory in the engine
         dir_util.copy_tree(temp_dir.as_posix(),
@@ -429,6 +646,9 @@ class UEPluginInstallWorker(UEWorker):
             self.installing.emit("Building the plugin ...")
             print("--- Building the plugin...")
 
+            start = time.time()
             self._build_and_move_plugin(op_plugin_path)
+            self.finish_phase("plugin_build", start)
 
         self.finished.emit("Plugin successfully installed")
+
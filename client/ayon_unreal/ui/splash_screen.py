@@ -1,3 +1,5 @@
+import collections
+
 from qtpy import QtWidgets, QtCore, QtGui
 from ayon_core import style, resources
 
@@ -19,6 +21,9 @@ class SplashScreen(QtWidgets.QDialog):
     is_log_visible = False
     is_scroll_auto = True
 
+    # Only last lines are kept in the log view
+    max_log_lines = 2000
+
     thread_return_code = None
     q_thread: QtCore.QThread = None
 
@@ -43,6 +48,7 @@ class SplashScreen(QtWidgets.QDialog):
             window_icon = resources.get_ayon_icon_filepath()
 
         self.splash_icon = splash_icon
+        self._log_lines = collections.deque(maxlen=self.max_log_lines)
         self.setWindowIcon(QtGui.QIcon(window_icon))
         self.setWindowTitle(window_title)
         self.init_ui()
@@ -222,7 +228,7 @@ class SplashScreen(QtWidgets.QDialog):
     @QtCore.Slot(str, str)
     def append_log(self, text: str, end: str = ''):
         """A slot used for receiving log info and appending it to scroll area's
-            content.
+            content. Only last `max_log_lines` lines are displayed.
         Args:
             text (str): A log text that will append to the current one in the
                 scroll area.
@@ -232,10 +238,24 @@ class SplashScreen(QtWidgets.QDialog):
         Returns:
             None
         """
-        self.log_text.setText(self.log_text.text() + text + end)
+        self._log_lines.extend((text + end).splitlines(keepends=True))
+        self.log_text.setText("".join(self._log_lines))
         if self.is_scroll_auto:
             self.scroll_bar.setValue(self.scroll_bar.maximum())
 
+    @QtCore.Slot(str, float)
+    def append_phase_timing(self, name: str, duration: float):
+        """A slot used for receiving duration of finished launch phase.
+
+        Args:
+            name (str): Name of the phase.
+            duration (float): Duration of the phase in seconds.
+
+        Returns:
+            None
+        """
+        self.append_log(f"--- Phase {name} took {duration:.1f}s", "\n")
+
     @QtCore.Slot(int)
     def on_scroll(self, position: int):
         """
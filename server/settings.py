@@ -13,6 +13,41 @@ class ProjectSetup(BaseSettingsModel):
         False,
         title="Dev mode"
     )
+    project_generation_timeout: int = SettingsField(
+        7200,
+        title="Project generation timeout",
+        description="Seconds to wait for another launch generating the "
+                    "same project before the launch fails."
+    )
+    use_template_cache: bool = SettingsField(
+        True,
+        title="Use project template cache",
+        description="Create new projects from a cached template generated "
+                    "for the same engine build and plugin version. Not "
+                    "used in dev mode."
+    )
+    qt_wheelhouse: str = SettingsField(
+        "",
+        title="Qt bindings wheelhouse",
+        description="Directory with PySide wheels installed into engine "
+                    "Python without network access, nothing is downloaded "
+                    "to it. Empty uses local cache which downloads "
+                    "missing wheels once."
+    )
+    ddc_prewarm: bool = SettingsField(
+        False,
+        title="Pre-warm Derived Data Cache",
+        description="Run DDC fill commandlet in background alongside "
+                    "the editor when project is created or content is "
+                    "loaded or removed since the last pre-warm."
+    )
+    shared_ddc_path: str = SettingsField(
+        "",
+        title="Shared DDC path",
+        description="Shared Derived Data Cache used by the editor and "
+                    "filled by the pre-warm. Empty uses the engine "
+                    "configured shared cache."
+    )
 
 
 def _abc_conversion_presets_enum():
@@ -31,6 +66,13 @@ def _render_format_enum():
     ]
 
 
+def _look_texture_format_enum():
+    return [
+        {"value": "tga", "label": "TGA"},
+        {"value": "png", "label": "PNG (compressed)"}
+    ]
+
+
 def _loaded_asset_enum():
     return [
         {"value": "fbx", "label": "fbx"},
@@ -87,6 +129,33 @@ class UnrealSettings(BaseSettingsModel):
         title="Render format",
         enum_resolver=_render_format_enum
     )
+    local_render_workers: int = SettingsField(
+        1,
+        title="Local render worker processes",
+        ge=1,
+        description="Number of headless editor processes rendering in "
+                    "parallel. Value 1 renders in the current editor "
+                    "session."
+    )
+    local_render_chunk_size: int = SettingsField(
+        0,
+        title="Local render chunk size",
+        ge=0,
+        description="Number of frames rendered by single render job. "
+                    "Value 0 renders each sequence as a single job."
+    )
+    local_render_resume: bool = SettingsField(
+        False,
+        title="Resume local render",
+        description="Render only frames which are missing or invalid "
+                    "in the output directory."
+    )
+    look_texture_format: str = SettingsField(
+        "tga",
+        title="Look texture format",
+        enum_resolver=_look_texture_format_enum,
+        description="Format of textures exported with looks"
+    )
     project_setup: ProjectSetup = SettingsField(
         default_factory=ProjectSetup,
         title="Project Setup",
@@ -102,7 +171,16 @@ DEFAULT_VALUES = {
     "render_config_path": "/Game/Ayon/DefaultMovieRenderQueueConfig.DefaultMovieRenderQueueConfig",
     "preroll_frames": 0,
     "render_format": "exr",
+    "local_render_workers": 1,
+    "local_render_chunk_size": 0,
+    "local_render_resume": False,
+    "look_texture_format": "tga",
     "project_setup": {
-        "dev_mode": False
+        "dev_mode": False,
+        "project_generation_timeout": 7200,
+        "use_template_cache": True,
+        "qt_wheelhouse": "",
+        "ddc_prewarm": False,
+        "shared_ddc_path": ""
     }
 }
@@ -0,0 +1,23 @@
+"""Test configuration of Unreal addon client code.
+
+Unreal Python API is available only inside of the editor, so `unreal`
+module is replaced by a mock when it can't be imported. Tests of modules
+depending on AYON core are skipped when it is not installed.
+"""
+import os
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+CLIENT_DIR = Path(__file__).resolve().parent.parent / "client"
+sys.path.insert(0, CLIENT_DIR.as_posix())
+
+os.environ.setdefault("AYON_UNREAL_VERSION", "5.3.0")
+
+try:
+    import unreal  # noqa: F401
+except ImportError:
+    unreal = types.ModuleType("unreal")
+    unreal.__getattr__ = lambda name: getattr(mock.MagicMock(), name)
+    sys.modules["unreal"] = unreal
@@ -0,0 +1,483 @@
+import hashlib
+import json
+import os
+import time
+import types
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_unreal import lib  # noqa: E402
+
+
+@pytest.fixture
+def src_file(tmp_path):
+    path = tmp_path / "src" / "Asset.uasset"
+    path.parent.mkdir()
+    path.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    return path
+
+
+def test_transfer_file_with_hash(src_file, tmp_path):
+    dst = tmp_path / "Asset.uasset"
+
+    method, file_hash = lib.transfer_file(
+        src_file, dst, hash_algorithm="sha256")
+
+    # Hash doesn't disable zero-copy methods
+    assert method == lib.transfer_file(src_file, tmp_path / "Other")[0]
+    assert dst.read_bytes() == src_file.read_bytes()
+    assert file_hash == hashlib.sha256(src_file.read_bytes()).hexdigest()
+    assert file_hash == lib.get_file_hash(dst)
+
+
+def test_transfer_file_with_hash_user_space_copy(
+    src_file, tmp_path, monkeypatch
+):
+    def unsupported(src, dst):
+        raise OSError("Not supported")
+
+    monkeypatch.setattr(lib, "_reflink_file", unsupported)
+    monkeypatch.setattr(lib, "_kernel_copy_file", unsupported)
+    dst = tmp_path / "Asset.uasset"
+
+    method, file_hash = lib.transfer_file(
+        src_file, dst, hash_algorithm="sha256")
+
+    assert method == "copy"
+    assert dst.read_bytes() == src_file.read_bytes()
+    assert file_hash == hashlib.sha256(src_file.read_bytes()).hexdigest()
+
+
+def test_transfer_file_without_hash(src_file, tmp_path):
+    dst = tmp_path / "Asset.uasset"
+
+    method, file_hash = lib.transfer_file(src_file, dst)
+
+    assert method in {"reflink", "kernel_copy", "copy"}
+    assert file_hash is None
+    assert dst.read_bytes() == src_file.read_bytes()
+    assert os.stat(dst).st_mtime == pytest.approx(os.stat(src_file).st_mtime)
+
+
+@pytest.mark.parametrize("hash_algorithm", [None, "sha256"])
+def test_transfer_file_is_independent_copy(src_file, tmp_path,
+                                           hash_algorithm):
+    dst = tmp_path / "Asset.uasset"
+    lib.transfer_file(src_file, dst, hash_algorithm=hash_algorithm)
+    original = src_file.read_bytes()
+
+    assert not os.path.samefile(src_file, dst)
+    with open(dst, "r+b") as f:
+        f.write(b"changed")
+    assert src_file.read_bytes() == original
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AYON_UNREAL_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def generated_project(tmp_path):
+    project_dir = tmp_path / "generated"
+    (project_dir / "Config").mkdir(parents=True)
+    (project_dir / "Saved").mkdir()
+    (project_dir / "Generated.uproject").write_text("{}")
+    (project_dir / "Config" / "DefaultGame.ini").write_text(
+        "[/Script/EngineSettings.GeneralProjectSettings]\n"
+        "ProjectID=0123456789ABCDEF0123456789ABCDEF\n"
+        "ProjectName=Generated\n"
+    )
+    return project_dir
+
+
+def test_clone_project_template(cache_dir, generated_project, tmp_path):
+    key = "UE_5.3_1.0.0_0123456789abcdef"
+    template_dir = lib.cache_project_template(generated_project, key, 12.5)
+
+    assert template_dir == lib.get_project_template(key)
+    assert not (template_dir / "Saved").exists()
+
+    project_dir = tmp_path / "Shot010"
+    generation_time = lib.clone_project_template(
+        template_dir, project_dir, "Shot010")
+
+    assert generation_time == 12.5
+    assert [path.name for path in project_dir.glob("*.uproject")] == [
+        "Shot010.uproject"]
+    assert not (project_dir / "template.json").exists()
+    config = (project_dir / "Config" / "DefaultGame.ini").read_text()
+    assert "ProjectID=0123456789ABCDEF0123456789ABCDEF" not in config
+    assert "ProjectName=Generated" in config
+    assert not list(cache_dir.glob("project_templates/*.lock"))
+
+
+def test_cache_project_template_removes_stale(cache_dir, generated_project):
+    stale_key = "UE_5.3_1.0.0_aaaaaaaaaaaaaaaa"
+    other_addon_key = "UE_5.3_1.1.0_bbbbbbbbbbbbbbbb"
+    lib.cache_project_template(generated_project, stale_key, 1.0)
+    lib.cache_project_template(generated_project, other_addon_key, 1.0)
+
+    key = "UE_5.3_1.0.0_cccccccccccccccc"
+    lib.cache_project_template(generated_project, key, 1.0)
+
+    assert lib.get_project_template(stale_key) is None
+    assert lib.get_project_template(other_addon_key) is not None
+    assert lib.get_project_template(key) is not None
+
+
+def test_cache_project_template_is_best_effort(cache_dir, tmp_path):
+    missing_project = tmp_path / "missing"
+
+    assert lib.cache_project_template(
+        missing_project, "UE_5.3_1.0.0_0123456789abcdef", 1.0) is None
+    assert lib.get_project_template("UE_5.3_1.0.0_0123456789abcdef") is None
+
+
+@pytest.fixture
+def built_plugin(tmp_path):
+    plugin_path = tmp_path / "built" / "Ayon"
+    (plugin_path / "Binaries" / "Win64").mkdir(parents=True)
+    (plugin_path / "Ayon.uplugin").write_text('{"VersionName": "1.0"}')
+    (plugin_path / "Binaries" / "Win64" / "Ayon.dll").write_bytes(b"v1")
+    return plugin_path
+
+
+def _installed_files(engine_path):
+    plugin_dir = engine_path / "Engine" / "Plugins" / "Marketplace" / "Ayon"
+    return {
+        path.relative_to(plugin_dir).as_posix(): path.read_bytes()
+        for path in plugin_dir.rglob("*")
+        if path.is_file() and path.name != lib.PLUGIN_MANIFEST_NAME
+    }
+
+
+def test_copy_built_plugin_syncs_changes(built_plugin, tmp_path):
+    engine_path = tmp_path / "engine"
+    lib.copy_built_plugin(engine_path, built_plugin)
+
+    dll = built_plugin / "Binaries" / "Win64" / "Ayon.dll"
+    dll.write_bytes(b"v2")
+    os.utime(dll, (1, 1))
+    (built_plugin / "Ayon.uplugin").unlink()
+    lib.copy_built_plugin(engine_path, built_plugin)
+
+    assert _installed_files(engine_path) == {
+        "Binaries/Win64/Ayon.dll": b"v2"}
+
+
+def test_copy_built_plugin_rolls_back_failed_replace(
+    built_plugin, tmp_path, monkeypatch
+):
+    engine_path = tmp_path / "engine"
+    lib.copy_built_plugin(engine_path, built_plugin)
+    installed = _installed_files(engine_path)
+
+    (built_plugin / "Ayon.uplugin").write_text('{"VersionName": "2.0"}')
+    dll = built_plugin / "Binaries" / "Win64" / "Ayon.dll"
+    dll.write_bytes(b"v2")
+    os.utime(dll, (1, 1))
+    (built_plugin / "Binaries" / "Win64" / "New.dll").write_bytes(b"new")
+
+    replace = os.replace
+
+    def locked_replace(src, dst):
+        if str(src).endswith("Ayon.dll.ayon_tmp"):
+            raise PermissionError("File is locked")
+        replace(src, dst)
+
+    monkeypatch.setattr(lib.os, "replace", locked_replace)
+    with pytest.raises(PermissionError):
+        lib.copy_built_plugin(engine_path, built_plugin)
+    monkeypatch.setattr(lib.os, "replace", replace)
+
+    assert _installed_files(engine_path) == installed
+
+    lib.copy_built_plugin(engine_path, built_plugin)
+    assert _installed_files(engine_path) == {
+        "Ayon.uplugin": b'{"VersionName": "2.0"}',
+        "Binaries/Win64/Ayon.dll": b"v2",
+        "Binaries/Win64/New.dll": b"new",
+    }
+
+
+def test_file_lock_is_exclusive(tmp_path):
+    lock_path = tmp_path / "locks" / "project.lock"
+
+    with lib.file_lock(lock_path) as held:
+        assert held == lock_path
+        assert lock_path.is_file()
+        with pytest.raises(TimeoutError):
+            with lib.file_lock(lock_path, timeout=0):
+                pass
+
+    assert not lock_path.exists()
+    with lib.file_lock(lock_path, timeout=0):
+        pass
+
+
+def test_file_lock_removes_stale_lock(tmp_path):
+    lock_path = tmp_path / "project.lock"
+    lock_path.write_text("crashed:1")
+    os.utime(lock_path, (time.time() - 120, time.time() - 120))
+
+    with lib.file_lock(lock_path, timeout=0, stale_after=60):
+        assert lock_path.read_text() != "crashed:1"
+    assert not lock_path.exists()
+
+
+def test_remove_stale_lock_keeps_fresh_lock(tmp_path):
+    # Lock was replaced by a fresh one after the waiter found it stale
+    lock_path = tmp_path / "project.lock"
+    lock_path.write_text("host:2")
+
+    lib._remove_stale_lock(lock_path, stale_after=60)
+
+    assert lock_path.read_text() == "host:2"
+    assert [path.name for path in tmp_path.iterdir()] == ["project.lock"]
+
+
+def test_remove_stale_lock(tmp_path):
+    lock_path = tmp_path / "project.lock"
+    lock_path.write_text("crashed:1")
+    os.utime(lock_path, (time.time() - 120, time.time() - 120))
+
+    lib._remove_stale_lock(lock_path, stale_after=60)
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_file_lock_refreshes_held_lock(tmp_path):
+    lock_path = tmp_path / "project.lock"
+
+    with lib.file_lock(lock_path, refresh_interval=0.01):
+        old = time.time() - 120
+        os.utime(lock_path, (old, old))
+        deadline = time.time() + 5
+        while lock_path.stat().st_mtime == old and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert lock_path.stat().st_mtime > old
+        # Refreshed lock is not stale for other launches
+        with pytest.raises(TimeoutError):
+            with lib.file_lock(lock_path, timeout=0, stale_after=60):
+                pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    fake_time = types.SimpleNamespace(
+        time=lambda: now[0],
+        strftime=time.strftime,
+        localtime=time.localtime,
+    )
+    monkeypatch.setattr(lib, "time", fake_time)
+    return now
+
+
+def test_launch_timings_phases(clock):
+    timings = lib.LaunchTimings({"ue_version": "5.3"})
+
+    with timings.phase("plugin_copy"):
+        clock[0] += 1.25
+    with pytest.raises(RuntimeError):
+        with timings.phase("project_generation"):
+            clock[0] += 2.0
+            raise RuntimeError("Generation failed")
+    timings.add("project_commandlet", 0.12345)
+
+    data = timings.to_data()
+    assert data["context"] == {"ue_version": "5.3"}
+    assert data["started"] == 1000.0
+    assert data["duration"] == 3.25
+    assert data["phases"] == [
+        {"name": "plugin_copy", "duration": 1.25},
+        {"name": "project_generation", "duration": 2.0},
+        {"name": "project_commandlet", "duration": 0.123},
+    ]
+
+
+@pytest.fixture
+def ddc_project(tmp_path, monkeypatch):
+    monkeypatch.setattr(lib, "get_engine_info", lambda *args: {
+        "editor": "UnrealEditor", "build_id": "{abc}"})
+    project_dir = tmp_path / "Shot010"
+    (project_dir / "Content").mkdir(parents=True)
+    (project_dir / "Content" / "Mesh.uasset").write_bytes(b"mesh")
+    project_file = project_dir / "Shot010.uproject"
+    project_file.write_text("{}")
+    return project_file
+
+
+def test_project_content_hash_ignores_saved_assets(ddc_project):
+    project_dir = ddc_project.parent
+    content_hash = lib.get_project_content_hash(
+        project_dir, project_dir, "5.3")
+
+    (project_dir / "Content" / "Mesh.uasset").write_bytes(b"saved mesh")
+    assert lib.get_project_content_hash(
+        project_dir, project_dir, "5.3") == content_hash
+
+    (project_dir / "Content" / "Rig.uasset").write_bytes(b"rig")
+    assert lib.get_project_content_hash(
+        project_dir, project_dir, "5.3") != content_hash
+
+
+def test_fill_ddc(ddc_project, monkeypatch):
+    project_dir = ddc_project.parent
+    call = mock.Mock(return_value=1)
+    monkeypatch.setattr(lib.subprocess, "call", call)
+    assert not lib.fill_ddc(ddc_project.parent, "5.3", ddc_project, "a1")
+    assert lib.get_ddc_prewarm_state(project_dir) == {}
+
+    call.return_value = 0
+    assert lib.fill_ddc(
+        ddc_project.parent, "5.3", ddc_project, "a1", "/mnt/ddc")
+    assert lib.get_ddc_prewarm_state(project_dir)["content_hash"] == "a1"
+    assert call.call_args[0][0][-1] == "-SharedDataCachePath=/mnt/ddc"
+    assert not (project_dir / "Saved" / "Ayon" / "ddc_prewarm.lock").exists()
+
+
+def test_fill_ddc_already_running(ddc_project, monkeypatch):
+    call = mock.Mock(return_value=0)
+    monkeypatch.setattr(lib.subprocess, "call", call)
+    lock_path = ddc_project.parent / "Saved" / "Ayon" / "ddc_prewarm.lock"
+    with lib.file_lock(lock_path):
+        assert not lib.fill_ddc(
+            ddc_project.parent, "5.3", ddc_project, "a1")
+    call.assert_not_called()
+
+
+def test_launch_timings_write(clock, cache_dir):
+    timings = lib.LaunchTimings({"project_name": "Shot010"})
+    timings.add("workfile_template", 0.5)
+    clock[0] += 1.0
+
+    log_path = timings.write()
+
+    assert log_path.parent == cache_dir / "launch_logs"
+    with open(log_path, "r") as f:
+        data = json.load(f)
+    assert data["context"] == {"project_name": "Shot010"}
+    assert data["duration"] == 1.0
+    assert data["phases"] == [{"name": "workfile_template", "duration": 0.5}]
+
+
+@pytest.fixture
+def integration_root(tmp_path, cache_dir, monkeypatch):
+    monkeypatch.setattr(lib, "_engine_cache", None)
+    root = tmp_path / "integration"
+    (root / "UE_4.27" / "Ayon").mkdir(parents=True)
+    (root / "UE_5.3" / "Ayon").mkdir(parents=True)
+    return root
+
+
+def test_get_integration_plugin_path(integration_root):
+    assert lib.get_integration_plugin_path("5.3", integration_root) == (
+        integration_root / "UE_5.3" / "Ayon")
+    # Closest compatible version
+    assert lib.get_integration_plugin_path("5.4", integration_root) == (
+        integration_root / "UE_5.3" / "Ayon")
+
+
+def test_integration_dirs_cached_until_root_changes(
+    integration_root, monkeypatch
+):
+    assert lib._get_integration_version_dir("5.4", integration_root) == (
+        integration_root / "UE_5.3")
+
+    iterdir = mock.Mock(side_effect=AssertionError("Listed again"))
+    with mock.patch.object(lib.Path, "iterdir", iterdir):
+        assert lib._get_integration_version_dir(
+            "5.4", integration_root) == integration_root / "UE_5.3"
+
+    (integration_root / "UE_5.4").mkdir()
+    os.utime(integration_root, (time.time() + 10, time.time() + 10))
+    assert lib._get_integration_version_dir("5.4", integration_root) == (
+        integration_root / "UE_5.4")
+
+
+def _write_modules(engine_path, build_id, mtime):
+    modules = lib._get_modules_path(engine_path, "5.3")
+    modules.parent.mkdir(parents=True, exist_ok=True)
+    modules.write_text(json.dumps({"BuildId": build_id}))
+    os.utime(modules, (mtime, mtime))
+
+
+def test_engine_info_cached_until_engine_changes(
+    tmp_path, cache_dir, monkeypatch
+):
+    monkeypatch.setattr(lib, "_engine_cache", None)
+    engine_path = tmp_path / "UE_5.3"
+    _write_modules(engine_path, "abc", time.time())
+
+    info = lib.get_engine_info(engine_path, "5.3")
+    assert info["path"] == engine_path.as_posix()
+    assert info["build_id"] == "{abc}"
+    assert info["editor"] == lib.get_editor_exe_path(
+        engine_path, "5.3").as_posix()
+    assert info["uat"] == lib.get_path_to_uat(engine_path).as_posix()
+
+    # Record is loaded from disk in a new session
+    monkeypatch.setattr(lib, "_engine_cache", None)
+    build_id = mock.Mock(side_effect=AssertionError("Detected again"))
+    with mock.patch.object(lib, "get_build_id", build_id):
+        assert lib.get_engine_info(engine_path, "5.3") == info
+
+    _write_modules(engine_path, "def", time.time() + 10)
+    assert lib.get_engine_info(engine_path, "5.3")["build_id"] == "{def}"
+
+
+def test_cache_plugin_build_is_best_effort(tmp_path, monkeypatch):
+    cache_file = tmp_path / "not_a_dir"
+    cache_file.write_text("")
+    monkeypatch.setenv("AYON_UNREAL_CACHE_DIR", str(cache_file))
+
+    assert lib.cache_plugin_build(
+        tmp_path / "build", tmp_path / "Config", "key") is None
+
+
+def test_cache_plugin_build(built_plugin, cache_dir, tmp_path):
+    config_dir = tmp_path / "Config"
+    config_dir.mkdir()
+    (config_dir / "FilterPlugin.ini").write_text("[FilterPlugin]")
+
+    cached_dir = lib.cache_plugin_build(built_plugin, config_dir, "key")
+
+    assert cached_dir == cache_dir / "plugin_builds" / "key"
+    assert (cached_dir / "Config" / "FilterPlugin.ini").is_file()
+    assert (cached_dir / "Binaries" / "Win64" / "Ayon.dll").is_file()
+
+
+def test_copy_built_plugin_rolls_back_failed_removal(
+    built_plugin, tmp_path, monkeypatch
+):
+    engine_path = tmp_path / "engine"
+    (built_plugin / "Binaries" / "Win64" / "Old.dll").write_bytes(b"old")
+    lib.copy_built_plugin(engine_path, built_plugin)
+    installed = _installed_files(engine_path)
+
+    (built_plugin / "Binaries" / "Win64" / "Old.dll").unlink()
+    (built_plugin / "Ayon.uplugin").write_text('{"VersionName": "2.0"}')
+
+    replace = os.replace
+
+    def locked_replace(src, dst):
+        if str(src).endswith("Ayon.uplugin.ayon_tmp"):
+            raise PermissionError("File is locked")
+        replace(src, dst)
+
+    monkeypatch.setattr(lib.os, "replace", locked_replace)
+    with pytest.raises(PermissionError):
+        lib.copy_built_plugin(engine_path, built_plugin)
+    monkeypatch.setattr(lib.os, "replace", replace)
+
+    assert _installed_files(engine_path) == installed
+
+    lib.copy_built_plugin(engine_path, built_plugin)
+    assert "Binaries/Win64/Old.dll" not in _installed_files(engine_path)
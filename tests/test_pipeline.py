@@ -0,0 +1,52 @@
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_unreal.api import pipeline  # noqa: E402
+
+
+def test_get_members_hash_ignores_order_and_duplicates():
+    members = ["/Game/A/Mesh.Mesh", "/Game/B/Tex.Tex"]
+
+    assert pipeline.get_members_hash(members) == pipeline.get_members_hash(
+        list(reversed(members)) + members[:1])
+
+
+def test_get_members_hash_changes_with_members():
+    members = ["/Game/A/Mesh.Mesh", "/Game/B/Tex.Tex"]
+
+    assert pipeline.get_members_hash(members) != pipeline.get_members_hash(
+        members[:1])
+    assert pipeline.get_members_hash([]) != pipeline.get_members_hash(
+        members)
+
+
+def _asset_data(package_name, asset_name):
+    return mock.Mock(package_name=package_name, asset_name=asset_name)
+
+
+def test_get_assets_by_object_paths_queries_packages_once():
+    mesh = _asset_data("/Game/A/Mesh", "Mesh")
+    other = _asset_data("/Game/A/Mesh", "Other")
+    registry = mock.Mock()
+    registry.get_assets.return_value = [mesh, other]
+
+    with mock.patch.object(pipeline, "unreal") as unreal:
+        unreal.AssetRegistryHelpers.get_asset_registry.return_value = (
+            registry)
+        result = pipeline.get_assets_by_object_paths(
+            ["/Game/A/Mesh.Mesh", "/Game/B/Missing.Missing"])
+
+    assert result == {"/Game/A/Mesh.Mesh": mesh}
+    registry.get_assets.assert_called_once()
+    unreal.ARFilter.assert_called_once_with(
+        package_names=["/Game/A/Mesh", "/Game/B/Missing"])
+
+
+def test_get_assets_by_object_paths_without_paths():
+    with mock.patch.object(pipeline, "unreal") as unreal:
+        assert pipeline.get_assets_by_object_paths([]) == {}
+
+    unreal.AssetRegistryHelpers.get_asset_registry.assert_not_called()
@@ -0,0 +1,157 @@
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_unreal.api import rendering  # noqa: E402
+
+
+@pytest.mark.parametrize("frame_start, frame_end, chunk_size, expected", [
+    (1001, 1011, 4, [(1001, 1005), (1005, 1009), (1009, 1011)]),
+    (1001, 1011, 10, [(1001, 1011)]),
+    (1001, 1011, 20, [(1001, 1011)]),
+    (1, 4, 1, [(1, 2), (2, 3), (3, 4)]),
+    (1001, 1011, 0, [(1001, 1011)]),
+    (1001, 1011, None, [(1001, 1011)]),
+    (1001, 1011, -5, [(1001, 1011)]),
+    ("1001", "1003", 1, [(1001, 1002), (1002, 1003)]),
+])
+def test_split_frame_range(frame_start, frame_end, chunk_size, expected):
+    assert rendering.split_frame_range(
+        frame_start, frame_end, chunk_size) == expected
+
+
+def test_split_frame_range_covers_range():
+    chunks = rendering.split_frame_range(-10, 97, 7)
+    frames = [
+        frame for start, end in chunks for frame in range(start, end)]
+    assert frames == list(range(-10, 97))
+
+
+def test_get_rendered_frame_mtimes(tmp_path):
+    for frame in (1000, 1001, 1002, 1005):
+        (tmp_path / f"sh010.{frame}.png").write_bytes(b"data")
+    (tmp_path / "sh020.1001.png").write_bytes(b"data")
+    (tmp_path / "sh010.1001.exr").write_bytes(b"data")
+
+    mtimes = rendering.get_rendered_frame_mtimes(
+        tmp_path.as_posix(), "sh010", "png", (1001, 1005))
+    assert len(mtimes) == 2
+
+    assert rendering.get_rendered_frame_mtimes(
+        tmp_path.as_posix(), "sh010", "png", (1001, 1005),
+        since=max(mtimes) + 10) == []
+    assert rendering.get_rendered_frame_mtimes(
+        (tmp_path / "missing").as_posix(), "sh010", "png", (1, 2)) == []
+
+
+@pytest.mark.parametrize("existing_frames, expected", [
+    ({3, 4, 7}, [(1, 3), (5, 7), (8, 10)]),
+    (set(), [(1, 10)]),
+    (set(range(1, 10)), []),
+    ({1, 9}, [(2, 9)]),
+    ({0, 10, 11}, [(1, 10)]),
+])
+def test_get_missing_frame_ranges(existing_frames, expected):
+    assert rendering.get_missing_frame_ranges(
+        1, 10, existing_frames) == expected
+
+
+def test_get_resume_render_chunks(tmp_path):
+    for frame in (1001, 1002, 1005):
+        (tmp_path / "out" / f"sh010.{frame}.png").parent.mkdir(
+            exist_ok=True)
+        (tmp_path / "out" / f"sh010.{frame}.png").write_bytes(
+            b"\x89PNG\r\n\x1a\n")
+    # Empty file is not valid frame and is rendered again
+    (tmp_path / "out" / "sh010.1003.png").write_bytes(b"")
+
+    sequence = mock.MagicMock()
+    sequence.get_name.return_value = "sh010"
+    render_setting = {"sequence": sequence, "output": "out"}
+    report = {"frames_total": 0, "frames_skipped": 0, "jobs": []}
+
+    chunks = rendering._get_resume_render_chunks(
+        [(render_setting, (1001, 1004)), (render_setting, (1004, 1007))],
+        tmp_path.as_posix(), "png", {}, report)
+
+    assert [frame_range for _, frame_range in chunks] == [
+        (1003, 1004), (1004, 1005), (1006, 1007)]
+    assert report["frames_total"] == 6
+    assert report["frames_skipped"] == 3
+
+
+def _touch_frames(directory, names, content=b"\x89PNG\r\n\x1a\n"):
+    for name in names:
+        (directory / name).write_bytes(content)
+
+
+def test_get_frame_index(tmp_path):
+    _touch_frames(tmp_path, [
+        "sh010.1002.png",
+        "sh010.1001.png",
+        "sh010.1010.png",
+        "sh010.1001.exr",
+        "sh020.1001.png",
+        "sh010_v001.1001.png",
+    ])
+    (tmp_path / "sh010.1003.png").mkdir()
+
+    frame_index = rendering.get_frame_index(
+        tmp_path.as_posix(), "sh010", "png")
+
+    assert frame_index == {
+        "files": ["sh010.1001.png", "sh010.1002.png", "sh010.1010.png"],
+        "frames": [1001, 1002, 1010],
+        "padding": 4,
+        "pattern": "sh010.%04d.png",
+        "ext": "png",
+    }
+
+
+def test_get_frame_index_jpg_extensions(tmp_path):
+    _touch_frames(tmp_path, ["sh010.0001.jpeg", "sh010.0002.JPEG"])
+
+    frame_index = rendering.get_frame_index(
+        tmp_path.as_posix(), "sh010", "jpg")
+
+    assert frame_index["frames"] == [1, 2]
+    assert frame_index["padding"] == 4
+    assert frame_index["ext"] == "jpeg"
+
+
+def test_get_frame_index_mixed_padding(tmp_path):
+    _touch_frames(tmp_path, ["sh010.0998.png", "sh010.01000.png"])
+
+    frame_index = rendering.get_frame_index(
+        tmp_path.as_posix(), "sh010", "png")
+
+    assert frame_index["padding"] is None
+    assert frame_index["pattern"] == "sh010.%01d.png"
+
+
+def test_get_frame_index_negative_frames(tmp_path):
+    _touch_frames(tmp_path, ["sh010.-001.png", "sh010.000.png"])
+
+    frame_index = rendering.get_frame_index(
+        tmp_path.as_posix(), "sh010", "png")
+
+    assert frame_index["frames"] == [-1, 0]
+    assert frame_index["padding"] == 3
+
+
+def test_get_frame_index_no_frames(tmp_path):
+    assert rendering.get_frame_index(
+        tmp_path.as_posix(), "sh010", "png") is None
+    assert rendering.get_frame_index(
+        (tmp_path / "missing").as_posix(), "sh010", "png") is None
+
+
+def test_get_valid_rendered_frames(tmp_path):
+    _touch_frames(tmp_path, ["sh010.1001.png", "sh010.1002.png"])
+    _touch_frames(tmp_path, ["sh010.1003.png"], content=b"")
+    _touch_frames(tmp_path, ["sh010.1004.png"], content=b"truncated")
+
+    assert rendering.get_valid_rendered_frames(
+        tmp_path.as_posix(), "sh010", "png") == {1001, 1002}
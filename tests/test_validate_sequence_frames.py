@@ -0,0 +1,131 @@
+import importlib.util
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("ayon_core")
+pytest.importorskip("pyblish")
+
+from ayon_core.pipeline.publish import PublishValidationError  # noqa: E402
+
+from conftest import CLIENT_DIR  # noqa: E402
+
+
+def _import_plugin_module():
+    path = (
+        CLIENT_DIR / "ayon_unreal" / "plugins" / "publish"
+        / "validate_sequence_frames.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "validate_sequence_frames", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+plugin_module = _import_plugin_module()
+
+
+@pytest.fixture(params=["numpy", "python"])
+def validator(request, monkeypatch):
+    if request.param == "numpy":
+        if plugin_module.np is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(plugin_module, "np", None)
+    monkeypatch.setattr(
+        plugin_module.ValidateSequenceFrames, "is_active",
+        lambda self, data: True, raising=False)
+    plugin = plugin_module.ValidateSequenceFrames()
+    plugin.log = mock.MagicMock()
+    return plugin
+
+
+def _instance(files, clip_in=1001, clip_out=1003, slate=False,
+              frame_index=None):
+    representation = {"files": files}
+    if frame_index:
+        representation["frameIndex"] = frame_index
+    instance = mock.MagicMock()
+    instance.data = {
+        "representations": [representation],
+        "folderEntity": {
+            "attrib": {"clipIn": clip_in, "clipOut": clip_out}},
+        "slate": slate,
+    }
+    return instance
+
+
+@pytest.mark.parametrize("frame_ranges, expected", [
+    ([], ""),
+    ([(1001, 1001)], "1001"),
+    ([(1001, 1010), (1500, 1500)], "1001-1010, 1500"),
+    ([(-5, -1), (3, 4)], "-5--1, 3-4"),
+])
+def test_format_frame_ranges(frame_ranges, expected):
+    assert plugin_module.format_frame_ranges(frame_ranges) == expected
+
+
+@pytest.mark.parametrize("files, expected", [
+    (["sh.1002.exr", "sh.1001.exr"], ([1001, 1002], 4)),
+    (["sh.0998.exr", "sh.0999.exr", "sh.1000.exr"],
+     ([998, 999, 1000], 4)),
+    (["sh.998.exr", "sh.1000.exr"], ([998, 1000], 3)),
+    (["sh.-01.exr", "sh.00.exr"], ([-1, 0], 2)),
+    (["sh.0998.exr", "sh.01000.exr"], ([998, 1000], None)),
+])
+def test_parse_frames(validator, files, expected):
+    assert validator._parse_frames(files) == expected
+
+
+@pytest.mark.parametrize("files, message", [
+    (["sh.1001.exr", "notes.txt"], "outside a sequence"),
+    (["sh.1001.exr", "other.1002.exr"], "Multiple collections"),
+    (["sh.1001.exr", "sh.1002.png"], "Multiple collections"),
+])
+def test_parse_frames_invalid(validator, files, message):
+    with pytest.raises(PublishValidationError, match=message):
+        validator._parse_frames(files)
+
+
+def test_valid_sequence(validator):
+    validator.process(_instance(
+        ["sh.1001.exr", "sh.1002.exr", "sh.1003.exr"]))
+
+
+def test_valid_sequence_from_frame_index(validator):
+    validator.process(_instance(
+        ["sh.1001.exr", "sh.1002.exr", "sh.1003.exr"],
+        frame_index={"frames": [1001, 1002, 1003], "padding": 4}))
+
+
+def test_missing_frames(validator):
+    files = ["sh.1001.exr", "sh.1004.exr", "sh.1005.exr", "sh.1007.exr"]
+    with pytest.raises(
+        PublishValidationError, match="Missing frames: 1002-1003, 1006"
+    ):
+        validator.process(_instance(files, clip_out=1007))
+
+
+def test_duplicate_frames(validator):
+    files = ["sh.1001.exr", "sh.1002.exr", "sh.1003.exr"]
+    with pytest.raises(PublishValidationError, match="Duplicate frames"):
+        validator.process(_instance(files, frame_index={
+            "frames": [1001, 1002, 1002, 1003], "padding": 4}))
+
+
+def test_invalid_frame_range(validator):
+    with pytest.raises(PublishValidationError, match="Invalid frame range"):
+        validator.process(_instance(
+            ["sh.1001.exr", "sh.1002.exr"], clip_out=1003))
+
+
+def test_slate_only(validator):
+    with pytest.raises(PublishValidationError, match="No frames"):
+        validator.process(_instance(["sh.1000.exr"], slate=True))
+
+
+def test_slate_is_skipped(validator):
+    validator.process(_instance(
+        ["sh.1000.exr", "sh.1001.exr", "sh.1002.exr", "sh.1003.exr"],
+        slate=True))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Benchmark asset class checks with and without loading the assets.
+
+Compares class check from asset registry data, as used by
+`ValidateModelContent` and `find_level_sequence`, with the previous
+approach which loaded every asset. It is not part of the tests, it needs
+Unreal editor with AYON environment set and a project with enough assets,
+e.g. 5000 static meshes::
+
+    UnrealEditor-Cmd <project>.uproject -unattended -nosplash
+        -ExecutePythonScript="<addon>/tools/benchmark_asset_class.py
+        /Game/Meshes 5000"
+
+Class check from asset data must run first, assets stay loaded after the
+loading check. Run it in a fresh editor session for meaningful numbers.
+"""
+import sys
+import time
+
+import unreal
+
+from ayon_unreal.api.pipeline import (
+    get_asset_class_name,
+    get_asset_data_snapshot,
+)
+
+
+def _get_object_paths(package_path, count):
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    assets = ar.get_assets_by_path(package_path, recursive=True)
+    return [
+        f"{asset.package_name}.{asset.asset_name}"
+        for asset in assets[:count]
+    ]
+
+
+def _benchmark(label, func, object_paths):
+    start = time.perf_counter()
+    classes = func(object_paths)
+    duration = time.perf_counter() - start
+    unreal.log(
+        f"{label}: {len(object_paths)} assets in {duration:.3f}s "
+        f"({duration / max(len(object_paths), 1) * 1000:.3f}ms per asset)")
+    return classes
+
+
+def _classes_from_asset_data(object_paths):
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    return [
+        get_asset_class_name(ar.get_asset_by_object_path(path))
+        for path in object_paths
+    ]
+
+
+def _classes_from_snapshot(object_paths):
+    snapshot = get_asset_data_snapshot(object_paths)
+    return [snapshot[path]["asset_class"] for path in object_paths]
+
+
+def _classes_from_loaded_assets(object_paths):
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    return [
+        ar.get_asset_by_object_path(path).get_asset().get_class().get_name()
+        for path in object_paths
+    ]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    package_path = argv[0] if argv else "/Game"
+    count = int(argv[1]) if len(argv) > 1 else 5000
+
+    object_paths = _get_object_paths(package_path, count)
+    if len(object_paths) < count:
+        unreal.log_warning(
+            f"Only {len(object_paths)} assets found in {package_path}.")
+
+    from_data = _benchmark(
+        "Asset data", _classes_from_asset_data, object_paths)
+    _benchmark("Asset data snapshot", _classes_from_snapshot, object_paths)
+    loaded = _benchmark(
+        "Loaded assets", _classes_from_loaded_assets, object_paths)
+
+    mismatches = [
+        path for path, data_class, loaded_class
+        in zip(object_paths, from_data, loaded)
+        if data_class != loaded_class
+    ]
+    if mismatches:
+        unreal.log_warning(
+            f"Class differs for {len(mismatches)} assets: {mismatches[:10]}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        unreal.SystemLibrary.quit_editor()